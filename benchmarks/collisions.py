@@ -0,0 +1,48 @@
+"""
+Time to find every overlapping pair of sprites: the usual pairwise loop using
+the RectangleShapeMixin sides, versus find_collisions.
+"""
+import random
+import timeit
+
+import ppb
+from ppb.features.collisions import ColliderMixin
+from ppb.features.collisions import find_collisions
+
+SPRITE_COUNTS = 500, 2_000, 10_000
+# Game units of world per sprite
+AREA_PER_SPRITE = 4
+
+
+class Box(ColliderMixin, ppb.Sprite):
+    pass
+
+
+def make_sprites(count):
+    side = (count * AREA_PER_SPRITE) ** 0.5
+    return [
+        Box(position=ppb.Vector(random.uniform(0, side), random.uniform(0, side)))
+        for _ in range(count)
+    ]
+
+
+def pairwise(sprites):
+    pairs = []
+    for i, a in enumerate(sprites):
+        for b in sprites[i + 1:]:
+            if a.left < b.right and b.left < a.right and a.bottom < b.top and b.bottom < a.top:
+                pairs.append((a, b))
+    return pairs
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    print(f"{'sprites':>8} {'pairwise':>14} {'sweep & prune':>14}")
+    for count in SPRITE_COUNTS:
+        sprites = make_sprites(count)
+        if count <= 2_000:
+            brute = f"{timeit.timeit(lambda: pairwise(sprites), number=1) * 1000:11.1f} ms"
+        else:
+            brute = "(skipped)"
+        swept = min(timeit.repeat(lambda: find_collisions(sprites), number=1, repeat=5))
+        print(f"{count:>8} {brute:>14} {swept * 1000:>11.1f} ms")
@@ -0,0 +1,55 @@
+"""
+Time to publish one Update to a scene of moving sprites: each sprite moving
+itself in on_update, versus columnar sprites moved by ColumnarIntegrator.
+
+Needs numpy.
+"""
+import timeit
+
+import ppb
+from ppb.events import Update
+from ppb.features.columnar import ColumnarIntegrator
+from ppb.features.columnar import SpriteStore
+
+SPRITE_COUNT = 20_000
+REPEAT = 20
+
+
+class Mover(ppb.Sprite):
+    velocity = ppb.Vector(1, 1)
+
+    def on_update(self, event, signal):
+        self.position += self.velocity * event.time_delta
+
+
+def sprites(scene):
+    for _ in range(SPRITE_COUNT):
+        scene.add(Mover())
+
+
+def columnar(scene):
+    store = scene.add(SpriteStore(capacity=SPRITE_COUNT))
+    for _ in range(SPRITE_COUNT):
+        scene.add(store.create(velocity=ppb.Vector(1, 1)))
+
+
+def publish_time(setup, systems=(), **engine_opts):
+    engine = ppb.GameEngine(ppb.Scene, basic_systems=systems, scene_kwargs={"set_up": setup}, **engine_opts)
+    engine.start_systems()
+    engine.start()
+    while engine.events:
+        engine.publish()
+
+    def publish():
+        engine.signal(Update(0.016))
+        engine.publish()
+
+    return min(timeit.repeat(publish, number=1, repeat=REPEAT))
+
+
+if __name__ == "__main__":
+    print(f"{SPRITE_COUNT} moving sprites")
+    print(f"{'on_update':>20}: {publish_time(sprites) * 1000:8.2f} ms")
+    print(f"{'on_update, indexed':>20}: {publish_time(sprites, indexed_dispatch=True) * 1000:8.2f} ms")
+    print(f"{'columnar':>20}: {publish_time(columnar, [ColumnarIntegrator]) * 1000:8.2f} ms")
+    print(f"{'columnar, indexed':>20}: {publish_time(columnar, [ColumnarIntegrator], indexed_dispatch=True) * 1000:8.2f} ms")
@@ -0,0 +1,55 @@
+"""
+Time to publish one broadcast Update to a scene full of sprites, where only
+a fraction of the sprites handle Update.
+"""
+import timeit
+
+import ppb
+from ppb.events import Update
+
+SPRITE_COUNT = 20_000
+LISTENER_FRACTION = 0.1
+REPEAT = 20
+
+
+class Listener(ppb.Sprite):
+    def on_update(self, event, signal):
+        pass
+
+
+def make_engine(**engine_opts):
+    def setup(scene):
+        listeners = int(SPRITE_COUNT * LISTENER_FRACTION)
+        for _ in range(listeners):
+            scene.add(Listener())
+        for _ in range(SPRITE_COUNT - listeners):
+            scene.add(ppb.Sprite())
+
+    engine = ppb.GameEngine(ppb.Scene, basic_systems=[], scene_kwargs={"set_up": setup}, **engine_opts)
+    engine.start()
+    while engine.events:
+        engine.publish()
+    return engine
+
+
+def publish_time(engine):
+    def publish():
+        engine.signal(Update(0.016))
+        engine.publish()
+
+    return min(timeit.repeat(publish, number=1, repeat=REPEAT))
+
+
+MODES = {
+    "default": {},
+    "indexed": {"indexed_dispatch": True},
+    "deferred": {"defer_mutations": True},
+    "indexed+deferred": {"indexed_dispatch": True, "defer_mutations": True},
+    "cached walk": {"cached_walk": True},
+}
+
+
+if __name__ == "__main__":
+    print(f"{SPRITE_COUNT} sprites, {LISTENER_FRACTION:.0%} handle Update")
+    for name, opts in MODES.items():
+        print(f"{name:>20}: {publish_time(make_engine(**opts)) * 1000:8.2f} ms")
@@ -0,0 +1,52 @@
+"""
+Main loop rate with Idle broadcast to the whole tree vs. only to systems.
+
+Each run spins the engine for a fixed amount of time in a scene full of
+sprites, none of which handle Idle.
+"""
+import ppb
+from ppb.assetlib import AssetLoadingSystem
+from ppb.events import Idle
+from ppb.events import Quit
+from ppb.systems import Updater
+from ppb.systemslib import System
+
+RUN_TIME = 1.0  # seconds
+SPRITE_COUNTS = 0, 1_000, 10_000
+
+
+class Timer(System):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.loops = 0
+        self.start = None
+
+    def on_idle(self, event: Idle, signal):
+        if self.start is None:
+            self.start = ppb.get_time()
+        self.loops += 1
+        if ppb.get_time() - self.start >= RUN_TIME:
+            signal(Quit())
+
+
+def loop_rate(sprite_count, broadcast_idle):
+    def setup(scene):
+        for _ in range(sprite_count):
+            scene.add(ppb.Sprite())
+
+    timer = Timer()
+    engine = ppb.GameEngine(
+        ppb.Scene, scene_kwargs={"set_up": setup},
+        basic_systems=(Updater, AssetLoadingSystem), systems=[timer],
+        broadcast_idle=broadcast_idle,
+    )
+    engine.run()
+    return timer.loops / RUN_TIME
+
+
+if __name__ == "__main__":
+    print(f"{'sprites':>8} {'broadcast':>14} {'systems only':>14}")
+    for count in SPRITE_COUNTS:
+        before = loop_rate(count, broadcast_idle=True)
+        after = loop_rate(count, broadcast_idle=False)
+        print(f"{count:>8} {before:>10.0f} l/s {after:>10.0f} l/s")
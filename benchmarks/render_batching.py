@@ -0,0 +1,60 @@
+"""
+Time to render one frame of many small sprites in view, drawing them one at
+a time or in geometry batches, with and without a texture atlas. Uses SDL's
+dummy video driver.
+"""
+import os
+import random
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import ppb
+from ppb.assetlib import AssetLoadingSystem
+from ppb.events import Render
+from ppb.systems import Renderer
+
+SPRITE_COUNT = 5_000
+REPEAT = 10
+
+
+def render_time(**renderer_opts):
+    random.seed(0)
+    images = [ppb.Square(200, 50, 50), ppb.Circle(50, 200, 50), ppb.Triangle(50, 50, 200)]
+
+    def setup(scene):
+        for _ in range(SPRITE_COUNT):
+            scene.add(ppb.Sprite(
+                position=ppb.Vector(random.uniform(-12, 12), random.uniform(-12, 12)),
+                rotation=random.uniform(0, 360),
+                image=random.choice(images),
+                size=0.25,
+            ))
+
+    engine = ppb.GameEngine(
+        ppb.Scene, basic_systems=[Renderer, AssetLoadingSystem], scene_kwargs={"set_up": setup},
+        resolution=(400, 400), **renderer_opts,
+    )
+    with engine:
+        engine.start()
+        while engine.events:
+            engine.publish()
+
+        def render():
+            engine.signal(Render())
+            engine.publish()
+
+        time = min(timeit.repeat(render, number=1, repeat=REPEAT))
+        renderer, = engine.get(kind=Renderer)
+        return time, renderer.stats
+
+
+if __name__ == "__main__":
+    print(f"{SPRITE_COUNT} rotated sprites using 3 images, all in view")
+    for name, opts in [
+        ("one at a time", {}),
+        ("batched", {"batch_geometry": True}),
+        ("batched, atlas", {"batch_geometry": True, "atlas": True}),
+    ]:
+        time, stats = render_time(**opts)
+        print(f"{name:>20}: {time * 1000:8.2f} ms  (drawn {stats.drawn}, batches {stats.batches})")
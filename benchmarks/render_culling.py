@@ -0,0 +1,70 @@
+"""
+Time to render one frame of a scrolling world where most sprites are out of
+view, with and without culling. Uses SDL's dummy video driver.
+"""
+import os
+import random
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import ppb
+from ppb.assetlib import AssetLoadingSystem
+from ppb.events import Render
+from ppb.features.spatial import SpatialHash
+from ppb.features.spatial import SpatialMixin
+from ppb.systems import Renderer
+
+SPRITE_COUNT = 10_000
+# The camera sees 25x25 units, about 10% of the world
+WORLD_SIZE = 80
+REPEAT = 10
+
+
+class SpatialSprite(SpatialMixin, ppb.Sprite):
+    """
+    Keeps the scene's spatial index up to date as it moves, so the renderer
+    can trust the index for it.
+    """
+
+
+def render_time(spatial_index=False, **renderer_opts):
+    random.seed(0)
+    image = ppb.Square(200, 50, 50)
+
+    sprite_class = SpatialSprite if spatial_index else ppb.Sprite
+
+    def setup(scene):
+        if spatial_index:
+            SpatialHash(cell_size=2).attach(scene)
+        for _ in range(SPRITE_COUNT):
+            position = ppb.Vector(random.uniform(-WORLD_SIZE / 2, WORLD_SIZE / 2), random.uniform(-WORLD_SIZE / 2, WORLD_SIZE / 2))
+            scene.add(sprite_class(position=position, image=image))
+
+    engine = ppb.GameEngine(
+        ppb.Scene, basic_systems=[Renderer, AssetLoadingSystem], scene_kwargs={"set_up": setup},
+        resolution=(400, 400), **renderer_opts,
+    )
+    with engine:
+        engine.start()
+        while engine.events:
+            engine.publish()
+
+        def render():
+            engine.signal(Render())
+            engine.publish()
+
+        time = min(timeit.repeat(render, number=1, repeat=REPEAT))
+        renderer, = engine.get(kind=Renderer)
+        return time, renderer.stats
+
+
+if __name__ == "__main__":
+    print(f"{SPRITE_COUNT} sprites, about 10% in view")
+    for name, opts in [
+        ("no culling", {"cull_offscreen": False}),
+        ("culling", {}),
+        ("culling, indexed", {"spatial_index": True}),
+    ]:
+        time, stats = render_time(**opts)
+        print(f"{name:>20}: {time * 1000:8.2f} ms  (drawn {stats.drawn}, culled {stats.culled})")
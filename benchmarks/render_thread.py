@@ -0,0 +1,57 @@
+"""
+Time the engine thread spends on each Render event, drawing on the engine
+thread or handing a draw list to a render thread. Uses the offscreen
+renderer.
+"""
+import random
+import timeit
+
+import ppb
+from ppb.assetlib import AssetLoadingSystem
+from ppb.events import Render
+from ppb.systems import OffscreenRenderer
+
+SPRITE_COUNT = 5_000
+REPEAT = 20
+
+
+def render_time(**renderer_opts):
+    random.seed(0)
+    image = ppb.Square(200, 50, 50)
+
+    def setup(scene):
+        for _ in range(SPRITE_COUNT):
+            scene.add(ppb.Sprite(
+                position=ppb.Vector(random.uniform(-12, 12), random.uniform(-12, 12)),
+                rotation=random.uniform(0, 360),
+                image=image,
+                size=0.25,
+            ))
+
+    engine = ppb.GameEngine(
+        ppb.Scene, basic_systems=[OffscreenRenderer, AssetLoadingSystem], scene_kwargs={"set_up": setup},
+        resolution=(400, 400), **renderer_opts,
+    )
+    with engine:
+        engine.start()
+        while engine.events:
+            engine.publish()
+
+        def render():
+            engine.signal(Render())
+            engine.publish()
+
+        time = min(timeit.repeat(render, number=1, repeat=REPEAT))
+        renderer, = engine.get(kind=OffscreenRenderer)
+        dropped = renderer.thread.dropped if renderer.thread is not None else 0
+        return time, dropped
+
+
+if __name__ == "__main__":
+    print(f"{SPRITE_COUNT} rotated sprites, all in view")
+    for name, opts in [
+        ("engine thread", {}),
+        ("render thread", {"render_thread": True}),
+    ]:
+        time, dropped = render_time(**opts)
+        print(f"{name:>20}: {time * 1000:8.2f} ms  (frames dropped {dropped})")
@@ -0,0 +1,28 @@
+"""
+Overhead of the SDL call wrappers, per call, on a trivial SDL function.
+"""
+import timeit
+
+from sdl2 import SDL_GetTicks
+
+from ppb.systems.sdl_utils import fast_sdl_call
+from ppb.systems.sdl_utils import is_negative
+from ppb.systems.sdl_utils import sdl_call
+
+NUMBER = 200_000
+
+
+def per_call(stmt):
+    return min(timeit.repeat(stmt, number=NUMBER, repeat=5)) / NUMBER
+
+
+if __name__ == "__main__":
+    raw = per_call(lambda: SDL_GetTicks())
+    for name, stmt in [
+        ("direct", lambda: SDL_GetTicks()),
+        ("sdl_call, lambda", lambda: sdl_call(SDL_GetTicks, _check_error=lambda rv: rv < 0)),
+        ("sdl_call, is_negative", lambda: sdl_call(SDL_GetTicks, _check_error=is_negative)),
+        ("fast_sdl_call", lambda: fast_sdl_call(SDL_GetTicks, _check_error=is_negative)),
+    ]:
+        time = per_call(stmt)
+        print(f"{name:>22}: {time * 1e9:7.0f} ns  (+{(time - raw) * 1e9:5.0f} ns)")
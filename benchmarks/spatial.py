@@ -0,0 +1,50 @@
+"""
+Time to find the sprites within a radius of a point: scanning every sprite in
+the scene, versus asking a SpatialHash.
+"""
+import random
+import timeit
+
+import ppb
+from ppb.features.spatial import SpatialHash
+
+SPRITE_COUNTS = 1_000, 10_000, 100_000
+RADIUS = 3
+# Game units of world per sprite
+AREA_PER_SPRITE = 4
+
+
+def make_scene(count):
+    side = (count * AREA_PER_SPRITE) ** 0.5
+    scene = ppb.Scene()
+    for _ in range(count):
+        scene.add(ppb.Sprite(position=ppb.Vector(random.uniform(0, side), random.uniform(0, side))))
+    return scene, side
+
+
+def brute_force(scene, center, radius):
+    result = []
+    for sprite in scene.get(kind=ppb.Sprite):
+        dx = center.x - min(max(center.x, sprite.left), sprite.right)
+        dy = center.y - min(max(center.y, sprite.bottom), sprite.top)
+        if dx * dx + dy * dy <= radius * radius:
+            result.append(sprite)
+    return result
+
+
+def per_query(func, side, number):
+    centers = [ppb.Vector(random.uniform(0, side), random.uniform(0, side)) for _ in range(number)]
+    it = iter(centers * 3)
+    return min(timeit.repeat(lambda: func(next(it)), number=number, repeat=3)) / number
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    print(f"{'sprites':>8} {'brute force':>14} {'spatial hash':>14} {'index build':>14}")
+    for count in SPRITE_COUNTS:
+        scene, side = make_scene(count)
+        build = timeit.timeit(lambda: SpatialHash(cell_size=2).attach(scene).detach(), number=1)
+        index = SpatialHash(cell_size=2).attach(scene)
+        brute = per_query(lambda c: brute_force(scene, c, RADIUS), side, max(1, 10_000 // count))
+        hashed = per_query(lambda c: index.query_radius(c, RADIUS), side, 1000)
+        print(f"{count:>8} {brute * 1000:>11.3f} ms {hashed * 1000:>11.3f} ms {build * 1000:>11.1f} ms")
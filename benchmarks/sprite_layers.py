@@ -0,0 +1,35 @@
+"""
+Time to get the render order of a scene with many sprites on a few layers,
+and to move one sprite to another layer.
+"""
+import random
+import timeit
+
+import ppb
+
+SPRITE_COUNT = 50_000
+LAYERS = 10
+REPEAT = 10
+
+
+def sorted_layers(scene):
+    # What Scene.sprite_layers() used to do
+    return sorted(scene, key=lambda s: getattr(s, "layer", 0))
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    scene = ppb.Scene()
+    sprites = [scene.add(ppb.Sprite(layer=random.randrange(LAYERS))) for _ in range(SPRITE_COUNT)]
+
+    def move():
+        random.choice(sprites).layer = random.randrange(LAYERS)
+
+    print(f"{SPRITE_COUNT} sprites on {LAYERS} layers")
+    for name, func in [
+        ("sorted()", lambda: sorted_layers(scene)),
+        ("sprite_layers()", scene.sprite_layers),
+        ("change a layer", move),
+    ]:
+        time = min(timeit.repeat(func, number=1, repeat=REPEAT))
+        print(f"{name:>20}: {time * 1000:8.3f} ms")
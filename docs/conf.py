@@ -195,5 +195,5 @@ todo_include_todos = True
 
 
 # -- autodoc configuration
-autodoc_mock_imports = ['sdl2']
+autodoc_mock_imports = ['sdl2', 'numpy']
 autoclass_content = 'both'
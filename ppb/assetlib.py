@@ -13,6 +13,7 @@ import weakref
 import ppb.vfs as vfs
 import ppb.events as events
 from ppb.systemslib import System
+from ppb.utils import get_time
 
 __all__ = (
     'AssetLoadingSystem',
@@ -110,6 +111,9 @@ class DelayedThreadExecutor(concurrent.futures.ThreadPoolExecutor):
                 total_queued=self._started - self._finished,
             ))
 
+    def has_queued_events(self):
+        return not self._event_queue.empty()
+
     def queued_events(self):
         while True:
             try:
@@ -336,6 +340,14 @@ class AssetLoadingSystem(System):
         _asset_cache.clear()
         _executor = DelayedThreadExecutor()
 
+    def next_deadline(self):
+        """
+        Now, if there are asset events waiting to be delivered.
+        """
+        if _executor.has_queued_events():
+            return get_time()
+        return None
+
     def on_idle(self, event, signal):
         for event in _executor.queued_events():
             signal(event)
@@ -0,0 +1,185 @@
+"""
+Running many headless games at once, for parameter sweeps, AI tuning, balance
+testing, and the like.
+
+:func:`run_batch` runs a :class:`~ppb.headless.HeadlessEngine` for every
+combination of scene factory and seed, spread across a pool of processes, and
+produces a :class:`RunResult` for each as it finishes: ::
+
+   def make_scene(seed):
+       return ArenaScene(enemy_count=10 + seed % 5)
+
+   def player_won(engine):
+       return engine.current_scene.winner is not None
+
+   def score(engine):
+       return engine.current_scene.score
+
+   for result in run_batch(make_scene, range(1000), stop=player_won,
+                           result=score, max_time=600):
+       print(result.seed, result.value)
+
+Scene factories, stop conditions, and result functions are sent to other
+processes, so they must be picklable (eg, defined at the top level of a
+module). The same goes for seeds and result values.
+"""
+import concurrent.futures
+from dataclasses import dataclass
+from itertools import product
+import random
+import sys
+import time
+import traceback
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import Union
+
+from ppb.engine import GameEngine
+from ppb.events import Idle
+from ppb.events import Quit
+from ppb.headless import HeadlessEngine
+from ppb.scenes import Scene
+from ppb.systemslib import System
+
+__all__ = 'RunResult', 'StopCondition', 'run_batch',
+
+
+SceneFactory = Callable[[Any], Scene]
+
+
+@dataclass
+class RunResult:
+    """
+    The outcome of a single run.
+    """
+    #: The name of the scene factory used.
+    factory: str
+    #: The seed passed to the scene factory and :func:`random.seed`.
+    seed: Any
+    #: The number of loops run.
+    steps: int
+    #: Game seconds simulated.
+    elapsed: float
+    #: Real seconds taken.
+    wall_time: float
+    #: The return value of the result function, if one was given.
+    value: Any = None
+    #: The formatted traceback, if the run raised an exception.
+    error: str = None
+
+
+class StopCondition(System):
+    """
+    Quits once ``stop(engine)`` returns true. Checked every loop.
+    """
+    def __init__(self, *, engine: GameEngine, stop: Callable[[GameEngine], bool], **kwargs):
+        super().__init__(**kwargs)
+        self.engine = engine
+        self.stop = stop
+
+    def on_idle(self, idle_event: Idle, signal):
+        if self.stop(self.engine):
+            signal(Quit())
+
+
+def _run_one(scene_factory, seed, stop, result, engine_opts) -> RunResult:
+    name = getattr(scene_factory, '__qualname__', repr(scene_factory))
+    start = time.perf_counter()
+    engine = None
+    try:
+        random.seed(seed)
+        systems = tuple(engine_opts.pop('systems', ()))
+        if stop is not None:
+            systems += (StopCondition,)
+        engine = HeadlessEngine(
+            scene_factory(seed), systems=systems, stop=stop, **engine_opts
+        )
+        with engine:
+            engine.run()
+            value = result(engine) if result is not None else None
+    except Exception:
+        # The engine may not have been made
+        steps = engine.steps if engine is not None else 0
+        elapsed = engine.elapsed if engine is not None else 0.0
+        return RunResult(
+            name, seed, steps, elapsed,
+            time.perf_counter() - start, error=traceback.format_exc(),
+        )
+    return RunResult(
+        name, seed, engine.steps, engine.elapsed,
+        time.perf_counter() - start, value=value,
+    )
+
+
+def _run_here(jobs, stop, result, engine_opts) -> Iterator[RunResult]:
+    for scene_factory, seed in jobs:
+        # Each run seeds the random module; leave it as the caller had it
+        state = random.getstate()
+        try:
+            run = _run_one(scene_factory, seed, stop, result, dict(engine_opts))
+        finally:
+            random.setstate(state)
+        yield run
+
+
+def _run_in_pool(jobs, stop, result, processes, engine_opts) -> Iterator[RunResult]:
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=processes)
+    futures = []
+    try:
+        for scene_factory, seed in jobs:
+            futures.append(executor.submit(_run_one, scene_factory, seed, stop, result, dict(engine_opts)))
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
+    finally:
+        # If the caller stopped early or something failed, don't start the
+        # runs still waiting; only wait for the ones already running.
+        if sys.version_info >= (3, 9):
+            executor.shutdown(wait=True, cancel_futures=True)
+        else:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+
+def run_batch(scene_factories: Union[SceneFactory, Iterable[SceneFactory]],
+              seeds: Iterable[Any], *,
+              stop: Callable[[GameEngine], bool] = None,
+              result: Callable[[GameEngine], Any] = None,
+              max_time: float = None,
+              processes: int = None,
+              **engine_opts) -> Iterator[RunResult]:
+    """
+    Run a headless engine for every pair of scene factory and seed.
+
+    Results are produced in the order the runs finish, not the order they
+    were given. Closing the iterator early (or an error while iterating)
+    cancels the runs that haven't started yet.
+
+    :param scene_factories: A callable, or several, taking a seed and
+       returning the :class:`~ppb.Scene` to run.
+    :param seeds: The seeds to run each scene factory with. Each run also
+       calls :func:`random.seed` with its seed.
+    :param stop: Called with the engine every loop, the run ends when it
+       returns true.
+    :param result: Called with the engine at the end of the run. Its return
+       value is reported as :attr:`RunResult.value`.
+    :param max_time: End each run after this many game seconds.
+    :param processes: How many worker processes to use. Defaults to one per
+       CPU. Pass ``0`` to run everything in this process, which is useful for
+       debugging; the state of :mod:`random` is restored after each run.
+    :param engine_opts: Additional keyword arguments passed to the
+       :class:`~ppb.headless.HeadlessEngine`, such as ``time_step`` or
+       ``systems``.
+    :return: An iterator of :class:`RunResult`.
+    """
+    if stop is None and max_time is None:
+        raise TypeError("run_batch() needs a stop condition or max_time, otherwise runs may never end.")
+    if callable(scene_factories):
+        scene_factories = [scene_factories]
+    engine_opts['max_time'] = max_time
+    jobs = product(scene_factories, seeds)
+    if processes == 0:
+        return _run_here(jobs, stop, result, engine_opts)
+    return _run_in_pool(jobs, stop, result, processes, engine_opts)
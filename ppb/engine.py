@@ -7,6 +7,7 @@ import time
 from collections import defaultdict
 from collections import deque
 from contextlib import ExitStack
+from contextlib import nullcontext
 from itertools import chain
 from typing import Any
 from typing import Callable
@@ -23,8 +24,13 @@ import ppb
 import ppb.systemslib
 from ppb import events
 from ppb.assetlib import AssetLoadingSystem
+from ppb import gomlib
 from ppb.gomlib import Children, GameObject
+from ppb.gomlib import MutationBuffer
 from ppb.gomlib import walk
+from ppb.gomlib import walk_subscribers
+from ppb.gomlib import _handler_names
+from ppb.gomlib import _handler_table
 from ppb.errors import BadChildException
 from ppb.errors import NotMyChildError
 from ppb.errors import BadEventHandlerException
@@ -33,6 +39,7 @@ from ppb.systems import EventPoller
 from ppb.systems import Renderer
 from ppb.systems import SoundController
 from ppb.systems import Updater
+from ppb.systems.clocks import FramePacer
 from ppb.utils import LoggingMixin
 from ppb.utils import camel_to_snake
 from ppb.utils import get_time
@@ -136,14 +143,20 @@ class EngineChildren(Children):
         elif isinstance(child, ppb.systemslib.System):
             if self.entered:
                 raise RuntimeError("Systems cannot be added while the engine is running")
+        if gomlib._local.buffer is not None:
+            gomlib._local.buffer.defer(self.add, child, tuple(tags))
+            return child
+
+        gomlib._tree_version += 1
+        if isinstance(child, ppb.systemslib.System):
             self._systems.add(child)
         else:
             self._all.add(child)
+            self._index_handlers(child)
 
-        for kind in type(child).mro():
-            self._kinds[kind].add(child)
-        for tag in tags:
-            self._tags[tag].add(child)
+        self._index_kinds(child)
+        self._index_tags(child, tags)
+        self._update_queries(child)
 
         return child
 
@@ -165,6 +178,11 @@ class EngineChildren(Children):
         elif isinstance(child, ppb.systemslib.System):
             if self.entered:
                 raise RuntimeError("Systems cannot be removed while the engine is running")
+        if gomlib._local.buffer is not None:
+            gomlib._local.buffer.defer(self.remove, child)
+            return child
+
+        if isinstance(child, ppb.systemslib.System):
             try:
                 self._systems.remove(child)
             except KeyError as exc:
@@ -174,14 +192,89 @@ class EngineChildren(Children):
                 self._all.remove(child)
             except KeyError as exc:
                 raise NotMyChildError() from exc
+            self._unindex_handlers(child)
+        gomlib._tree_version += 1
 
-        for kind in type(child).mro():
-            self._kinds[kind].remove(child)
-        for s in self._tags.values():
-            s.discard(child)
+        self._unindex_kinds(child)
+        self._unindex_tags(child)
+        self._remove_from_queries(child)
 
         return child
 
+    def add_many(self, children: Iterable[GameObject], tags: Iterable[Hashable] = ()) -> List[GameObject]:
+        """
+        Add several children at once, all with the same tags.
+
+        See :meth:`Children.add_many <ppb.gomlib.Children.add_many>`. Scenes
+        and Systems have the same restrictions as in :meth:`add`.
+        """
+        children = list(children)
+        if isinstance(tags, (str, bytes)):
+            raise TypeError("You passed a string instead of an iterable, this probably isn't what you intended.\n\nTry making it a tuple.")
+        tags = tuple(tags)
+        others = []
+        for child in children:
+            if isinstance(child, ppb.Scene):
+                raise TypeError("Scenes must be pushed, not added. You probably want the StartScene or ReplaceScene events.")
+            elif isinstance(child, ppb.systemslib.System):
+                self.add(child, tags)
+            else:
+                others.append(child)
+        super().add_many(others, tags)
+        return children
+
+    def remove_many(self, children: Iterable[GameObject]) -> List[GameObject]:
+        """
+        Remove several children at once.
+
+        See :meth:`Children.remove_many <ppb.gomlib.Children.remove_many>`.
+        Scenes and Systems have the same restrictions as in :meth:`remove`.
+        """
+        children = list(children)
+        others = []
+        for child in children:
+            if isinstance(child, ppb.Scene):
+                raise TypeError("Scenes must be popped, not removed. You probably want the StopScene event.")
+            elif isinstance(child, ppb.systemslib.System):
+                self.remove(child)
+            else:
+                others.append(child)
+        super().remove_many(others)
+        return children
+
+    def subscribers(self, handler_name: str) -> Iterable[GameObject]:
+        """
+        The children that have the named event handler, grouped like
+        iteration: Systems, Current Scene, anything else.
+        """
+        result = [
+            system for system in self._systems
+            if handler_name in _handler_names(type(system))
+        ]
+        scene = self.current_scene
+        if scene is not None and handler_name in _handler_names(type(scene)):
+            result.append(scene)
+        result.extend(self._handlers.get(handler_name, ()))
+        return result
+
+    def branches(self) -> Iterable[GameObject]:
+        """
+        The children that currently have children of their own, grouped like
+        iteration: Systems, Current Scene, anything else.
+        """
+        result = [
+            system for system in self._systems
+            if getattr(system, 'children', None)
+        ]
+        scene = self.current_scene
+        if scene is not None and getattr(scene, 'children', None):
+            result.append(scene)
+        result.extend(self._branches)
+        return result
+
+    def _members(self) -> Iterable[GameObject]:
+        return chain(self._systems, self._scenes, self._all)
+
     def push_scene(self, scene: Scene):
         """
         Push a scene onto the scene stack.
@@ -189,9 +282,9 @@ class EngineChildren(Children):
         If you are not an Engine, you probably don't want to call this.
         """
         self._scenes.append(scene)
-
-        for kind in type(scene).mro():
-            self._kinds[kind].add(scene)
+        gomlib._tree_version += 1
+        self._index_kinds(scene)
+        self._update_queries(scene)
 
     def pop_scene(self):
         """
@@ -200,10 +293,10 @@ class EngineChildren(Children):
         If you are not an Engine, you probably don't want to call this.
         """
         child = self._scenes.pop()
-        for kind in type(child).mro():
-            self._kinds[kind].remove(child)
-        for s in self._tags.values():
-            s.discard(child)
+        gomlib._tree_version += 1
+        self._unindex_kinds(child)
+        self._unindex_tags(child)
+        self._remove_from_queries(child)
 
     def __enter__(self):
         assert not self.entered
@@ -238,7 +331,9 @@ class GameEngine(GameObject, LoggingMixin):
     """
     def __init__(self, first_scene: Union[Type, Scene], *,
                  basic_systems=(Renderer, Updater, EventPoller, SoundController, AssetLoadingSystem),
-                 systems=(), scene_kwargs=None, **kwargs):
+                 systems=(), scene_kwargs=None, indexed_dispatch=False,
+                 broadcast_idle=True, frame_pacing=False, defer_mutations=False,
+                 cached_walk=False, **kwargs):
         """
         :param first_scene: A :class:`~ppb.Scene` type.
         :type first_scene: Union[Type, scenes.Scene]
@@ -251,6 +346,36 @@ class GameEngine(GameObject, LoggingMixin):
         :type systems: Iterable[systemslib.System]
         :param scene_kwargs: Keyword arguments passed along to the first scene.
         :type scene_kwargs: Dict[str, Any]
+        :param indexed_dispatch: Deliver broadcast events using the handler
+           index kept by :class:`~ppb.gomlib.Children`, visiting only the
+           objects with a matching handler instead of the whole tree. Handlers
+           must be defined on the class, not assigned to instances. Handlers
+           assigned to a class after it is defined (including with
+           :func:`unittest.mock.patch.object`) are only seen after calling
+           :func:`ppb.gomlib.refresh_handlers`.
+        :type indexed_dispatch: bool
+        :param broadcast_idle: Send :class:`~events.Idle` to the whole tree.
+           If False, Idle is only delivered to systems and to objects passed
+           to :meth:`subscribe_idle`.
+        :type broadcast_idle: bool
+        :param frame_pacing: Instead of spinning, have :meth:`main_loop` sleep
+           until the earliest deadline reported by the ``next_deadline()``
+           method of the systems. See :class:`~ppb.systems.clocks.FramePacer`.
+        :type frame_pacing: bool
+        :param defer_mutations: Hold structural changes to the tree (adding,
+           removing, and retagging children) made by event handlers until the
+           event has been delivered to every object. Containers are then
+           iterated without being copied. New scenes are made and started
+           once the :class:`~events.StartScene` or
+           :class:`~events.ReplaceScene` event has been delivered. See
+           :class:`~ppb.gomlib.MutationBuffer`.
+        :type defer_mutations: bool
+        :param cached_walk: Reuse the order objects are visited in for
+           broadcast events until the tree changes, instead of walking the
+           tree for every event. Objects added during an event are not visited
+           until the next one, and only changes made through
+           :class:`~ppb.gomlib.Children` are noticed.
+        :type cached_walk: bool
         :param kwargs: Additional keyword arguments. Passed to the systems.
 
         .. warning::
@@ -264,6 +389,13 @@ class GameEngine(GameObject, LoggingMixin):
         # Engine Configuration
         self.first_scene = first_scene
         self.scene_kwargs = scene_kwargs or {}
+        self.indexed_dispatch = indexed_dispatch
+        self.broadcast_idle = broadcast_idle
+        #: The :class:`~ppb.systems.clocks.FramePacer`, if frame pacing is enabled.
+        self.pacer = FramePacer() if frame_pacing else None
+        #: The :class:`~ppb.gomlib.MutationBuffer`, if mutations are deferred.
+        self.mutations = MutationBuffer() if defer_mutations else None
+        self.cached_walk = cached_walk
         self.kwargs = kwargs
 
         # Engine State
@@ -272,6 +404,10 @@ class GameEngine(GameObject, LoggingMixin):
         self.entered = False
         self.running = False
         self._last_idle_time = None
+        self._idle_subscribers = weakref.WeakSet()
+        # Handler name (or None) -> broadcast order, for cached_walk
+        self._walk_cache = {}
+        self._walk_version = None
 
         # Systems
         self.systems_classes = list(chain(basic_systems, systems))
@@ -286,6 +422,17 @@ class GameEngine(GameObject, LoggingMixin):
         """
         return self.children.current_scene
 
+    @property
+    def deferred_operations(self) -> int:
+        """
+        The number of tree changes that have been deferred until the end of
+        an event. Always 0 unless the engine was created with
+        ``defer_mutations=True``.
+        """
+        if self.mutations is None:
+            return 0
+        return self.mutations.count
+
     def __enter__(self):
         self.logger.info("Entering context")
         self.start_systems()
@@ -352,9 +499,31 @@ class GameEngine(GameObject, LoggingMixin):
         use this method. Call :meth:`GameEngine.loop_once` instead.
         """
         while self.running:
-            time.sleep(0)
+            if self.pacer is None:
+                time.sleep(0)
+            else:
+                self.pacer.wait(self.next_deadline())
             self.loop_once()
 
+    def next_deadline(self):
+        """
+        The earliest time any system needs to be idled, or ``None`` if no
+        system has a deadline.
+
+        Systems report deadlines with a ``next_deadline()`` method, returning
+        a time as given by :func:`ppb.get_time` or ``None``.
+        """
+        deadlines = [
+            deadline
+            for deadline in (
+                system.next_deadline()
+                for system in self.children._systems
+                if hasattr(system, 'next_deadline')
+            )
+            if deadline is not None
+        ]
+        return min(deadlines, default=None)
+
     def loop_once(self):
         """
         Iterate once.
@@ -366,7 +535,11 @@ class GameEngine(GameObject, LoggingMixin):
             raise ValueError("Cannot run before things have started",
                              self.entered)
         now = get_time()
-        self.signal(events.Idle(now - self._last_idle_time))
+        idle = events.Idle(now - self._last_idle_time)
+        if self.broadcast_idle:
+            self.signal(idle)
+        else:
+            self.signal(idle, targets=chain(self.children._systems, self._idle_subscribers))
         self._last_idle_time = now
         while self.events:
             self.publish()
@@ -388,24 +561,119 @@ class GameEngine(GameObject, LoggingMixin):
         if event.__targets__ is not None:
             # A targetted event
             targets = list(event.__targets__)  # Reify the WeakSet for consistency
+        elif self.cached_walk:
+            # A general broadcast event, in the order of a previous walk
+            targets = self._broadcast_order(event_handler_name)
+        elif self.indexed_dispatch:
+            # A general broadcast event, delivered by the handler index
+            targets = walk_subscribers(self, event_handler_name)
         else:
             # A general broadcast event
             targets = walk(self)
+        mutations = self.mutations if self.mutations is not None else nullcontext()
+        with mutations:
+            if self.indexed_dispatch:
+                self._deliver_from_tables(event, event_handler_name, targets)
+            else:
+                self._deliver(event, event_handler_name, targets)
+
+    def _deliver(self, event, event_handler_name, targets):
+        """
+        Call the handler of each target, looking it up on the object.
+        """
+        signal = self.signal
         for obj in targets:
             method = getattr(obj, event_handler_name, None)
             if callable(method):
                 try:
-                    method(event, self.signal)
+                    method(event, signal)
                 except TypeError as ex:
                     from inspect import signature
                     sig = signature(method)
                     try:
-                        sig.bind(event, self.signal)
+                        sig.bind(event, signal)
                     except TypeError:
                         raise BadEventHandlerException(obj, event_handler_name, event) from ex
                     else:
                         raise
 
+    def _deliver_from_tables(self, event, event_handler_name, targets):
+        """
+        Call the handler of each target, using the handler tables of
+        :mod:`ppb.gomlib` instead of looking it up on every object.
+
+        Like the handler index, the tables are made when a class is defined,
+        so handlers assigned to a class later are only seen after
+        :func:`~ppb.gomlib.refresh_handlers`.
+        """
+        signal = self.signal
+        for obj in targets:
+            attrs = getattr(obj, '__dict__', None)
+            if attrs and event_handler_name in attrs:
+                # Assigned to the instance, shadowing the class
+                function = None
+                method = attrs[event_handler_name]
+                valid = None
+                if not callable(method):
+                    continue
+            else:
+                entry = _handler_table(type(obj)).get(event_handler_name)
+                if entry is None:
+                    continue
+                function, valid = entry
+                method = None if function is not None else getattr(obj, event_handler_name)
+            try:
+                if function is not None:
+                    function(obj, event, signal)
+                else:
+                    method(event, signal)
+            except TypeError as ex:
+                if valid is None:
+                    from inspect import signature
+                    sig = signature(method or getattr(obj, event_handler_name))
+                    try:
+                        sig.bind(event, signal)
+                    except TypeError:
+                        valid = False
+                if not valid:
+                    raise BadEventHandlerException(obj, event_handler_name, event) from ex
+                raise
+
+    def _broadcast_order(self, handler_name: str) -> List[GameObject]:
+        """
+        The objects a broadcast event is delivered to, cached until the tree
+        changes.
+        """
+        if self._walk_version != gomlib._tree_version:
+            self._walk_cache.clear()
+            self._walk_version = gomlib._tree_version
+        key = handler_name if self.indexed_dispatch else None
+        try:
+            return self._walk_cache[key]
+        except KeyError:
+            if self.indexed_dispatch:
+                targets = list(walk_subscribers(self, handler_name))
+            else:
+                targets = list(walk(self))
+            self._walk_cache[key] = targets
+            return targets
+
+    def subscribe_idle(self, obj):
+        """
+        Deliver :class:`~events.Idle` to an object that is not a system.
+
+        Only needed when the engine was created with ``broadcast_idle=False``.
+        The engine holds a weak reference to the object.
+        """
+        self._idle_subscribers.add(obj)
+
+    def unsubscribe_idle(self, obj):
+        """
+        Stop delivering :class:`~events.Idle` to an object previously passed
+        to :meth:`subscribe_idle`.
+        """
+        self._idle_subscribers.discard(obj)
+
     def signal(self, event, *, targets=None):
         """
         Add an event to the event queue.
@@ -494,6 +762,13 @@ class GameEngine(GameObject, LoggingMixin):
 
     def _start_scene(self, scene, kwargs):
         """Start a scene."""
+        buffer = gomlib._local.buffer
+        if buffer is not None:
+            # Build and push it once the event is delivered, outside the
+            # buffer, so what the scene adds while setting up is there
+            # straight away.
+            buffer.defer(self._start_scene, scene, kwargs)
+            return
         if isinstance(scene, type):
             scene = scene(**(kwargs or {}))
         self.children.push_scene(scene)
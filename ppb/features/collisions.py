@@ -0,0 +1,175 @@
+"""
+Collision detection.
+
+Add :class:`CollisionSystem` to the engine, and :class:`ColliderMixin` to the
+sprites that can collide. After each :class:`~ppb.events.Update`, the system
+finds the colliders in the current scene that overlap, and sends a
+:class:`Collision` event to each of the two, naming the other: ::
+
+    class Player(ColliderMixin, ppb.Sprite):
+        def on_collision(self, event, signal):
+            if isinstance(event.other, Coin):
+                ...
+
+    ppb.run(setup=setup, systems=[CollisionSystem])
+
+Colliders are rectangles (using their ``width`` and ``height``) or circles.
+Use :attr:`~ColliderMixin.collision_layer` and
+:attr:`~ColliderMixin.collision_mask` to choose what collides with what.
+
+Objects that keep overlapping get a :class:`Collision` after every
+:class:`~ppb.events.Update`.
+"""
+from dataclasses import dataclass
+from typing import Any
+from typing import List
+from typing import Tuple
+import weakref
+
+from ppb.scenes import Scene
+from ppb.systemslib import System
+
+__all__ = 'Collision', 'ColliderMixin', 'CollisionSystem'
+
+RECTANGLE = 'rectangle'
+CIRCLE = 'circle'
+
+
+@dataclass
+class Collision:
+    """
+    Two colliders overlap.
+
+    Only sent to the colliders involved.
+    """
+    other: Any  #: The collider this one collided with
+    scene: Scene = None  #: The currently running scene
+
+
+@dataclass
+class CheckCollisions:
+    """
+    Fired at the :class:`CollisionSystem` after Update.
+    """
+    scene: Scene = None
+
+
+class ColliderMixin:
+    """
+    A sprite mixin marking an object that can collide with others.
+
+    Needs a ``position``, and a ``width`` and ``height`` or a ``size``.
+    """
+    #: The shape used for collisions: ``'rectangle'`` or ``'circle'``.
+    collision_shape: str = RECTANGLE
+    #: The radius of a circle collider. Defaults to half the smaller of the
+    #: width and height.
+    collision_radius: float = None
+    #: A bit mask of the layers this object is on.
+    collision_layer: int = 1
+    #: A bit mask of the layers this object collides with. Two objects collide
+    #: if each is on a layer the other collides with.
+    collision_mask: int = ~0
+
+
+# left, right, bottom, top, radius (or None), layer, mask, collider
+_Entry = Tuple[float, float, float, float, Any, int, int, ColliderMixin]
+
+
+def _entry(collider) -> _Entry:
+    x, y = collider.position
+    try:
+        width = collider.width
+        height = collider.height
+    except AttributeError:
+        width = height = collider.size
+    radius = None
+    if collider.collision_shape == CIRCLE:
+        radius = collider.collision_radius
+        if radius is None:
+            radius = min(width, height) / 2
+        width = height = radius * 2
+    elif collider.collision_shape != RECTANGLE:
+        raise ValueError(f"{type(collider).__name__} has unknown collision_shape {collider.collision_shape!r}")
+    half_width = width / 2
+    half_height = height / 2
+    return (
+        x - half_width, x + half_width, y - half_height, y + half_height,
+        radius, collider.collision_layer, collider.collision_mask, collider,
+    )
+
+
+def _narrowphase(a: _Entry, b: _Entry) -> bool:
+    """
+    Do two entries whose bounding boxes overlap actually collide?
+    """
+    a_radius = a[4]
+    b_radius = b[4]
+    if a_radius is None and b_radius is None:
+        return True
+    if a_radius is not None and b_radius is not None:
+        dx = (a[0] + a[1]) / 2 - (b[0] + b[1]) / 2
+        dy = (a[2] + a[3]) / 2 - (b[2] + b[3]) / 2
+        distance = a_radius + b_radius
+        return dx * dx + dy * dy < distance * distance
+    if a_radius is None:
+        a, b = b, a
+    # a is the circle, b is the rectangle
+    cx = (a[0] + a[1]) / 2
+    cy = (a[2] + a[3]) / 2
+    dx = cx - min(max(cx, b[0]), b[1])
+    dy = cy - min(max(cy, b[2]), b[3])
+    return dx * dx + dy * dy < a[4] * a[4]
+
+
+def find_collisions(colliders) -> List[Tuple[ColliderMixin, ColliderMixin]]:
+    """
+    Find the pairs of colliders that overlap.
+
+    Sweep and prune along the x axis, then check the shapes of the pairs whose
+    bounding boxes overlap.
+    """
+    entries = sorted((_entry(c) for c in colliders), key=lambda e: e[0])
+    pairs = []
+    active = []
+    for entry in entries:
+        left, _, bottom, top, _, layer, mask, _ = entry
+        active = [other for other in active if other[1] > left]
+        for other in active:
+            if (
+                other[2] < top and bottom < other[3]
+                and layer & other[6] and other[5] & mask
+                and _narrowphase(entry, other)
+            ):
+                pairs.append((other[7], entry[7]))
+        active.append(entry)
+    return pairs
+
+
+class CollisionSystem(System):
+    """
+    Sends :class:`Collision` events to overlapping colliders after each
+    :class:`~ppb.events.Update`.
+    """
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        #: The pairs found by the last check.
+        self.collisions = []
+        # Scene -> live query of its colliders. Held here, since the scene
+        # only keeps queries while something else uses them.
+        self._colliders = weakref.WeakKeyDictionary()
+
+    def on_update(self, event, signal):
+        signal(CheckCollisions(), targets=[self])
+
+    def on_check_collisions(self, event, signal):
+        scene = event.scene
+        if scene is None:
+            return
+        colliders = self._colliders.get(scene)
+        if colliders is None:
+            colliders = self._colliders[scene] = scene.children.query(kind=ColliderMixin)
+        self.collisions = find_collisions(colliders)
+        for a, b in self.collisions:
+            signal(Collision(other=b), targets=[a])
+            signal(Collision(other=a), targets=[b])
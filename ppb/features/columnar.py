@@ -0,0 +1,250 @@
+"""
+Columnar sprites: the data of many sprites stored together in arrays, so
+that motion can be integrated for all of them at once.
+
+Requires numpy.
+
+A :class:`SpriteStore` holds the positions, velocities, rotations, sizes, and
+layers of its sprites in contiguous arrays. Each :class:`ColumnarSprite` is a
+lightweight view of one row of those arrays: it is a normal sprite as far as
+:class:`~ppb.gomlib.Children`, the :class:`~ppb.systems.Renderer`, and the
+:class:`~ppb.sprites.RectangleShapeMixin` accessors are concerned, but reading
+and writing its attributes reads and writes the arrays.
+
+The :class:`ColumnarIntegrator` system moves every sprite in every store in
+the current scene on each :class:`~ppb.events.Update`, instead of each sprite
+doing it in its own ``on_update``. ::
+
+    def setup(scene):
+        store = scene.add(SpriteStore())
+        for _ in range(10_000):
+            scene.add(store.create(velocity=Vector(1, 0)))
+
+    ppb.run(setup=setup, systems=[ColumnarIntegrator])
+
+Remove a sprite from the store with :meth:`SpriteStore.release` when
+removing it from the scene.
+"""
+from typing import Iterator
+
+import numpy
+from ppb_vector import Vector
+
+from ppb.gomlib import GameObject
+from ppb.sprites import BaseSprite
+from ppb.sprites import RectangleShapeMixin
+from ppb.sprites import RenderableMixin
+from ppb.sprites import RotatableMixin
+from ppb.systemslib import System
+
+__all__ = 'SpriteStore', 'ColumnarSprite', 'ColumnarIntegrator'
+
+
+class SpriteStore(GameObject):
+    """
+    The arrays backing a group of :class:`ColumnarSprite`.
+
+    Only the first :attr:`count` rows of each array are in use. Removing a
+    sprite moves the last sprite into its row, so rows are not stable.
+    """
+    #: Number of rows allocated when the store is created.
+    capacity: int = 1024
+
+    def __init__(self, **props):
+        super().__init__(**props)
+        #: The number of sprites in the store
+        self.count = 0
+        self._views = []
+        capacity = self.capacity
+        #: Positions, shape (capacity, 2)
+        self.positions = numpy.zeros((capacity, 2))
+        #: Velocities in game units per second, shape (capacity, 2)
+        self.velocities = numpy.zeros((capacity, 2))
+        #: Rotations in degrees, shape (capacity,)
+        self.rotations = numpy.zeros(capacity)
+        #: Angular velocities in degrees per second, shape (capacity,)
+        self.angular_velocities = numpy.zeros(capacity)
+        #: Widths and heights, shape (capacity, 2)
+        self.sizes = numpy.ones((capacity, 2))
+        #: Layers, shape (capacity,)
+        self.layers = numpy.zeros(capacity)
+
+    def sprites(self) -> Iterator['ColumnarSprite']:
+        """
+        Iterate over the sprites in the store, in row order.
+        """
+        return iter(self._views[:self.count])
+
+    def create(self, kind=None, **props) -> 'ColumnarSprite':
+        """
+        Make a new sprite backed by this store.
+
+        :param kind: The sprite class to make, :class:`ColumnarSprite` by default.
+        :param props: Passed to the sprite.
+        """
+        if kind is None:
+            kind = ColumnarSprite
+        return kind(store=self, **props)
+
+    def release(self, sprite: 'ColumnarSprite'):
+        """
+        Remove a sprite from the store.
+
+        The sprite must not be used afterwards.
+        """
+        index = sprite._index
+        if index is None or self._views[index] is not sprite:
+            raise ValueError(f"{sprite!r} is not in this store")
+        last = self.count - 1
+        if index != last:
+            moved = self._views[last]
+            for column in self._columns():
+                column[index] = column[last]
+            self._views[index] = moved
+            moved._index = index
+        self._views.pop()
+        self.count = last
+        sprite._store = None
+        sprite._index = None
+
+    def integrate(self, time_delta: float):
+        """
+        Move and rotate every sprite by its velocities over the given time.
+        """
+        count = self.count
+        self.positions[:count] += self.velocities[:count] * time_delta
+        angular = self.angular_velocities[:count]
+        if angular.any():
+            rotations = self.rotations[:count]
+            rotations += angular * time_delta
+            numpy.remainder(rotations, 360, out=rotations)
+
+    def _allocate(self, sprite: 'ColumnarSprite') -> int:
+        if self.count == len(self.positions):
+            self._grow()
+        index = self.count
+        self.positions[index] = 0
+        self.velocities[index] = 0
+        self.rotations[index] = 0
+        self.angular_velocities[index] = 0
+        self.sizes[index] = 1
+        self.layers[index] = 0
+        self._views.append(sprite)
+        self.count += 1
+        return index
+
+    def _grow(self):
+        capacity = max(len(self.positions) * 2, 1)
+        for name in ('positions', 'velocities', 'rotations', 'angular_velocities', 'sizes', 'layers'):
+            old = getattr(self, name)
+            new = numpy.empty((capacity,) + old.shape[1:])
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def _columns(self):
+        return (
+            self.positions, self.velocities, self.rotations,
+            self.angular_velocities, self.sizes, self.layers,
+        )
+
+
+class ColumnarSprite(RectangleShapeMixin, RenderableMixin, RotatableMixin, BaseSprite):
+    """
+    A sprite whose position, velocity, rotation, size, and layer are kept in
+    a :class:`SpriteStore`.
+
+    Make them with :meth:`SpriteStore.create`. Other attributes (like
+    ``image``) are ordinary attributes.
+    """
+    def __init__(self, *, store: SpriteStore, **props):
+        self._store = store
+        self._index = store._allocate(self)
+        super().__init__(**props)
+
+    @property
+    def position(self) -> Vector:
+        return Vector(*self._store.positions[self._index].tolist())
+
+    @position.setter
+    def position(self, value):
+        self._store.positions[self._index] = tuple(Vector(value))
+
+    @property
+    def velocity(self) -> Vector:
+        """
+        Game units per second, applied by :class:`ColumnarIntegrator`.
+        """
+        return Vector(*self._store.velocities[self._index].tolist())
+
+    @velocity.setter
+    def velocity(self, value):
+        self._store.velocities[self._index] = tuple(Vector(value))
+
+    @property
+    def rotation(self) -> float:
+        return float(self._store.rotations[self._index])
+
+    @rotation.setter
+    def rotation(self, value):
+        self._store.rotations[self._index] = value
+
+    @property
+    def angular_velocity(self) -> float:
+        """
+        Degrees per second, applied by :class:`ColumnarIntegrator`.
+        """
+        return float(self._store.angular_velocities[self._index])
+
+    @angular_velocity.setter
+    def angular_velocity(self, value):
+        self._store.angular_velocities[self._index] = value
+
+    @property
+    def width(self) -> float:
+        return float(self._store.sizes[self._index, 0])
+
+    @width.setter
+    def width(self, value):
+        self._store.sizes[self._index, 0] = value
+
+    @property
+    def height(self) -> float:
+        return float(self._store.sizes[self._index, 1])
+
+    @height.setter
+    def height(self, value):
+        self._store.sizes[self._index, 1] = value
+
+    @property
+    def size(self) -> float:
+        """
+        The larger of :attr:`width` and :attr:`height`. Setting it makes the
+        sprite square.
+        """
+        return float(self._store.sizes[self._index].max())
+
+    @size.setter
+    def size(self, value):
+        self._store.sizes[self._index] = value
+
+    @property
+    def layer(self) -> float:
+        layer = self._store.layers[self._index]
+        return int(layer) if layer.is_integer() else float(layer)
+
+    @layer.setter
+    def layer(self, value):
+        self._store.layers[self._index] = value
+
+
+class ColumnarIntegrator(System):
+    """
+    Integrates the motion of every :class:`SpriteStore` in the current scene
+    on :class:`~ppb.events.Update`.
+    """
+    def on_update(self, event, signal):
+        scene = event.scene
+        if scene is None:
+            return
+        for store in scene.get(kind=SpriteStore):
+            store.integrate(event.time_delta)
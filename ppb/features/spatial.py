@@ -0,0 +1,281 @@
+"""
+A spatial index for scenes, to find the sprites in an area without checking
+every sprite.
+
+:class:`SpatialHash` divides the world into square cells, and keeps track of
+the cells each sprite's rectangle overlaps. Attach one to a scene, and it will
+index the sprites added to and removed from the scene. ::
+
+    class Level(ppb.Scene):
+        def __init__(self, **props):
+            super().__init__(**props)
+            SpatialHash(cell_size=2).attach(self)
+
+    ...
+
+    for enemy in scene.spatial_index.query_radius(player.position, 5):
+        ...
+
+The index needs to know when sprites move. Sprites using
+:class:`SpatialMixin` tell it whenever their position or size is set; for
+other objects call :meth:`SpatialHash.update` after moving them.
+"""
+from math import floor
+from typing import Dict
+from typing import Iterable
+from typing import Set
+from typing import Tuple
+from typing import Type
+
+from ppb_vector import Vector, VectorLike
+
+from ppb.sprites import BaseSprite
+
+__all__ = 'SpatialHash', 'SpatialMixin', 'SpatialScene'
+
+Rect = Tuple[float, float, float, float]
+Cell = Tuple[int, int]
+
+_EMPTY = frozenset()
+
+
+def object_rect(obj) -> Rect:
+    """
+    The (left, bottom, right, top) of an object, from its position and its
+    width and height (or size). Objects without either are points.
+    """
+    x, y = obj.position
+    try:
+        width = obj.width
+        height = obj.height
+    except AttributeError:
+        width = height = getattr(obj, 'size', 0)
+    half_width = width / 2
+    half_height = height / 2
+    return x - half_width, y - half_height, x + half_width, y + half_height
+
+
+class SpatialHash:
+    """
+    A uniform grid of cells holding the objects that overlap them.
+
+    Pick a cell size around the size of a typical sprite: much smaller and
+    sprites are stored in many cells, much bigger and queries return many
+    candidates.
+    """
+    def __init__(self, cell_size: float = 1, *, kind: Type = BaseSprite):
+        """
+        :param cell_size: The width and height of a cell, in game units.
+        :param kind: Only objects of this type are indexed when attached to a
+           scene.
+        """
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self.kind = kind
+        self._cells: Dict[Cell, Set] = {}
+        # Object -> (its rectangle, its range of cells)
+        self._entries: Dict[object, Tuple[Rect, Tuple[int, int, int, int]]] = {}
+        self._scene = None
+
+    def __contains__(self, obj) -> bool:
+        return obj in self._entries
+
+    def __iter__(self):
+        return iter(tuple(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def attach(self, scene) -> 'SpatialHash':
+        """
+        Index a scene: the objects of :attr:`kind` in it now, and the ones
+        added later. Sets ``scene.spatial_index``.
+        """
+        if self._scene is not None:
+            raise RuntimeError("SpatialHash is already attached to a scene")
+        self._scene = scene
+        scene.spatial_index = self
+        scene.children.add_observer(self)
+        for child in scene.get(kind=self.kind):
+            self.insert(child)
+        return self
+
+    def detach(self):
+        """
+        Stop indexing the attached scene, and empty the index.
+        """
+        scene, self._scene = self._scene, None
+        if scene is None:
+            return
+        scene.children.remove_observer(self)
+        if getattr(scene, 'spatial_index', None) is self:
+            scene.spatial_index = None
+        for obj in tuple(self._entries):
+            self.remove(obj)
+
+    def child_added(self, child):
+        if isinstance(child, self.kind):
+            self.insert(child)
+
+    def child_removed(self, child):
+        if child in self._entries:
+            self.remove(child)
+
+    def insert(self, obj):
+        """
+        Add an object to the index, or update it if already indexed.
+        """
+        if obj in self._entries:
+            self.update(obj)
+            return
+        rect = object_rect(obj)
+        cells = self._cell_range(rect)
+        self._entries[obj] = rect, cells
+        self._add_to_cells(obj, cells)
+        if isinstance(obj, SpatialMixin):
+            obj._spatial_index = self
+
+    def remove(self, obj):
+        """
+        Remove an object from the index.
+        """
+        rect, cells = self._entries.pop(obj)
+        self._remove_from_cells(obj, cells)
+        if isinstance(obj, SpatialMixin) and obj.__dict__.get('_spatial_index') is self:
+            del obj._spatial_index
+
+    def update(self, obj):
+        """
+        Tell the index an object has moved or changed size.
+        """
+        rect = object_rect(obj)
+        _, old_cells = self._entries[obj]
+        cells = self._cell_range(rect)
+        self._entries[obj] = rect, cells
+        if cells != old_cells:
+            self._remove_from_cells(obj, old_cells)
+            self._add_to_cells(obj, cells)
+
+    def refresh(self):
+        """
+        Update every object in the index.
+        """
+        for obj in tuple(self._entries):
+            self.update(obj)
+
+    def query_rect(self, left: float, bottom: float, right: float, top: float) -> Set:
+        """
+        The objects that overlap a rectangle.
+        """
+        return {
+            obj for obj in self._candidates(left, bottom, right, top)
+            if _overlaps(self._entries[obj][0], left, bottom, right, top)
+        }
+
+    def query_radius(self, center: VectorLike, radius: float) -> Set:
+        """
+        The objects that overlap a circle.
+        """
+        cx, cy = Vector(center)
+        limit = radius * radius
+        result = set()
+        for obj in self._candidates(cx - radius, cy - radius, cx + radius, cy + radius):
+            left, bottom, right, top = self._entries[obj][0]
+            dx = cx - min(max(cx, left), right)
+            dy = cy - min(max(cy, bottom), top)
+            if dx * dx + dy * dy <= limit:
+                result.add(obj)
+        return result
+
+    def query_point(self, point: VectorLike) -> Set:
+        """
+        The objects that contain a point.
+        """
+        x, y = Vector(point)
+        cell = self._cells.get((floor(x / self.cell_size), floor(y / self.cell_size)), _EMPTY)
+        return {
+            obj for obj in cell
+            if _overlaps(self._entries[obj][0], x, y, x, y)
+        }
+
+    def _candidates(self, left, bottom, right, top) -> Iterable:
+        x0, y0, x1, y1 = self._cell_range((left, bottom, right, top))
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(self._cells):
+            # Cheaper to look at everything
+            return self._entries
+        cells = self._cells
+        candidates = set()
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                cell = cells.get((x, y))
+                if cell:
+                    candidates.update(cell)
+        return candidates
+
+    def _cell_range(self, rect: Rect) -> Tuple[int, int, int, int]:
+        size = self.cell_size
+        left, bottom, right, top = rect
+        return floor(left / size), floor(bottom / size), floor(right / size), floor(top / size)
+
+    def _add_to_cells(self, obj, cells):
+        x0, y0, x1, y1 = cells
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                try:
+                    self._cells[x, y].add(obj)
+                except KeyError:
+                    self._cells[x, y] = {obj}
+
+    def _remove_from_cells(self, obj, cells):
+        x0, y0, x1, y1 = cells
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                cell = self._cells[x, y]
+                cell.discard(obj)
+                if not cell:
+                    del self._cells[x, y]
+
+
+def _overlaps(rect: Rect, left, bottom, right, top) -> bool:
+    return rect[0] <= right and left <= rect[2] and rect[1] <= top and bottom <= rect[3]
+
+
+class SpatialMixin:
+    """
+    A sprite mixin that keeps a :class:`SpatialHash` up to date when the
+    sprite's position or size is set.
+
+    Put it before the other sprite classes: ::
+
+        class Enemy(SpatialMixin, ppb.Sprite):
+            ...
+    """
+    _spatial_index = None
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in _SPATIAL_ATTRIBUTES:
+            index = self._spatial_index
+            if index is not None:
+                index.update(self)
+
+
+_SPATIAL_ATTRIBUTES = frozenset({'position', 'width', 'height', 'size'})
+
+
+class SpatialScene:
+    """
+    A scene mixin that attaches a :class:`SpatialHash` on creation.
+
+    Set :attr:`cell_size` to configure it. ::
+
+        class Level(SpatialScene, ppb.Scene):
+            cell_size = 2
+    """
+    #: The cell size of the index
+    cell_size: float = 1
+
+    def __init__(self, **props):
+        super().__init__(**props)
+        SpatialHash(self.cell_size).attach(self)
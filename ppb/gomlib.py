@@ -3,31 +3,258 @@ The Game Object Model.
 """
 from collections import defaultdict, deque
 from collections.abc import Collection
+import inspect
+import threading
+from typing import Callable
+from typing import Dict
+from typing import FrozenSet
 from typing import Hashable
 from typing import Iterable
 from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Type
+import types
+import weakref
 
 from ppb.errors import BadChildException
 from ppb.errors import NotMyChildError
 
+_EMPTY = frozenset()
+
+# Class -> handler table, see _handler_table()
+_handler_tables = weakref.WeakKeyDictionary()
+# Class -> handler names, see _handler_names()
+_handler_name_sets = weakref.WeakKeyDictionary()
+
+
+def _build_handler_table(cls: Type) -> Dict[str, Tuple[Optional[Callable], Optional[bool]]]:
+    table = {}
+    for name in dir(cls):
+        if not name.startswith('on_'):
+            continue
+        attr = getattr(cls, name, None)
+        if not callable(attr):
+            continue
+        static = inspect.getattr_static(cls, name)
+        if isinstance(static, types.FunctionType):
+            function = static
+            args = (None, None, None)
+        else:
+            # staticmethod, classmethod, or something more exotic. Let
+            # attribute lookup sort it out.
+            function = None
+            args = (None, None)
+        try:
+            inspect.signature(attr).bind(*args)
+        except TypeError:
+            valid = False
+        except ValueError:
+            # No signature available
+            valid = None
+        else:
+            valid = True
+        table[name] = function, valid
+    return table
+
+
+def _handler_table(cls: Type) -> Dict[str, Tuple[Optional[Callable], Optional[bool]]]:
+    """
+    The event handlers (``on_*`` callables) a class provides.
+
+    Maps handler names to ``(function, valid)`` pairs. ``function`` is the
+    plain function to call as ``function(obj, event, signal)``, or ``None`` if
+    the handler has to be looked up on the object. ``valid`` is whether the
+    handler accepts an event and a signal function, or ``None`` if that can't
+    be known.
+
+    Computed once per class. Tables for :class:`GameObject` classes are built
+    when the class is defined; see :func:`refresh_handlers` for handlers
+    assigned to a class later.
+    """
+    try:
+        return _handler_tables[cls]
+    except KeyError:
+        table = _handler_tables[cls] = _build_handler_table(cls)
+        return table
+
+
+def refresh_handlers():
+    """
+    Forget the event handlers found on every class.
+
+    Call after assigning event handlers to (or deleting them from) a class
+    that is already defined, so the engine sees the change. Objects already
+    added to a :class:`Children` keep the handlers they were indexed with.
+    """
+    _handler_tables.clear()
+    _handler_name_sets.clear()
+
+
+def _handler_names(cls: Type) -> FrozenSet[str]:
+    """
+    The names of the event handlers (``on_*`` callables) a class provides.
+
+    The same set is returned for a class until :func:`refresh_handlers`.
+    """
+    try:
+        return _handler_name_sets[cls]
+    except KeyError:
+        names = _handler_name_sets[cls] = frozenset(_handler_table(cls))
+        return names
+
+
+class _LocalState(threading.local):
+    #: The active MutationBuffer of this thread, if any
+    buffer = None
+
+
+_local = _LocalState()
+# Bumped whenever any Children is added to or removed from
+_tree_version = 0
+
+
+class MutationBuffer:
+    """
+    While active (as a context manager), structural changes to every
+    :class:`Children` (adding, removing, and retagging children) made on the
+    same thread are recorded instead of applied. They are applied, in order,
+    when the outermost ``with`` block exits. If one of them raises, the rest
+    are dropped.
+
+    Since containers can't change while a buffer is active, they can be
+    iterated without making copies. Arguments are checked immediately, but
+    errors that depend on the state of the container (like removing
+    something that isn't a child) are only raised when the operation is
+    applied.
+
+    Used by :class:`~ppb.GameEngine` when created with
+    ``defer_mutations=True``.
+    """
+    def __init__(self):
+        self._depth = 0
+        self._pending = deque()
+        self._previous = None
+        #: The number of operations deferred so far.
+        self.count = 0
+
+    def __enter__(self):
+        if not self._depth:
+            self._previous = _local.buffer
+            _local.buffer = self
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc):
+        self._depth -= 1
+        if not self._depth:
+            _local.buffer = self._previous
+            self._previous = None
+            self.flush()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def defer(self, method: Callable, *args):
+        """
+        Record a call to be made later.
+        """
+        self._pending.append((method, args))
+        self.count += 1
+
+    def flush(self):
+        """
+        Apply the recorded operations.
+        """
+        pending = self._pending
+        try:
+            while pending:
+                method, args = pending.popleft()
+                method(*args)
+        except BaseException:
+            # Don't leave the rest for the next flush to apply
+            pending.clear()
+            raise
+
+
+def _snapshot(members: Collection) -> Iterator:
+    """
+    Iterate over a set that might change during iteration.
+
+    Only copies if a MutationBuffer isn't active.
+    """
+    if _local.buffer is not None:
+        return iter(members)
+    return iter(tuple(members))
+
+
+def _group_by_class(objects: Iterable) -> Dict[Type, List]:
+    groups = defaultdict(list)
+    for obj in objects:
+        groups[type(obj)].append(obj)
+    return groups
+
 
 class Children(Collection):
     """
     A container for game objects.
 
     Supports tagging.
+
+    By default, every child is indexed under every class in its MRO, so any
+    :meth:`get` by kind is a lookup. With ``lazy_kinds=True``, a kind is only
+    indexed once it has been asked for (by :meth:`get` or :meth:`query`),
+    making adding and removing children cheaper in trees where only a few
+    kinds are ever looked up. The first lookup of each kind scans the
+    container.
     """
 
-    def __init__(self):
+    def __init__(self, *, lazy_kinds: bool = False):
         self._all = set()
         self._kinds = defaultdict(set)
+        # The kinds that have been asked for, if indexing lazily
+        self._indexed_kinds = set() if lazy_kinds else None
+        # Class -> the indexed kinds in its MRO, if indexing lazily
+        self._kind_plans = weakref.WeakKeyDictionary() if lazy_kinds else None
         self._tags = defaultdict(set)
+        # Child -> its tags, so removal doesn't have to search every tag
+        self._child_tags = {}
+        # (kind, tag) -> Query, made by the first query()
+        self._queries = None
+        # (container, owner) weak references, if our owner is in a container
+        self._parent = None
+
+    # Indexes made the first time they are used, since the containers of
+    # most sprites never hold anything. Name -> factory.
+    _lazy_indexes = {
+        # Handler name -> the children with that handler
+        '_handlers': lambda: defaultdict(set),
+        # Child -> the handler names it was indexed under
+        '_child_handlers': dict,
+        # The children that have children of their own
+        '_branches': set,
+        # Notified of children being added and removed
+        '_observers': list,
+    }
+
+    def __getattr__(self, name):
+        # Only called for attributes not set yet
+        try:
+            factory = self._lazy_indexes[name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}") from None
+        value = factory()
+        setattr(self, name, value)
+        return value
 
     def __contains__(self, item: 'GameObject') -> bool:
         return item in self._all
 
     def __iter__(self) -> Iterator['GameObject']:
+        if _local.buffer is not None:
+            # Can't change until the buffer is flushed
+            return iter(self._all)
         return (x for x in list(self._all))
 
     def __len__(self) -> int:
@@ -54,12 +281,24 @@ class Children(Collection):
         if isinstance(tags, (str, bytes)):
             raise TypeError("You passed a string instead of an iterable, this probably isn't what you intended.\n\nTry making it a tuple.")
 
+        if _local.buffer is not None:
+            _local.buffer.defer(self.add, child, tuple(tags))
+            return child
+
+        global _tree_version
+        _tree_version += 1
+        was_empty = not self._all
         self._all.add(child)
 
-        for kind in type(child).mro():
-            self._kinds[kind].add(child)
-        for tag in tags:
-            self._tags[tag].add(child)
+        self._index_kinds(child)
+        self._index_tags(child, tags)
+        self._index_handlers(child)
+        self._update_queries(child)
+        for observer in self._observers:
+            observer.child_added(child)
+
+        if was_empty:
+            self._update_parent()
 
         return child
 
@@ -74,17 +313,163 @@ class Children(Collection):
             container.remove(myObject)
         """
         # Ugh, this is copied in EngineChildren
+        if _local.buffer is not None:
+            _local.buffer.defer(self.remove, child)
+            return child
+
+        global _tree_version
         try:
             self._all.remove(child)
         except KeyError as exc:
             raise NotMyChildError() from exc
-        for kind in type(child).mro():
-            self._kinds[kind].remove(child)
-        for s in self._tags.values():
-            s.discard(child)
+        _tree_version += 1
+        self._unindex_kinds(child)
+        self._unindex_tags(child)
+        self._unindex_handlers(child)
+        self._remove_from_queries(child)
+        for observer in self._observers:
+            observer.child_removed(child)
+
+        if not self._all:
+            self._update_parent()
 
         return child
 
+    def add_many(self, children: Iterable['GameObject'], tags: Iterable[Hashable] = ()) -> List['GameObject']:
+        """
+        Add several children at once, all with the same tags.
+
+        Much faster than calling :meth:`add` for each child when adding many
+        objects of the same few classes, eg when loading a level.
+
+        :param children: An iterable of Game Objects.
+        :param tags: An iterable of Hashable objects. (Probably strings.) Values
+              that can be used to retrieve a group containing the children.
+        :return: The children added, as a list.
+
+        Examples: ::
+
+            children.add_many(Bullet() for _ in range(100))
+
+            children.add_many(wave, tags=["enemy"])
+        """
+        children = list(children)
+        for child in children:
+            if isinstance(child, type):
+                raise BadChildException(child)
+
+        if isinstance(tags, (str, bytes)):
+            raise TypeError("You passed a string instead of an iterable, this probably isn't what you intended.\n\nTry making it a tuple.")
+        tags = tuple(tags)
+
+        if not children:
+            return children
+
+        if _local.buffer is not None:
+            _local.buffer.defer(self.add_many, children, tags)
+            return children
+
+        global _tree_version
+        _tree_version += 1
+        was_empty = not self._all
+        self._all.update(children)
+
+        for cls, group in _group_by_class(children).items():
+            for kind in self._kind_plan(cls):
+                self._kinds[kind].update(group)
+            names = _handler_names(cls)
+            for name in names:
+                self._handlers[name].update(group)
+            self._child_handlers.update(dict.fromkeys(group, names))
+            if self._queries:
+                for query in self._queries.values():
+                    if query.kind is not None and query.kind not in cls.__mro__:
+                        continue
+                    if query.tag is None or query.tag in tags:
+                        query._results.update(group)
+
+        for tag in tags:
+            self._tags[tag].update(children)
+        if tags:
+            for child in children:
+                self._child_tags.setdefault(child, set()).update(tags)
+
+        for child in children:
+            self._link(child)
+
+        for observer in self._observers:
+            for child in children:
+                observer.child_added(child)
+
+        if was_empty:
+            self._update_parent()
+
+        return children
+
+    def remove_many(self, children: Iterable['GameObject']) -> List['GameObject']:
+        """
+        Remove several children at once.
+
+        If any of them isn't in the container, nothing is removed.
+
+        :param children: An iterable of Game Objects in the container.
+        :return: The children removed, as a list.
+
+        Example: ::
+
+            children.remove_many(dead_enemies)
+        """
+        children = list(dict.fromkeys(children))
+        if _local.buffer is not None:
+            _local.buffer.defer(self.remove_many, children)
+            return children
+
+        for child in children:
+            if child not in self._all:
+                raise NotMyChildError()
+
+        if not children:
+            return children
+
+        global _tree_version
+        _tree_version += 1
+        self._all.difference_update(children)
+
+        lazy = self._indexed_kinds is not None
+        for cls, group in _group_by_class(children).items():
+            for kind in self._kind_plan(cls):
+                members = self._kinds[kind]
+                members.difference_update(group)
+                if not members and not lazy:
+                    del self._kinds[kind]
+
+        handler_groups = {}
+        for child in children:
+            self._unindex_tags(child)
+            self._unlink(child)
+            names = self._child_handlers.pop(child, ())
+            handler_groups.setdefault(id(names), (names, []))[1].append(child)
+        for names, group in handler_groups.values():
+            for name in names:
+                subscribers = self._handlers.get(name)
+                if subscribers is not None:
+                    subscribers.difference_update(group)
+                    if not subscribers:
+                        del self._handlers[name]
+
+        if self._queries:
+            for query in self._queries.values():
+                query._results.difference_update(children)
+
+        for observer in self._observers:
+            for child in children:
+                observer.child_removed(child)
+
+        if not self._all:
+            self._update_parent()
+
+        return children
+
     def get(self, *, kind: Type = None, tag: 'GameObject' = None, **_) -> Iterator:
         """
         Iterate over the objects by kind or tag.
@@ -107,13 +492,238 @@ class Children(Collection):
         """
         if kind is None and tag is None:
             raise TypeError("get() takes at least one keyword-only argument. 'kind' or 'tag'.")
-        kinds = self._all
-        tags = self._all
-        if kind is not None:
-            kinds = self._kinds[kind]
-        if tag is not None:
-            tags = self._tags[tag]
-        return (x for x in kinds.intersection(tags))
+        if kind is not None and self._indexed_kinds is not None and kind not in self._indexed_kinds:
+            self._index_kind(kind)
+        if tag is None:
+            return _snapshot(self._kinds.get(kind, _EMPTY))
+        elif kind is None:
+            return _snapshot(self._tags.get(tag, _EMPTY))
+
+        # Start from the smaller index, and check membership in the larger.
+        smaller = self._kinds.get(kind, _EMPTY)
+        larger = self._tags.get(tag, _EMPTY)
+        if len(larger) < len(smaller):
+            smaller, larger = larger, smaller
+        return (x for x in _snapshot(smaller) if x in larger)
+
+    def query(self, *, kind: Type = None, tag: Hashable = None) -> 'Query':
+        """
+        Get a :class:`Query`: a live view of the objects of the given kind
+        and/or tag.
+
+        Takes the same arguments as :meth:`get`. Unlike :meth:`get`, the result
+        is kept up to date as children are added, removed, or retagged, so it
+        can be created once and iterated every frame. Asking for the same query
+        again returns the same object, as long as it is still in use.
+
+        Example: ::
+
+            living_enemies = children.query(kind=Enemy, tag="alive")
+            ...
+            for enemy in living_enemies:
+                ...
+        """
+        if kind is None and tag is None:
+            raise TypeError("query() takes at least one keyword-only argument. 'kind' or 'tag'.")
+        key = kind, tag
+        if self._queries is None:
+            self._queries = weakref.WeakValueDictionary()
+        try:
+            return self._queries[key]
+        except KeyError:
+            query = Query(kind=kind, tag=tag, children=self.get(kind=kind, tag=tag))
+            self._queries[key] = query
+            return query
+
+    def add_tags(self, child: 'GameObject', tags: Iterable[Hashable]):
+        """
+        Add tags to a child already in the container.
+
+        Example: ::
+
+            children.add_tags(enemy, ["alive"])
+        """
+        if isinstance(tags, (str, bytes)):
+            raise TypeError("You passed a string instead of an iterable, this probably isn't what you intended.\n\nTry making it a tuple.")
+        if _local.buffer is not None:
+            _local.buffer.defer(self.add_tags, child, tuple(tags))
+            return
+        if child not in self:
+            raise NotMyChildError()
+        self._index_tags(child, tags)
+        self._update_queries(child)
+
+    def remove_tags(self, child: 'GameObject', tags: Iterable[Hashable]):
+        """
+        Remove tags from a child in the container. Tags the child doesn't
+        have are ignored.
+
+        Example: ::
+
+            children.remove_tags(enemy, ["alive"])
+        """
+        if isinstance(tags, (str, bytes)):
+            raise TypeError("You passed a string instead of an iterable, this probably isn't what you intended.\n\nTry making it a tuple.")
+        if _local.buffer is not None:
+            _local.buffer.defer(self.remove_tags, child, tuple(tags))
+            return
+        if child not in self:
+            raise NotMyChildError()
+        child_tags = self._child_tags.get(child, _EMPTY)
+        for tag in tags:
+            if tag in child_tags:
+                child_tags.discard(tag)
+                members = self._tags[tag]
+                members.discard(child)
+                if not members:
+                    del self._tags[tag]
+        if not child_tags:
+            self._child_tags.pop(child, None)
+        self._update_queries(child)
+
+    def _update_queries(self, child):
+        if self._queries:
+            tags = self._child_tags.get(child, _EMPTY)
+            for query in self._queries.values():
+                query._update(child, tags)
+
+    def _remove_from_queries(self, child):
+        if self._queries:
+            for query in self._queries.values():
+                query._results.discard(child)
+
+    def add_observer(self, observer):
+        """
+        Have an object notified when children are added or removed, by calling
+        its ``child_added(child)`` and ``child_removed(child)`` methods.
+
+        Observers are not notified of the children already in the container.
+        """
+        self._observers.append(observer)
+
+    def remove_observer(self, observer):
+        """
+        Stop notifying an observer passed to :meth:`add_observer`.
+        """
+        self._observers.remove(observer)
+
+    def subscribers(self, handler_name: str) -> Iterable['GameObject']:
+        """
+        The children that have the named event handler, eg ``on_update``.
+
+        Based on the handlers defined by each child's class at the time it
+        was added. Safe to modify the container while iterating.
+        """
+        return _snapshot(self._handlers.get(handler_name, _EMPTY))
+
+    def branches(self) -> Iterable['GameObject']:
+        """
+        The children that currently have children of their own.
+        """
+        return _snapshot(self._branches)
+
+    def _members(self) -> Iterable:
+        """
+        Everything indexed by kind.
+        """
+        return self._all
+
+    def _kind_plan(self, cls: Type) -> Tuple[Type, ...]:
+        """
+        The kinds a child of the given class is indexed under.
+        """
+        if self._indexed_kinds is None:
+            return cls.__mro__
+        try:
+            return self._kind_plans[cls]
+        except KeyError:
+            plan = self._kind_plans[cls] = tuple(
+                kind for kind in cls.__mro__ if kind in self._indexed_kinds
+            )
+            return plan
+
+    def _index_kind(self, kind: Type):
+        """
+        Start indexing a kind, when indexing lazily.
+        """
+        self._kinds[kind] = {
+            child for child in self._members() if kind in type(child).__mro__
+        }
+        self._indexed_kinds.add(kind)
+        self._kind_plans.clear()
+
+    def _index_kinds(self, child):
+        for kind in self._kind_plan(type(child)):
+            self._kinds[kind].add(child)
+
+    def _unindex_kinds(self, child):
+        lazy = self._indexed_kinds is not None
+        for kind in self._kind_plan(type(child)):
+            members = self._kinds[kind]
+            members.remove(child)
+            if not members and not lazy:
+                del self._kinds[kind]
+
+    def _index_tags(self, child, tags):
+        child_tags = None
+        for tag in tags:
+            self._tags[tag].add(child)
+            if child_tags is None:
+                child_tags = self._child_tags.setdefault(child, set())
+            child_tags.add(tag)
+
+    def _unindex_tags(self, child):
+        for tag in self._child_tags.pop(child, ()):
+            members = self._tags[tag]
+            members.discard(child)
+            if not members:
+                del self._tags[tag]
+
+    def _index_handlers(self, child):
+        names = self._child_handlers[child] = _handler_names(type(child))
+        for name in names:
+            self._handlers[name].add(child)
+        self._link(child)
+
+    def _link(self, child):
+        """
+        Track if the child has children of its own.
+        """
+        grandchildren = getattr(child, 'children', None)
+        if isinstance(grandchildren, Children):
+            grandchildren._parent = weakref.ref(self), weakref.ref(child)
+            if grandchildren:
+                self._branches.add(child)
+
+    def _unindex_handlers(self, child):
+        for name in self._child_handlers.pop(child, ()):
+            subscribers = self._handlers.get(name)
+            if subscribers is not None:
+                subscribers.discard(child)
+                if not subscribers:
+                    del self._handlers[name]
+        self._unlink(child)
+
+    def _unlink(self, child):
+        self._branches.discard(child)
+        grandchildren = getattr(child, 'children', None)
+        if isinstance(grandchildren, Children) and grandchildren._parent is not None:
+            if grandchildren._parent[0]() is self:
+                grandchildren._parent = None
+
+    def _update_parent(self):
+        """
+        Let the container holding our owner know if we have children.
+        """
+        if self._parent is None:
+            return
+        container, owner = self._parent[0](), self._parent[1]()
+        if container is None or owner is None:
+            return
+        if self:
+            container._branches.add(owner)
+        else:
+            container._branches.discard(owner)
 
     def walk(self):
         """
@@ -134,7 +744,46 @@ class Children(Collection):
         """
         Generates all types of the children (including super types)
         """
-        yield from self._kinds
+        if self._indexed_kinds is None:
+            yield from self._kinds
+        else:
+            yield from dict.fromkeys(
+                kind for cls in {type(child) for child in self._members()} for kind in cls.__mro__
+            )
+
+
+class Query(Collection):
+    """
+    A live view of the children of a given kind and/or tag, kept up to date
+    by its :class:`Children`.
+
+    Get one from :meth:`Children.query`.
+    """
+    def __init__(self, *, kind: Type = None, tag: Hashable = None, children: Iterable = ()):
+        self.kind = kind
+        self.tag = tag
+        self._results = set(children)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} kind={self.kind!r} tag={self.tag!r} ({len(self)} objects)>"
+
+    def __contains__(self, item) -> bool:
+        return item in self._results
+
+    def __iter__(self) -> Iterator:
+        return _snapshot(self._results)
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def _update(self, child, tags):
+        if (
+            (self.kind is None or self.kind in type(child).__mro__)
+            and (self.tag is None or self.tag in tags)
+        ):
+            self._results.add(child)
+        else:
+            self._results.discard(child)
 
 
 class GameObject:
@@ -146,11 +795,20 @@ class GameObject:
     """
     #: The children of this object
     children: Children
+    #: Only index the kinds of children that are looked up. See
+    #: :class:`Children`.
+    lazy_kinds: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Done here rather than in a metaclass, so game objects can mix in
+        # abc.ABC, typing.Protocol, and other classes with metaclasses.
+        _handler_tables[cls] = _build_handler_table(cls)
 
     def __init__(self, **props):
         super().__init__()
 
-        self.children = Children()
+        self.children = Children(lazy_kinds=self.lazy_kinds)
         for k, v in props.items():
             setattr(self, k, v)
 
@@ -166,6 +824,18 @@ class GameObject:
         """
         return self.children.add(child, tags)
 
+    def add_many(self, children: Iterable['GameObject'], tags: Iterable = ()) -> List['GameObject']:
+        """
+        Shorthand for :meth:`Children.add_many()`
+        """
+        return self.children.add_many(children, tags)
+
+    def remove_many(self, children: Iterable['GameObject']) -> List['GameObject']:
+        """
+        Shorthand for :meth:`Children.remove_many()`
+        """
+        return self.children.remove_many(children)
+
     def get(self, *, kind: Type = None, tag: Hashable = None, **kwargs) -> Iterator:
         """
         Shorthand for :meth:`Children.get()`
@@ -178,6 +848,12 @@ class GameObject:
         """
         return self.children.remove(child)
 
+    def query(self, *, kind: Type = None, tag: Hashable = None) -> Query:
+        """
+        Shorthand for :meth:`Children.query()`
+        """
+        return self.children.query(kind=kind, tag=tag)
+
 
 def walk(root) -> Iterable[GameObject]:
     """
@@ -193,3 +869,35 @@ def walk(root) -> Iterable[GameObject]:
         yield cur
         if hasattr(cur, 'children'):
             q.extend(cur.children)
+
+
+def walk_subscribers(root, handler_name: str) -> Iterable[GameObject]:
+    """
+    Conducts a walk of the GOM tree from the root, only producing the objects
+    that have the named event handler.
+
+    Like :func:`walk`, goes breadth-first, so every object comes after the
+    objects at shallower depths; the order within a depth may differ. Uses the
+    handler index of :class:`Children` to skip objects without the handler,
+    and only descends into objects that have children. Handlers are looked up
+    on the class; handlers assigned to instances are not seen.
+
+    Includes the root.
+
+    Is non-recursive.
+    """
+    if handler_name in _handler_names(type(root)):
+        yield root
+    q = deque([root])
+    while q:
+        cur = q.popleft()
+        children = getattr(cur, 'children', None)
+        if isinstance(children, Children):
+            yield from children.subscribers(handler_name)
+            q.extend(children.branches())
+        elif children is not None:
+            # Not indexed, so check everything
+            for child in children:
+                if handler_name in _handler_names(type(child)):
+                    yield child
+                q.append(child)
@@ -0,0 +1,120 @@
+"""
+Running the engine without a window, sound, or input, as fast as possible.
+
+:class:`HeadlessEngine` replaces wall clock time with a :class:`VirtualClock`
+that advances by exactly one :class:`~ppb.systems.Updater` time step per loop,
+so hours of game time can be simulated in seconds. Useful for tests, balancing
+runs, and other simulations: ::
+
+   with HeadlessEngine(MyScene, max_time=3600) as engine:
+       engine.run()
+"""
+from typing import Type
+from typing import Union
+
+from ppb.assetlib import AssetLoadingSystem
+from ppb.engine import GameEngine
+from ppb.scenes import Scene
+from ppb.systems import Updater
+from ppb.utils import set_clock
+
+__all__ = 'VirtualClock', 'HeadlessEngine',
+
+
+class VirtualClock:
+    """
+    A clock that only moves when told to.
+
+    Call it to get the current time.
+    """
+    def __init__(self, start: float = 0.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        """
+        Move the clock forward.
+        """
+        self.now += seconds
+
+
+class HeadlessEngine(GameEngine):
+    """
+    A :class:`~ppb.GameEngine` using a :class:`VirtualClock`.
+
+    Each loop advances the clock by one ``time_step``, so the
+    :class:`~ppb.systems.Updater` produces exactly one
+    :class:`~ppb.events.Update` per loop. By default, no Renderer,
+    EventPoller, or SoundController is used.
+
+    While the engine is entered, :func:`ppb.get_time` reads the virtual clock.
+    Loops never wait, so ``frame_pacing`` is ignored.
+    """
+    def __init__(self, first_scene: Union[Type, Scene], *,
+                 basic_systems=(Updater, AssetLoadingSystem),
+                 time_step: float = 0.016, max_time: float = None, **kwargs):
+        """
+        :param first_scene: A :class:`~ppb.Scene` type.
+        :type first_scene: Union[Type, scenes.Scene]
+        :param basic_systems: :class:`systemslib.Systems` that are considered
+           the "default". Includes: :class:`~systems.Updater` and
+           :class:`~systems.AssetLoadingSystem`.
+        :param time_step: Game seconds per loop. Passed on to the Updater.
+        :type time_step: float
+        :param max_time: Stop once this many game seconds have passed. If
+           ``None``, runs until a :class:`~ppb.events.Quit`.
+        :type max_time: float
+        :param kwargs: Passed on to :class:`~ppb.GameEngine`.
+        """
+        super().__init__(first_scene, basic_systems=basic_systems,
+                         time_step=time_step, **kwargs)
+        self.time_step = time_step
+        self.max_time = max_time
+        #: The virtual clock.
+        self.clock = VirtualClock()
+        #: The number of loops run.
+        self.steps = 0
+        self._previous_clock = None
+
+    def __enter__(self):
+        self._previous_clock = set_clock(self.clock)
+        try:
+            return super().__enter__()
+        except:  # noqa
+            set_clock(self._previous_clock)
+            raise
+
+    def __exit__(self, *exc):
+        try:
+            super().__exit__(*exc)
+        finally:
+            set_clock(self._previous_clock)
+
+    def main_loop(self):
+        """
+        Loop until stopped, without waiting between loops.
+
+        Waiting for a deadline on the virtual clock would never end, since it
+        only moves in :meth:`loop_once`.
+        """
+        while self.running:
+            self.loop_once()
+
+    @property
+    def elapsed(self) -> float:
+        """
+        The game seconds passed since the engine was created.
+        """
+        return self.clock.now
+
+    def loop_once(self):
+        """
+        Advance the clock by one time step and iterate once.
+        """
+        self.clock.advance(self.time_step)
+        super().loop_once()
+        self.steps += 1
+        if self.max_time is not None and self.clock.now >= self.max_time:
+            self.running = False
@@ -1,9 +1,121 @@
+from bisect import insort
 from typing import Callable
+from typing import Dict
 from typing import Iterator
+from typing import List
 from typing import Sequence
+import weakref
 
 from ppb.camera import Camera
 from ppb.gomlib import GameObject
+from ppb.sprites import LayerAttribute
+from ppb.sprites import _layer_watchers
+
+_layer_tracking = weakref.WeakKeyDictionary()
+
+
+def _tracks_layer(cls) -> bool:
+    """
+    Does the class tell watchers when its layer changes?
+    """
+    try:
+        return _layer_tracking[cls]
+    except KeyError:
+        for klass in cls.__mro__:
+            if 'layer' in klass.__dict__:
+                tracks = isinstance(klass.__dict__['layer'], LayerAttribute)
+                break
+        else:
+            tracks = False
+        _layer_tracking[cls] = tracks
+        return tracks
+
+
+class RenderOrder:
+    """
+    The children of a scene in ascending layer order, kept up to date as
+    children are added and removed and as their layers change.
+
+    Children whose layer is a :class:`~ppb.sprites.LayerAttribute` (any
+    :class:`~ppb.sprites.BaseSprite`) are kept in per-layer buckets, in the
+    order they were added. The layers of other children are read again every
+    time the order is asked for.
+    """
+    def __init__(self):
+        self._buckets: Dict[object, Dict] = {}
+        self._layers: List = []
+        self._layer_of = {}
+        self._untracked = {}
+
+    def __len__(self):
+        return len(self._layer_of) + len(self._untracked)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.sprites())
+
+    def sprites(self) -> List:
+        """
+        The children, sorted by layer.
+        """
+        buckets = self._buckets
+        if not self._untracked:
+            return [sprite for layer in self._layers for sprite in buckets[layer]]
+
+        untracked = sorted(self._untracked, key=lambda s: getattr(s, 'layer', 0))
+        result = []
+        i = 0
+        for layer in self._layers:
+            while i < len(untracked) and getattr(untracked[i], 'layer', 0) < layer:
+                result.append(untracked[i])
+                i += 1
+            result.extend(buckets[layer])
+        result.extend(untracked[i:])
+        return result
+
+    def child_added(self, child):
+        if _tracks_layer(type(child)):
+            _layer_watchers.setdefault(child, []).append(self)
+            self._insert(child, child.layer)
+        else:
+            self._untracked[child] = None
+
+    def child_removed(self, child):
+        try:
+            layer = self._layer_of.pop(child)
+        except KeyError:
+            del self._untracked[child]
+        else:
+            self._discard(child, layer)
+            watchers = _layer_watchers[child]
+            watchers.remove(self)
+            if not watchers:
+                del _layer_watchers[child]
+
+    def layer_changed(self, child, layer):
+        try:
+            old = self._layer_of[child]
+        except KeyError:
+            # Not one of ours
+            return
+        if layer == old:
+            return
+        self._discard(child, old)
+        self._insert(child, layer)
+
+    def _insert(self, child, layer):
+        bucket = self._buckets.get(layer)
+        if bucket is None:
+            bucket = self._buckets[layer] = {}
+            insort(self._layers, layer)
+        bucket[child] = None
+        self._layer_of[child] = layer
+
+    def _discard(self, child, layer):
+        bucket = self._buckets[layer]
+        del bucket[child]
+        if not bucket:
+            del self._buckets[layer]
+            self._layers.remove(layer)
 
 
 class Scene(GameObject):
@@ -11,9 +123,16 @@ class Scene(GameObject):
     background_color: Sequence[int] = (0, 0, 100)
     camera_class = Camera
     show_cursor = True
+    #: A spatial index of the sprites in the scene, if one is attached. See
+    #: :class:`ppb.features.spatial.SpatialHash`.
+    spatial_index = None
 
     def __init__(self, *, set_up: Callable = None, **props):
         super().__init__(**props)
+        self._render_order = RenderOrder()
+        for child in self.children:
+            self._render_order.child_added(child)
+        self.children.add_observer(self._render_order)
 
         if set_up is not None:
             set_up(self)
@@ -43,5 +162,9 @@ class Scene(GameObject):
 
         This function exists primarily to assist the Renderer subsystem,
         but will be left public for other creative uses.
+
+        The order is kept up to date as sprites are added and removed, instead
+        of sorted every time. Within a layer, sprites are in the order they
+        were added.
         """
-        return sorted(self, key=lambda s: getattr(s, "layer", 0))
+        return self._render_order.sprites()
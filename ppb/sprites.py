@@ -19,6 +19,7 @@ If you don't need the built in features of :class:`~ppb.Sprite` see
 from inspect import getfile
 from pathlib import Path
 from typing import Union
+import weakref
 
 from ppb_vector import Vector, VectorLike
 
@@ -36,6 +37,46 @@ __all__ = (
 )
 
 
+#: The objects to tell when the layer of a sprite changes, by sprite. Kept out
+#: of the sprites themselves so copies don't share them.
+_layer_watchers = weakref.WeakKeyDictionary()
+
+
+class LayerAttribute:
+    """
+    The descriptor behind :attr:`BaseSprite.layer`.
+
+    Tells any interested scenes when the layer of a sprite changes, so they can
+    keep their render order without sorting every frame.
+    """
+    def __init__(self, default=0):
+        self.default = default
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self.default
+        return obj.__dict__.get('layer', self.default)
+
+    def __set__(self, obj, value):
+        attrs = obj.__dict__
+        old = attrs.get('layer', self.default)
+        attrs['layer'] = value
+        if value != old:
+            self._notify(obj, value)
+
+    def __delete__(self, obj):
+        old = obj.__dict__.pop('layer')
+        if old != self.default:
+            self._notify(obj, self.default)
+
+    @staticmethod
+    def _notify(obj, layer):
+        watchers = _layer_watchers.get(obj)
+        if watchers:
+            for watcher in list(watchers):
+                watcher.layer_changed(obj, layer)
+
+
 class BaseSprite(ppb.gomlib.GameObject):
     """
     The base Sprite class. All sprites should inherit from this (directly or
@@ -52,7 +93,14 @@ class BaseSprite(ppb.gomlib.GameObject):
     #: (:py:class:`ppb.Vector`): Location of the sprite
     position: Vector = Vector(0, 0)
     #: The layer a sprite exists on.
-    layer: int = 0
+    layer: int = LayerAttribute(0)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Keep layer a LayerAttribute when subclasses give it a new default
+        layer = cls.__dict__.get('layer')
+        if layer is not None and not hasattr(layer, '__get__'):
+            cls.layer = LayerAttribute(layer)
 
     def __init__(self, **props):
         """
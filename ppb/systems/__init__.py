@@ -1,10 +1,11 @@
 from ppb.systems.inputs import EventPoller
 from ppb.systems.renderer import Renderer, Image
+from ppb.systems.offscreen import OffscreenRenderer
 from ppb.systems.clocks import Updater
 from ppb.systems.sound import SoundController, Sound
 from ppb.systems.text import Font, Text
 
 __all__ = (
-    'EventPoller', 'Renderer', 'Image', 'Updater', 'SoundController', 'Sound',
+    'EventPoller', 'Renderer', 'OffscreenRenderer', 'Image', 'Updater', 'SoundController', 'Sound',
     'Font', 'Text',
 )
@@ -0,0 +1,257 @@
+"""
+Texture atlases: many small images packed into a few large textures, so the
+renderer can draw them without switching textures.
+
+Used by :class:`~ppb.systems.Renderer` when created with ``atlas=True``.
+"""
+import ctypes
+import weakref
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from sdl2 import (
+    SDL_Rect,
+    SDL_BLENDMODE_NONE,
+    SDL_PIXELFORMAT_RGBA32,
+    SDL_BlitSurface,  # https://wiki.libsdl.org/SDL_BlitSurface
+    SDL_CreateRGBSurfaceWithFormat,  # https://wiki.libsdl.org/SDL_CreateRGBSurfaceWithFormat
+    SDL_FreeSurface,  # https://wiki.libsdl.org/SDL_FreeSurface
+    SDL_GetSurfaceBlendMode,  # https://wiki.libsdl.org/SDL_GetSurfaceBlendMode
+    SDL_QueryTexture,  # https://wiki.libsdl.org/SDL_QueryTexture
+    SDL_SetSurfaceBlendMode,  # https://wiki.libsdl.org/SDL_SetSurfaceBlendMode
+    SDL_UpdateTexture,  # https://wiki.libsdl.org/SDL_UpdateTexture
+)
+
+from ppb.systems._utils import ObjectSideData
+from ppb.systems.sdl_utils import sdl_call, is_negative, is_null
+
+__all__ = 'ShelfPacker', 'AtlasRegion', 'TextureAtlas'
+
+
+class ShelfPacker:
+    """
+    Packs rectangles into a fixed area, in rows ("shelves") as tall as the
+    tallest rectangle placed in them.
+
+    Simple and fast, and wastes little space when the rectangles are of
+    similar heights.
+    """
+    def __init__(self, width: int, height: int, padding: int = 0):
+        self.width = width
+        self.height = height
+        self.padding = padding
+        # (y, height, next free x) of each shelf
+        self._shelves: List[List[int]] = []
+
+    def insert(self, width: int, height: int) -> Optional[Tuple[int, int]]:
+        """
+        Find a place for a rectangle.
+
+        :return: The position of its top left corner, or None if it doesn't fit.
+        """
+        padding = self.padding
+        padded_width = width + padding
+        padded_height = height + padding
+        for shelf in self._shelves:
+            y, shelf_height, x = shelf
+            if height <= shelf_height and x + width <= self.width:
+                shelf[2] = x + padded_width
+                return x, y
+        if self._shelves:
+            y, shelf_height, _ = self._shelves[-1]
+            y += shelf_height + padding
+        else:
+            y = 0
+        if y + height > self.height or width > self.width:
+            return None
+        self._shelves.append([y, height, padded_width])
+        return 0, y
+
+
+class AtlasRegion:
+    """
+    Part of an atlas page, holding one image.
+
+    Has the same interface as :class:`~ppb.systems.renderer.Texture`, so the
+    renderer can draw it like one.
+    """
+    def __init__(self, page: '_Page', x: int, y: int, width: int, height: int):
+        self.page = page
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+    @property
+    def base(self):
+        """
+        The texture of the page.
+        """
+        return self.page.texture
+
+    @property
+    def inner(self):
+        return self.page.texture.inner
+
+
+class _Page:
+    def __init__(self, atlas: 'TextureAtlas', group: Hashable):
+        width, height = atlas.size
+        # Weak, so regions and pages don't keep the atlas (and its renderer) alive
+        self._atlas = weakref.ref(atlas)
+        self.group = group
+        self.packer = ShelfPacker(width, height, atlas.padding)
+        self.surface = sdl_call(
+            SDL_CreateRGBSurfaceWithFormat, 0, width, height, 32, SDL_PIXELFORMAT_RGBA32,
+            _check_error=is_null
+        )
+        self._texture = None
+        self._texture_format = None
+
+    def __del__(self, _SDL_FreeSurface=SDL_FreeSurface):
+        _SDL_FreeSurface(self.surface)
+
+    @property
+    def texture(self):
+        # Made on first use, and again if an image can't be copied into it.
+        if self._texture is None:
+            atlas = self._atlas()
+            if atlas is None or atlas.closed:
+                raise RuntimeError("The texture atlas is closed")
+            self._texture = atlas.make_texture(self.surface)
+            atlas.uploads += 1
+            texture_format = ctypes.c_uint32()
+            sdl_call(
+                SDL_QueryTexture, self._texture.inner, ctypes.byref(texture_format), None, None, None,
+                _check_error=is_negative
+            )
+            self._texture_format = texture_format.value
+        return self._texture
+
+    def add(self, surface) -> Optional[AtlasRegion]:
+        width = surface.contents.w
+        height = surface.contents.h
+        position = self.packer.insert(width, height)
+        if position is None:
+            return None
+        x, y = position
+        rect = SDL_Rect(x, y, width, height)
+
+        # Copy the pixels exactly, instead of blending them onto the page.
+        blend_mode = ctypes.c_int()
+        sdl_call(SDL_GetSurfaceBlendMode, surface, ctypes.byref(blend_mode), _check_error=is_negative)
+        sdl_call(SDL_SetSurfaceBlendMode, surface, SDL_BLENDMODE_NONE, _check_error=is_negative)
+        try:
+            sdl_call(
+                SDL_BlitSurface, surface, None, self.surface,
+                ctypes.byref(SDL_Rect(x, y, width, height)),
+                _check_error=is_negative
+            )
+        finally:
+            sdl_call(SDL_SetSurfaceBlendMode, surface, blend_mode.value, _check_error=is_negative)
+
+        page = self.surface.contents
+        if self._texture is not None and self._texture_format == page.format.contents.format:
+            # Upload just the new image, keeping the texture and its modulation.
+            pitch = page.pitch
+            pixels = ctypes.c_void_p(page.pixels + y * pitch + x * 4)
+            sdl_call(
+                SDL_UpdateTexture, self._texture.inner, ctypes.byref(rect), pixels, pitch,
+                _check_error=is_negative
+            )
+        else:
+            self._texture = None
+        return AtlasRegion(self, x, y, width, height)
+
+
+class TextureAtlas:
+    """
+    Packs surfaces into pages of a fixed size, one texture per page.
+
+    Images are only put on pages of the same group, as decided by the
+    ``group`` function. Images bigger than :attr:`max_image_size` in either
+    direction aren't packed.
+
+    Space isn't reclaimed when images are freed.
+    """
+    def __init__(
+        self, make_texture: Callable, *, size: Tuple[int, int] = (1024, 1024),
+        padding: int = 1, max_image_size: int = 256, group: Callable = None,
+    ):
+        """
+        :param make_texture: Called with an SDL surface to make the texture
+           for a page.
+        :param size: The size of each page in pixels.
+        :param padding: Empty pixels between images, to keep them from
+           bleeding into each other when scaled.
+        :param max_image_size: The largest width or height of image to pack.
+        :param group: Called with an image asset, returns a hashable key.
+           Images with different keys go on different pages.
+        """
+        self.make_texture = make_texture
+        self.size = size
+        self.padding = padding
+        self.max_image_size = min(max_image_size, *size)
+        self.group = group
+        #: The number of times page textures have been made
+        self.uploads = 0
+        #: True once :meth:`close` is called
+        self.closed = False
+        self._pages: Dict[Hashable, List[_Page]] = {}
+        self._regions = ObjectSideData()
+
+    def __len__(self):
+        return len(self._regions)
+
+    def close(self):
+        """
+        Free the page textures. Must be called before their renderer is
+        destroyed.
+        """
+        self.closed = True
+        for pages in self._pages.values():
+            for page in pages:
+                page._texture = None
+        self._pages.clear()
+        self._regions.clear()
+
+    @property
+    def pages(self) -> int:
+        """
+        The number of pages in use.
+        """
+        return sum(len(pages) for pages in self._pages.values())
+
+    def region(self, asset, surface) -> Optional[AtlasRegion]:
+        """
+        The region holding a surface loaded from an asset, packing it if it
+        isn't already.
+
+        :return: The region, or None if the image isn't suitable for packing.
+        """
+        if self.closed:
+            raise RuntimeError("The texture atlas is closed")
+        try:
+            return self._regions[surface]
+        except KeyError:
+            pass
+        contents = surface.contents
+        if contents.w > self.max_image_size or contents.h > self.max_image_size:
+            region = None
+        else:
+            group = self.group(asset) if self.group is not None else None
+            pages = self._pages.setdefault(group, [])
+            for page in pages:
+                region = page.add(surface)
+                if region is not None:
+                    break
+            else:
+                page = _Page(self, group)
+                pages.append(page)
+                region = page.add(surface)
+        self._regions[surface] = region
+        return region
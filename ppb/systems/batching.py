@@ -0,0 +1,147 @@
+"""
+Batched drawing: many textured quads sent to SDL in one call.
+
+Used by :class:`~ppb.systems.Renderer` when created with
+``batch_geometry=True``. Needs SDL 2.0.18 or newer, for
+``SDL_RenderGeometryRaw``.
+"""
+from array import array
+import ctypes
+from math import cos, radians, sin
+from typing import Callable
+
+import sdl2
+from sdl2 import SDL_Color, SDL_version, SDL_GetVersion
+
+from ppb.systems.sdl_utils import fast_sdl_call, is_negative
+
+__all__ = 'GeometryBatch', 'geometry_supported'
+
+
+def geometry_supported() -> bool:
+    """
+    Can the SDL in use draw geometry?
+    """
+    if not hasattr(sdl2, 'SDL_RenderGeometryRaw'):
+        return False
+    version = SDL_version()
+    SDL_GetVersion(ctypes.byref(version))
+    return (version.major, version.minor, version.patch) >= (2, 0, 18)
+
+
+class GeometryBatch:
+    """
+    Collects quads drawn from the same texture with the same blend mode, and
+    draws them together.
+
+    Draw order is kept: adding a quad with a different texture or blend mode
+    draws the quads collected so far first. Textures from a
+    :class:`~ppb.systems.atlas.TextureAtlas` share a texture, so they batch
+    together.
+    """
+    def __init__(self, renderer, prepare: Callable):
+        """
+        :param renderer: The SDL renderer to draw with.
+        :param prepare: Called with a texture and a blend mode before drawing
+           from the texture, to set it up.
+        """
+        self.renderer = renderer
+        self.prepare = prepare
+        #: The number of draw calls made
+        self.draws = 0
+        self._texture = None
+        self._blend_mode = None
+        self._count = 0
+        self._xy = array('f')
+        self._uv = array('f')
+        self._colors = array('B')
+        self._indices = array('i')
+
+    def __len__(self):
+        return self._count
+
+    def add(self, texture, blend_mode, color, src_rect, dest_rect, angle: float):
+        """
+        Add a quad.
+
+        :param texture: The :class:`~ppb.systems.renderer.Texture` or
+           :class:`~ppb.systems.atlas.AtlasRegion` to draw.
+        :param blend_mode: The SDL blend mode to draw with.
+        :param color: The (red, green, blue, alpha) to modulate the texture by.
+        :param src_rect: The part of the texture to draw, an ``SDL_Rect``.
+        :param dest_rect: Where to draw it, an ``SDL_Rect``.
+        :param angle: Degrees clockwise to rotate around the center of
+           ``dest_rect``, like ``SDL_RenderCopyEx``.
+        """
+        base = texture.base
+        if base is not self._texture or blend_mode != self._blend_mode:
+            self.flush()
+            self._texture = base
+            self._blend_mode = blend_mode
+
+        half_w = dest_rect.w / 2
+        half_h = dest_rect.h / 2
+        cx = dest_rect.x + half_w
+        cy = dest_rect.y + half_h
+        if angle:
+            theta = radians(angle)
+            c = cos(theta)
+            s = sin(theta)
+            # The corners' offsets from the center, rotated
+            xc = half_w * c
+            xs = half_w * s
+            yc = half_h * c
+            ys = half_h * s
+            self._xy.extend((
+                cx - xc + ys, cy - xs - yc,
+                cx + xc + ys, cy + xs - yc,
+                cx + xc - ys, cy + xs + yc,
+                cx - xc - ys, cy - xs + yc,
+            ))
+        else:
+            left = cx - half_w
+            right = cx + half_w
+            top = cy - half_h
+            bottom = cy + half_h
+            self._xy.extend((left, top, right, top, right, bottom, left, bottom))
+
+        u0 = src_rect.x / base.width
+        v0 = src_rect.y / base.height
+        u1 = (src_rect.x + src_rect.w) / base.width
+        v1 = (src_rect.y + src_rect.h) / base.height
+        self._uv.extend((u0, v0, u1, v0, u1, v1, u0, v1))
+        self._colors.extend(color * 4)
+        self._count += 1
+
+    def flush(self):
+        """
+        Draw the quads collected.
+        """
+        count = self._count
+        if not count:
+            return
+        self.prepare(self._texture, self._blend_mode)
+
+        indices = self._indices
+        if len(indices) < count * 6:
+            for first in range(len(indices) // 6 * 4, count * 4, 4):
+                indices.extend((first, first + 1, first + 2, first, first + 2, first + 3))
+
+        vertices = count * 4
+        xy = (ctypes.c_float * (vertices * 2)).from_buffer(self._xy)
+        uv = (ctypes.c_float * (vertices * 2)).from_buffer(self._uv)
+        colors = (SDL_Color * vertices).from_buffer(self._colors)
+        fast_sdl_call(
+            sdl2.SDL_RenderGeometryRaw, self.renderer, self._texture.inner,
+            xy, 8, colors, 4, uv, 8, vertices,
+            indices.buffer_info()[0], count * 6, 4,
+            _check_error=is_negative
+        )
+        # Release the buffers so the arrays can be resized
+        del xy, uv, colors
+
+        self.draws += 1
+        self._count = 0
+        del self._xy[:]
+        del self._uv[:]
+        del self._colors[:]
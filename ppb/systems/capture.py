@@ -0,0 +1,299 @@
+"""
+Recording rendered frames without slowing the game down.
+
+Give the :class:`~ppb.systems.Renderer` a :class:`FrameCapture`, and after
+drawing every :attr:`~FrameCapture.every` frames it copies the picture into a
+reusable buffer and queues it. A background thread hands queued frames to a
+writer, which saves them as an image sequence (:class:`ImageSequenceWriter`)
+or a raw video stream (:class:`RawVideoWriter`). ::
+
+    capture = FrameCapture(RawVideoWriter("gameplay.rgba"), every=2)
+    ppb.run(setup, frame_capture=capture)
+
+If the writer falls behind and the queue is full, frames are dropped rather
+than making the renderer wait.
+
+Raw video can be converted with ffmpeg: ::
+
+    ffmpeg -f rawvideo -pix_fmt rgba -s 800x600 -r 15 -i gameplay.rgba gameplay.mp4
+"""
+from collections import deque
+import ctypes
+from dataclasses import dataclass
+import logging
+from pathlib import Path
+import struct
+import threading
+from typing import BinaryIO
+from typing import Tuple
+from typing import Union
+import zlib
+
+from sdl2 import (
+    SDL_PIXELFORMAT_RGBA32,
+    SDL_GetRendererOutputSize,  # https://wiki.libsdl.org/SDL_GetRendererOutputSize
+    SDL_RenderReadPixels,  # https://wiki.libsdl.org/SDL_RenderReadPixels
+)
+
+from ppb.systems.sdl_utils import fast_sdl_call, is_negative
+
+__all__ = 'Frame', 'FrameCapture', 'ImageSequenceWriter', 'RawVideoWriter'
+
+logger = logging.getLogger(__name__)
+
+#: Drop the oldest queued frame to make room for a new one
+DROP_OLDEST = 'oldest'
+#: Drop the new frame
+DROP_NEWEST = 'newest'
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return (
+        struct.pack('>I', len(data)) + kind + data
+        + struct.pack('>I', zlib.crc32(kind + data))
+    )
+
+
+@dataclass(frozen=True)
+class Frame:
+    """
+    A copy of a rendered frame.
+    """
+    width: int  #: In pixels
+    height: int  #: In pixels
+    #: The pixels, as rows of red, green, blue, alpha bytes from the top down.
+    pixels: bytes
+
+    def pixel(self, x: int, y: int) -> Tuple[int, int, int, int]:
+        """
+        The (red, green, blue, alpha) of a pixel, counting from the top left.
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"({x}, {y}) is outside the {self.width}x{self.height} frame")
+        offset = (y * self.width + x) * 4
+        return tuple(self.pixels[offset:offset + 4])
+
+    def to_png(self, compression: int = 6) -> bytes:
+        """
+        Encode the frame as a PNG.
+
+        :param compression: The zlib compression level, 0 (none) to 9 (best).
+        """
+        stride = self.width * 4
+        # Each row starts with its filter type, 0 for none
+        raw = b''.join(
+            b'\0' + self.pixels[offset:offset + stride]
+            for offset in range(0, stride * self.height, stride)
+        )
+        return b''.join([
+            b'\x89PNG\r\n\x1a\n',
+            # 8 bits per channel, RGBA, default compression/filter/interlace
+            _png_chunk(b'IHDR', struct.pack('>IIBBBBB', self.width, self.height, 8, 6, 0, 0, 0)),
+            _png_chunk(b'IDAT', zlib.compress(raw, compression)),
+            _png_chunk(b'IEND', b''),
+        ])
+
+    def save(self, path: Union[str, Path], compression: int = 6):
+        """
+        Write the frame to a PNG file.
+        """
+        Path(path).write_bytes(self.to_png(compression))
+
+
+class ImageSequenceWriter:
+    """
+    Writes each frame to its own PNG file.
+    """
+    def __init__(self, directory: Union[str, Path], pattern: str = 'frame-{:06d}.png', compression: int = 1):
+        """
+        :param directory: Where to write the files. Made if it doesn't exist.
+        :param pattern: The file name, formatted with the frame number.
+        :param compression: The zlib compression level, 0 (none) to 9 (best).
+        """
+        self.directory = Path(directory)
+        self.pattern = pattern
+        self.compression = compression
+
+    def write(self, number: int, frame: Frame):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        frame.save(self.directory / self.pattern.format(number), self.compression)
+
+    def close(self):
+        pass
+
+
+class RawVideoWriter:
+    """
+    Writes the pixels of each frame, one after another, to a file or stream.
+
+    The result has no header: each frame is width * height * 4 bytes of RGBA.
+    """
+    def __init__(self, destination: Union[str, Path, BinaryIO]):
+        """
+        :param destination: A path, or a binary file object (like the stdin
+           of an encoder process). File objects aren't closed.
+        """
+        self.destination = destination
+        self._file = None
+
+    def write(self, number: int, frame: Frame):
+        if self._file is None:
+            if isinstance(self.destination, (str, Path)):
+                self._file = open(self.destination, 'wb')
+            else:
+                self._file = self.destination
+        self._file.write(frame.pixels)
+
+    def close(self):
+        if self._file is not None and self._file is not self.destination:
+            self._file.close()
+        elif self._file is not None:
+            self._file.flush()
+        self._file = None
+
+
+class FrameCapture:
+    """
+    Copies rendered frames, and writes them on a background thread.
+
+    A writer is any object with ``write(number, frame)`` and ``close()``
+    methods. ``write`` is called on the background thread with the number of
+    the frame (counting every frame rendered) and a :class:`Frame`. The
+    frame's buffer is reused once ``write`` returns, so don't keep it.
+    """
+    def __init__(self, writer, *, every: int = 1, queue_size: int = 4, drop: str = DROP_OLDEST):
+        """
+        :param writer: Saves the frames.
+        :param every: Capture one in this many frames.
+        :param queue_size: How many frames can wait for the writer.
+        :param drop: When the queue is full, drop the oldest frame waiting
+           (``'oldest'``) or the new one (``'newest'``).
+        """
+        if every < 1:
+            raise ValueError("every must be at least 1")
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+        if drop not in (DROP_OLDEST, DROP_NEWEST):
+            raise ValueError(f"drop must be {DROP_OLDEST!r} or {DROP_NEWEST!r}, not {drop!r}")
+        self.writer = writer
+        self.every = every
+        self.queue_size = queue_size
+        self.drop = drop
+        #: Frames rendered while capturing
+        self.frames = 0
+        #: Frames copied and queued
+        self.captured = 0
+        #: Frames dropped because the queue was full
+        self.dropped = 0
+        #: Frames written
+        self.written = 0
+
+        self._size = None
+        self._allocated = 0
+        self._free = []
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = None
+        self._width = ctypes.c_int()
+        self._height = ctypes.c_int()
+
+    def start(self):
+        """
+        Start the writing thread. Done by the renderer.
+        """
+        if self._thread is not None:
+            return
+        self._closed = False
+        self._thread = threading.Thread(target=self._work, name='ppb-frame-capture', daemon=True)
+        self._thread.start()
+
+    def close(self):
+        """
+        Write the frames still queued, and stop the writing thread.
+        """
+        if self._thread is None:
+            return
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        self._thread = None
+
+    def frame_rendered(self, renderer):
+        """
+        Called by the renderer with its SDL renderer after drawing a frame,
+        before presenting it. Ignored unless started.
+        """
+        if self._thread is None:
+            return
+        number = self.frames
+        self.frames += 1
+        if number % self.every:
+            return
+
+        fast_sdl_call(
+            SDL_GetRendererOutputSize, renderer, ctypes.byref(self._width), ctypes.byref(self._height),
+            _check_error=is_negative
+        )
+        width = self._width.value
+        height = self._height.value
+        buffer = self._acquire(width, height)
+        if buffer is None:
+            self.dropped += 1
+            return
+
+        fast_sdl_call(
+            SDL_RenderReadPixels, renderer, None, SDL_PIXELFORMAT_RGBA32,
+            (ctypes.c_char * len(buffer)).from_buffer(buffer), width * 4,
+            _check_error=is_negative
+        )
+        with self._condition:
+            self._queue.append((number, Frame(width, height, buffer)))
+            self._condition.notify_all()
+        self.captured += 1
+
+    def _acquire(self, width, height):
+        """
+        Get a buffer to copy a frame into, or None to drop the frame.
+        """
+        with self._condition:
+            if self._size != (width, height):
+                # Buffers of the old size are thrown away as they come back
+                self._size = width, height
+                self._free.clear()
+                self._allocated = 0
+            if self._free:
+                return self._free.pop()
+            # One more than the queue, for the frame being written
+            if self._allocated <= self.queue_size:
+                self._allocated += 1
+                return bytearray(width * height * 4)
+            if self.drop == DROP_OLDEST and self._queue:
+                _, frame = self._queue.popleft()
+                self.dropped += 1
+                if (frame.width, frame.height) == self._size:
+                    return frame.pixels
+            return None
+
+    def _work(self):
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if not self._queue:
+                    break
+                number, frame = self._queue.popleft()
+            try:
+                self.writer.write(number, frame)
+            except Exception:
+                logger.exception("Failed to write frame %d", number)
+            else:
+                self.written += 1
+            with self._condition:
+                if (frame.width, frame.height) == self._size:
+                    self._free.append(frame.pixels)
+        try:
+            self.writer.close()
+        except Exception:
+            logger.exception("Failed to close frame writer")
@@ -2,12 +2,72 @@
 This module performs time keeping of subsystems 
 """
 
+from collections import deque
 import time
 
 import ppb
 import ppb.events as events
 from ppb.systemslib import System
 
+# Absorbs floating point error when time advances in exact steps, eg with a
+# VirtualClock.
+_EPSILON = 1e-9
+
+
+class FramePacer:
+    """
+    Waits for deadlines, as used by :meth:`GameEngine.main_loop()
+    <ppb.engine.GameEngine.main_loop>` when frame pacing is enabled.
+
+    Sleeps until shortly before the deadline, and then spins for the
+    remainder, since :func:`time.sleep` tends to oversleep.
+    """
+    def __init__(self, spin_time=0.002, history=120):
+        """
+        :param spin_time: How long before a deadline to stop sleeping and start
+           spinning, in seconds.
+        :param history: How many measurements of jitter to keep.
+        """
+        self.spin_time = spin_time
+        #: How late each of the recent waits woke up, in seconds.
+        self.jitter = deque(maxlen=history)
+
+    def wait(self, deadline):
+        """
+        Wait until the given time, as given by :func:`ppb.get_time`.
+
+        If the deadline is ``None``, just yields to other threads.
+        """
+        if deadline is None:
+            time.sleep(0)
+            return
+        remaining = deadline - ppb.get_time()
+        if remaining <= 0:
+            return
+        if remaining > self.spin_time:
+            time.sleep(remaining - self.spin_time)
+        now = ppb.get_time()
+        while now < deadline:
+            time.sleep(0)
+            now = ppb.get_time()
+        self.jitter.append(now - deadline)
+
+    @property
+    def mean_jitter(self):
+        """
+        The average of the recent jitter measurements, in seconds.
+        """
+        if not self.jitter:
+            return 0.0
+        return sum(self.jitter) / len(self.jitter)
+
+    @property
+    def max_jitter(self):
+        """
+        The largest of the recent jitter measurements, in seconds.
+        """
+        return max(self.jitter, default=0.0)
+
 
 class Updater(System):
 
@@ -20,13 +80,21 @@ class Updater(System):
     def __enter__(self):
         self.start_time = ppb.get_time()
 
+    def next_deadline(self):
+        """
+        The time the next :class:`~ppb.events.Update` is due.
+        """
+        if self.last_tick is None:
+            return None
+        return self.last_tick + self.time_step - self.accumulated_time
+
     def on_idle(self, idle_event: events.Idle, signal):
         if self.last_tick is None:
             self.last_tick = ppb.get_time()
         this_tick = ppb.get_time()
         self.accumulated_time += this_tick - self.last_tick
         self.last_tick = this_tick
-        while self.accumulated_time >= self.time_step:
+        while self.accumulated_time + _EPSILON >= self.time_step:
             # This might need to change for the Idle event system to signal _only_ once per idle event.
             self.accumulated_time += -self.time_step
             signal(events.Update(self.time_step))
@@ -0,0 +1,107 @@
+"""
+Rendering without a window or display.
+
+:class:`OffscreenRenderer` draws into an in-memory surface using SDL's
+software renderer, so it works on machines without a display and doesn't
+need the video subsystem. Take the last frame drawn with
+:meth:`~OffscreenRenderer.capture`, or write it to a PNG in the background
+with :meth:`~OffscreenRenderer.save_frame`. ::
+
+    with HeadlessEngine(MyScene, basic_systems=(Updater, AssetLoadingSystem, OffscreenRenderer),
+                        max_time=1) as engine:
+        engine.run()
+        renderer, = engine.get(kind=OffscreenRenderer)
+        frame = renderer.capture()
+        assert frame.pixel(400, 300) == (255, 0, 0, 255)
+"""
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+import ctypes
+from pathlib import Path
+from typing import Union
+
+from sdl2 import (
+    SDL_PIXELFORMAT_RGBA32,
+    SDL_CreateRGBSurfaceWithFormat,  # https://wiki.libsdl.org/SDL_CreateRGBSurfaceWithFormat
+    SDL_CreateSoftwareRenderer,  # https://wiki.libsdl.org/SDL_CreateSoftwareRenderer
+    SDL_DestroyRenderer,  # https://wiki.libsdl.org/SDL_DestroyRenderer
+    SDL_FreeSurface,  # https://wiki.libsdl.org/SDL_FreeSurface
+)
+
+from ppb.systems.capture import Frame
+from ppb.systems.renderer import Renderer
+from ppb.systems.sdl_utils import sdl_call, is_null
+
+__all__ = 'OffscreenRenderer',
+
+
+class OffscreenRenderer(Renderer):
+    """
+    A :class:`~ppb.systems.Renderer` that draws to memory instead of a
+    window.
+
+    Takes the same arguments as the Renderer; ``window_title`` is ignored.
+    """
+    # The software renderer needs no SDL subsystems
+    _sdl_subsystems = 0
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        #: The SDL surface frames are drawn to, while running
+        self.surface = None
+        self._writer = None
+
+    def _create_window(self):
+        self.window = None
+
+    def _destroy_window(self):
+        pass
+
+    def _create_renderer(self):
+        width, height = self.resolution
+        self.surface = sdl_call(
+            SDL_CreateRGBSurfaceWithFormat, 0, width, height, 32, SDL_PIXELFORMAT_RGBA32,
+            _check_error=is_null
+        )
+        self.renderer = sdl_call(SDL_CreateSoftwareRenderer, self.surface, _check_error=is_null)
+
+    def _destroy_renderer(self):
+        if self._writer is not None:
+            self._writer.shutdown(wait=True)
+            self._writer = None
+        sdl_call(SDL_DestroyRenderer, self.renderer)
+        SDL_FreeSurface(self.surface)  # Can't fail
+        self.surface = None
+
+    def set_cursor(self, scene):
+        # There's no mouse to show
+        pass
+
+    def capture(self) -> Frame:
+        """
+        Copy the last frame drawn.
+
+        With ``render_thread=True`` the next frame may be being drawn at the
+        same time; use a :class:`~ppb.systems.capture.FrameCapture` instead.
+        """
+        surface = self.surface.contents
+        width = surface.w
+        height = surface.h
+        pitch = surface.pitch
+        data = ctypes.string_at(surface.pixels, pitch * height)
+        stride = width * 4
+        if pitch != stride:
+            data = b''.join(data[row * pitch:row * pitch + stride] for row in range(height))
+        return Frame(width, height, data)
+
+    def save_frame(self, path: Union[str, Path], compression: int = 6) -> Future:
+        """
+        Copy the last frame drawn, and write it to a PNG file on a background
+        thread.
+
+        :return: A future that is done when the file is written.
+        """
+        frame = self.capture()
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ppb-frame-writer')
+        return self._writer.submit(frame.save, path, compression)
@@ -0,0 +1,176 @@
+"""
+Drawing on a thread of its own.
+
+With ``render_thread=True``, the :class:`~ppb.systems.Renderer` doesn't draw
+in its :class:`~ppb.events.Render` handler. It takes a :class:`DrawList` of
+what is visible (all plain Python values, no SDL objects) and hands it to a
+:class:`RenderThread`, which owns the SDL renderer and its textures, and
+draws while the engine goes on with the next simulation step.
+"""
+from collections import deque
+import logging
+import threading
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+
+__all__ = 'DrawCommand', 'DrawList', 'RenderThread'
+
+logger = logging.getLogger(__name__)
+
+
+class DrawCommand(NamedTuple):
+    """
+    One sprite to draw.
+    """
+    image: Any  #: The asset
+    surface: Any  #: The loaded SDL surface of the asset
+    x: float  #: The screen position of the center
+    y: float
+    width: float  #: The size in game units
+    height: float
+    angle: float  #: Degrees clockwise
+    opacity: int
+    blend_mode: int  #: An SDL blend mode
+    tint: Tuple[int, int, int]
+
+
+class DrawList(NamedTuple):
+    """
+    Everything needed to draw a frame.
+    """
+    background: Tuple[int, int, int]
+    pixel_ratio: float
+    commands: List[DrawCommand]
+    culled: int  #: Objects left out for being out of view
+
+
+class RenderThread:
+    """
+    Draws :class:`DrawList` on a background thread.
+
+    At most :attr:`depth` lists wait to be drawn. When the engine gets further
+    ahead than that, the oldest waiting list is dropped, so the thread always
+    draws the most recent state, and the engine never waits on it.
+
+    An exception raised on the thread is raised again by the next call to
+    :meth:`submit` or :meth:`stop`.
+    """
+    def __init__(self, open: Callable, draw: Callable, close: Callable, *, depth: int = 1):
+        """
+        :param open: Called on the thread before drawing, to set up.
+        :param draw: Called on the thread with each :class:`DrawList`.
+        :param close: Called on the thread when stopping.
+        :param depth: How many lists can wait to be drawn.
+        """
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+        self.open = open
+        self.draw = draw
+        self.close = close
+        self.depth = depth
+        #: Lists drawn
+        self.drawn = 0
+        #: Lists dropped because the thread fell behind
+        self.dropped = 0
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._busy = False
+        self._error = None
+        self._thread = None
+
+    def start(self):
+        """
+        Start the thread, and wait for it to be set up.
+        """
+        ready = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, args=(ready,), name='ppb-render', daemon=True)
+        self._thread.start()
+        ready.wait()
+        if self._error is not None:
+            self._thread.join()
+            self._thread = None
+            self._raise()
+
+    def submit(self, draw_list: DrawList):
+        """
+        Queue a list to be drawn.
+        """
+        self._raise()
+        with self._condition:
+            if len(self._queue) >= self.depth:
+                self._queue.popleft()
+                self.dropped += 1
+            self._queue.append(draw_list)
+            self._condition.notify_all()
+
+    def wait(self):
+        """
+        Wait until every queued list is drawn.
+        """
+        with self._condition:
+            while (self._queue or self._busy) and self._thread.is_alive():
+                self._condition.wait()
+        self._raise()
+
+    def stop(self):
+        """
+        Draw the lists waiting, and stop the thread.
+        """
+        if self._thread is None:
+            return
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        self._thread = None
+        self._raise()
+
+    def _raise(self):
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _run(self, ready):
+        try:
+            self.open()
+        except BaseException as error:
+            self._error = error
+            ready.set()
+            return
+        ready.set()
+        try:
+            while True:
+                with self._condition:
+                    while not self._queue and not self._closed:
+                        self._condition.wait()
+                    if not self._queue:
+                        break
+                    draw_list = self._queue.popleft()
+                    self._busy = True
+                try:
+                    self.draw(draw_list)
+                    self.drawn += 1
+                except BaseException as error:
+                    logger.exception("Render thread failed")
+                    self._error = error
+                    break
+                finally:
+                    with self._condition:
+                        self._busy = False
+                        if self._error is not None:
+                            # Nothing more will be drawn
+                            self._queue.clear()
+                        self._condition.notify_all()
+        finally:
+            try:
+                self.close()
+            except BaseException as error:
+                if self._error is None:
+                    self._error = error
+            with self._condition:
+                self._condition.notify_all()
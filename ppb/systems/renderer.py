@@ -1,7 +1,10 @@
 import ctypes
+from dataclasses import dataclass
 import io
 import logging
+from math import hypot
 import random
+from typing import Callable
 from typing import Tuple
 
 import sdl2
@@ -9,13 +12,13 @@ import sdl2.ext
 
 from sdl2 import (
     rw_from_object,  # https://pysdl2.readthedocs.io/en/latest/modules/sdl2.html#sdl2.sdl2.rw_from_object
-    SDL_Window, SDL_Renderer,
     SDL_Rect,  # https://wiki.libsdl.org/SDL_Rect
     SDL_INIT_VIDEO, SDL_BLENDMODE_BLEND, SDL_FLIP_NONE,
-    SDL_CreateWindowAndRenderer,  # https://wiki.libsdl.org/SDL_CreateWindowAndRenderer
+    SDL_WINDOWPOS_UNDEFINED,
+    SDL_CreateWindow,  # https://wiki.libsdl.org/SDL_CreateWindow
+    SDL_CreateRenderer,  # https://wiki.libsdl.org/SDL_CreateRenderer
     SDL_DestroyRenderer,  # https://wiki.libsdl.org/SDL_DestroyRenderer
     SDL_DestroyWindow,  # https://wiki.libsdl.org/SDL_DestroyWindow
-    SDL_SetWindowTitle,  # https://wiki.libsdl.org/SDL_SetWindowTitle
     SDL_RenderPresent,  # https://wiki.libsdl.org/SDL_RenderPresent
     SDL_RenderClear,  # https://wiki.libsdl.org/SDL_RenderClear
     SDL_SetRenderDrawColor,  # https://wiki.libsdl.org/SDL_SetRenderDrawColor
@@ -52,7 +55,12 @@ import ppb.events as events
 import ppb.flags as flags
 
 from ppb.camera import Camera
+from ppb.systems.atlas import AtlasRegion, TextureAtlas
+from ppb.systems.batching import GeometryBatch, geometry_supported
+from ppb.systems.capture import FrameCapture
+from ppb.systems.render_thread import DrawCommand, DrawList, RenderThread
 from ppb.systems.sdl_utils import SdlSubSystem, sdl_call, img_call, ttf_call
+from ppb.systems.sdl_utils import fast_sdl_call, is_minus_one, is_negative, is_null
 from ppb.systems._utils import ObjectSideData
 from ppb.utils import get_time
 
@@ -80,12 +88,12 @@ class Image(assets.Asset):
         # ^^^^ is a pure-python emulation, does not need cleanup.
         surface = img_call(
             IMG_Load_RW, file, False,
-            _check_error=lambda rv: not rv
+            _check_error=is_null
         )
 
         sdl_call(
             SDL_SetSurfaceBlendMode, surface, SDL_BLENDMODE_BLEND,
-            _check_error=lambda rv: rv < 0
+            _check_error=is_negative
         )
 
         return surface
@@ -94,7 +102,7 @@ class Image(assets.Asset):
         width = height = 70  # Pixels, arbitrary
         surface = sdl_call(
             SDL_CreateRGBSurface, 0, width, height, 32, 0, 0, 0, 0,
-            _check_error=lambda rv: not rv
+            _check_error=is_null
         )
 
         rand = random.Random(str(self.name))
@@ -114,6 +122,23 @@ class Image(assets.Asset):
         # Can't actually nullify the pointer. Good thing this is __del__.
 
 
+@dataclass
+class RenderStats:
+    """
+    Counts from the most recent frame drawn by the :class:`Renderer`.
+    """
+    #: Objects drawn
+    drawn: int = 0
+    #: Objects skipped for being out of view of the camera
+    culled: int = 0
+    #: Texture alpha, blend, and color modulation changes sent to SDL
+    state_changes: int = 0
+    #: Texture modulation changes not sent, because they were already set
+    state_changes_skipped: int = 0
+    #: Batches of sprites drawn together, when batching geometry
+    batches: int = 0
+
+
 class SmartPointer:
     def __init__(self, obj, dest):
         self.inner = obj
@@ -123,6 +148,31 @@ class SmartPointer:
         self.destructor(self.inner)
 
 
+class Texture(SmartPointer):
+    """
+    An SDL texture, its size in pixels, and the modulation last set on it.
+    """
+    # The part of the texture to draw. Always all of it, unlike an AtlasRegion.
+    x = 0
+    y = 0
+
+    def __init__(self, obj, width, height, destroy=SDL_DestroyTexture):
+        super().__init__(obj, destroy)
+        self.width = width
+        self.height = height
+        # Not known until set
+        self.alpha_mod = None
+        self.blend_mode = None
+        self.color_mod = None
+
+    @property
+    def base(self):
+        """
+        The texture to set modulation on: itself.
+        """
+        return self
+
+
 class Renderer(SdlSubSystem):
     _sdl_subsystems = SDL_INIT_VIDEO
 
@@ -132,8 +182,41 @@ class Renderer(SdlSubSystem):
         window_title: str = "PursuedPyBear",
         target_frame_rate: int = 30,
         target_camera_width=25,
+        cull_offscreen: bool = True,
+        cull_margin: float = 1,
+        atlas: bool = False,
+        atlas_size: Tuple[int, int] = (1024, 1024),
+        atlas_padding: int = 1,
+        atlas_group: Callable = None,
+        batch_geometry: bool = False,
+        frame_capture: FrameCapture = None,
+        render_thread: bool = False,
+        render_queue_depth: int = 1,
         **kwargs
     ):
+        """
+        :param cull_offscreen: Skip objects outside the view of the camera
+           before doing any drawing work for them.
+        :param cull_margin: When the scene has a
+           :attr:`~ppb.Scene.spatial_index`, how far outside the view (in game
+           units) to look for objects whose image may be larger than their
+           size.
+        :param atlas: Pack small images into shared textures. See
+           :class:`~ppb.systems.atlas.TextureAtlas`.
+        :param atlas_size: The size in pixels of each atlas texture.
+        :param atlas_padding: Pixels of space between images in an atlas.
+        :param atlas_group: Called with an image, returns a key. Only images
+           with the same key share an atlas texture.
+        :param batch_geometry: Draw sprites sharing a texture and blend mode
+           with one SDL call. Needs SDL 2.0.18; older versions draw sprites one
+           at a time. Best combined with ``atlas``.
+        :param frame_capture: Records frames as they are drawn. See
+           :meth:`start_capture`.
+        :param render_thread: Draw on a thread of its own, while the engine
+           goes on with the next frame. See :mod:`ppb.systems.render_thread`.
+        :param render_queue_depth: With ``render_thread``, how many frames
+           can wait to be drawn before the oldest is dropped.
+        """
         self.resolution = resolution
         self.window = None
         self.window_title = window_title
@@ -143,34 +226,117 @@ class Renderer(SdlSubSystem):
         self.target_frame_length = 1 / self.target_frame_rate
         self.target_clock = get_time() + self.target_frame_length
         self.last_frame = get_time()
+        self.cull_offscreen = cull_offscreen
+        self.cull_margin = cull_margin
+        #: The :class:`RenderStats` of the last frame
+        self.stats = RenderStats()
+        self.use_atlas = atlas
+        self.atlas_options = {"size": atlas_size, "padding": atlas_padding, "group": atlas_group}
+        #: The :class:`~ppb.systems.atlas.TextureAtlas`, if atlases are used
+        self.atlas = None
+        self.batch_geometry = batch_geometry
+        self._batch = None
+        #: The :class:`~ppb.systems.capture.FrameCapture` recording frames, if any
+        self.frame_capture = frame_capture
+        self.render_thread = render_thread
+        self.render_queue_depth = render_queue_depth
+        #: The :class:`~ppb.systems.render_thread.RenderThread`, if used
+        self.thread = None
 
         self._texture_cache = ObjectSideData()
+        # With render_thread, textures can be dropped on any thread, but SDL
+        # textures must be destroyed on the one drawing. They wait here.
+        self._dead_textures = []
+        # Reused for every sprite drawn
+        self._src_rect = SDL_Rect()
+        self._dest_rect = SDL_Rect()
+        self._src_rect_ref = ctypes.byref(self._src_rect)
+        self._dest_rect_ref = ctypes.byref(self._dest_rect)
+        self._angle = ctypes.c_double()
 
     def __enter__(self):
         super().__enter__()
         img_call(IMG_Init, IMG_INIT_JPG | IMG_INIT_PNG | IMG_INIT_TIF)
-        ttf_call(TTF_Init, _check_error=lambda rv: rv == -1)
-        self.window = ctypes.POINTER(SDL_Window)()
-        self.renderer = ctypes.POINTER(SDL_Renderer)()
-        sdl_call(
-            SDL_CreateWindowAndRenderer,
+        ttf_call(TTF_Init, _check_error=is_minus_one)
+        if self.use_atlas:
+            from ppb.assets import Shape
+            self._atlas_types = Image, Shape
+        self._create_window()
+        if self.render_thread:
+            self.thread = RenderThread(
+                self._open_renderer, self._draw, self._close_renderer,
+                depth=self.render_queue_depth,
+            )
+            self.thread.start()
+        else:
+            self._open_renderer()
+        if self.frame_capture is not None:
+            self.frame_capture.start()
+
+    def __exit__(self, *exc):
+        thread, self.thread = self.thread, None
+        try:
+            if thread is not None:
+                thread.stop()
+            else:
+                self._close_renderer()
+        finally:
+            self.stop_capture()
+            self._destroy_window()
+            ttf_call(TTF_Quit)
+            img_call(IMG_Quit)
+            super().__exit__(*exc)
+
+    def _open_renderer(self):
+        # Everything using the SDL renderer is made on the thread drawing
+        self._create_renderer()
+        self._dead_textures = []
+        if self.use_atlas:
+            self.atlas = TextureAtlas(self._create_texture, **self.atlas_options)
+        if self.batch_geometry:
+            if geometry_supported():
+                self._batch = GeometryBatch(self.renderer, self._prepare_batch)
+            else:
+                logger.warning("SDL_RenderGeometry needs SDL 2.0.18, drawing sprites one at a time")
+
+    def _close_renderer(self):
+        self._batch = None
+        if self.atlas is not None:
+            self.atlas.close()
+            self.atlas = None
+        self._texture_cache.clear()
+        self._destroy_dead_textures()
+        self._destroy_renderer()
+
+    def _create_window(self):
+        self.window = sdl_call(
+            SDL_CreateWindow, self.window_title.encode('utf-8'),
+            SDL_WINDOWPOS_UNDEFINED, SDL_WINDOWPOS_UNDEFINED,
             self.resolution[0],  # Width
             self.resolution[1],  # Height
             0,  # Flags
             # SDL_WINDOW_ALLOW_HIGHDPI - Allow the renderer to work in HiDPI natively
-            ctypes.byref(self.window),
-            ctypes.byref(self.renderer),
-            _check_error=lambda rv: rv < 0
+            _check_error=is_null
         )
+
+    def _destroy_window(self):
+        sdl_call(SDL_DestroyWindow, self.window)
+
+    def _create_renderer(self):
+        """
+        Make :attr:`renderer`, drawing to :attr:`window`.
+        """
         # NOTE: It looks like SDL_RENDERER_PRESENTVSYNC will cause SDL_RenderPresent() to block?
-        sdl_call(SDL_SetWindowTitle, self.window, self.window_title.encode('utf-8'))
+        self.renderer = sdl_call(SDL_CreateRenderer, self.window, -1, 0, _check_error=is_null)
 
-    def __exit__(self, *exc):
+    def _destroy_renderer(self):
         sdl_call(SDL_DestroyRenderer, self.renderer)
-        sdl_call(SDL_DestroyWindow, self.window)
-        ttf_call(TTF_Quit)
-        img_call(IMG_Quit)
-        super().__exit__(*exc)
+
+    def next_deadline(self):
+        """
+        The time the next frame is due.
+        """
+        return self.target_clock
 
     def on_idle(self, idle_event: events.Idle, signal):
         t = get_time()
@@ -202,32 +368,198 @@ class Renderer(SdlSubSystem):
         del self.scene_cameras[scene_stopped.scene]
 
     def on_render(self, render_event, signal):
-        camera = render_event.scene.main_camera
+        scene = render_event.scene
+        camera = scene.main_camera
+        if self.thread is not None:
+            self.thread.submit(self.draw_list(scene, camera))
+            return
+
+        stats = self.stats = RenderStats()
+
+        self.render_background(scene)
 
-        self.render_background(render_event.scene)
+        bounds, index, candidates = self._view(scene, camera)
 
-        for game_object in render_event.scene.sprite_layers():
-            texture = self.prepare_resource(game_object)
+        batch = self._batch
+        if batch is not None:
+            draws = batch.draws
+
+        for game_object in scene.sprite_layers():
+            if candidates is not None and game_object not in candidates and self._indexed(game_object, index):
+                stats.culled += 1
+                continue
+            texture = self._get_texture(game_object)
             if texture is None:
                 continue
-            src_rect, dest_rect, angle = self.compute_rectangles(
-                texture.inner, game_object, camera
+            if bounds is not None and not self._in_view(texture, game_object, bounds):
+                stats.culled += 1
+                continue
+            stats.drawn += 1
+            if batch is not None:
+                opacity = getattr(game_object, 'opacity', 255)
+                opacity_mode = getattr(game_object, 'opacity_mode', flags.BlendModeBlend)
+                tint = getattr(game_object, 'tint', (255, 255, 255))
+                src_rect, dest_rect, angle = self.compute_rectangles(texture, game_object, camera)
+                batch.add(
+                    texture, OPACITY_MODES[opacity_mode], (tint[0], tint[1], tint[2], opacity),
+                    src_rect, dest_rect, angle.value,
+                )
+                continue
+            self._apply_texture_state(texture, game_object)
+            _, _, angle = self.compute_rectangles(texture, game_object, camera)
+            fast_sdl_call(
+                SDL_RenderCopyEx, self.renderer, texture.inner,
+                self._src_rect_ref, self._dest_rect_ref,
+                angle, None, SDL_FLIP_NONE,
+                _check_error=is_negative
             )
-            sdl_call(
+        if batch is not None:
+            batch.flush()
+            stats.batches = batch.draws - draws
+        if self.frame_capture is not None:
+            self.frame_capture.frame_rendered(self.renderer)
+        fast_sdl_call(SDL_RenderPresent, self.renderer)
+
+    def _view(self, scene, camera):
+        """
+        The bounds to cull to, and the spatial index with the objects it
+        finds near them, if any.
+        """
+        bounds = index = candidates = None
+        if self.cull_offscreen:
+            bounds = camera.left, camera.right, camera.bottom, camera.top
+            index = getattr(scene, 'spatial_index', None)
+            if index is not None:
+                margin = self.cull_margin
+                candidates = index.query_rect(
+                    bounds[0] - margin, bounds[2] - margin,
+                    bounds[1] + margin, bounds[3] + margin,
+                )
+        return bounds, index, candidates
+
+    @staticmethod
+    def _indexed(game_object, index) -> bool:
+        """
+        Is the object's entry in the spatial index kept up to date?
+
+        Only objects that tell the index when they move (like
+        :class:`~ppb.features.spatial.SpatialMixin` sprites) are; anything
+        else may have moved since it was indexed, so it gets culled by its
+        bounds instead.
+        """
+        return getattr(game_object, '_spatial_index', None) is index
+
+    def draw_list(self, scene, camera) -> DrawList:
+        """
+        What to draw for a scene, as seen by a camera.
+
+        Reads the objects in the scene, but makes no SDL calls, so the list
+        can be drawn on another thread.
+        """
+        bounds, index, candidates = self._view(scene, camera)
+        translate = camera.translate_point_to_screen
+        commands = []
+        culled = 0
+        for game_object in scene.sprite_layers():
+            if candidates is not None and game_object not in candidates and self._indexed(game_object, index):
+                culled += 1
+                continue
+            image = self._get_image(game_object)
+            if image is None:
+                continue
+            surface = image.load()
+            contents = surface.contents
+            if bounds is not None and not self._in_view_size(contents.w, contents.h, game_object, bounds):
+                culled += 1
+                continue
+            if hasattr(game_object, 'width'):
+                obj_w = game_object.width
+                obj_h = game_object.height
+            else:
+                obj_w, obj_h = game_object.size
+            center = translate(game_object.position)
+            tint = getattr(game_object, 'tint', (255, 255, 255))
+            commands.append(DrawCommand(
+                image, surface, center.x, center.y, obj_w, obj_h,
+                -game_object.rotation,
+                getattr(game_object, 'opacity', 255),
+                OPACITY_MODES[getattr(game_object, 'opacity_mode', flags.BlendModeBlend)],
+                (tint[0], tint[1], tint[2]),
+            ))
+        bg = scene.background_color
+        return DrawList((bg[0], bg[1], bg[2]), camera.pixel_ratio, commands, culled)
+
+    def _draw(self, draw_list: DrawList):
+        """
+        Draw a :class:`~ppb.systems.render_thread.DrawList`.
+        """
+        self._destroy_dead_textures()
+        stats = self.stats = RenderStats(culled=draw_list.culled)
+        bg = draw_list.background
+        fast_sdl_call(
+            SDL_SetRenderDrawColor, self.renderer, bg[0], bg[1], bg[2], 255,
+            _check_error=is_negative
+        )
+        fast_sdl_call(SDL_RenderClear, self.renderer, _check_error=is_negative)
+
+        batch = self._batch
+        if batch is not None:
+            draws = batch.draws
+        pixel_ratio = draw_list.pixel_ratio
+        angle = self._angle
+        for command in draw_list.commands:
+            texture = self._image_texture(command.image, command.surface)
+            stats.drawn += 1
+            self._place(texture, command.x, command.y, command.width, command.height, pixel_ratio)
+            if batch is not None:
+                batch.add(
+                    texture, command.blend_mode, command.tint + (command.opacity,),
+                    self._src_rect, self._dest_rect, command.angle,
+                )
+                continue
+            self._set_texture_state(texture.base, command.opacity, command.blend_mode, command.tint)
+            angle.value = command.angle
+            fast_sdl_call(
                 SDL_RenderCopyEx, self.renderer, texture.inner,
-                ctypes.byref(src_rect), ctypes.byref(dest_rect),
+                self._src_rect_ref, self._dest_rect_ref,
                 angle, None, SDL_FLIP_NONE,
-                _check_error=lambda rv: rv < 0
+                _check_error=is_negative
             )
-        sdl_call(SDL_RenderPresent, self.renderer)
+        if batch is not None:
+            batch.flush()
+            stats.batches = batch.draws - draws
+        frame_capture = self.frame_capture
+        if frame_capture is not None:
+            frame_capture.frame_rendered(self.renderer)
+        fast_sdl_call(SDL_RenderPresent, self.renderer)
+
+    def start_capture(self, frame_capture: FrameCapture):
+        """
+        Start recording frames, replacing any current capture.
+
+        Copying each frame takes time on the engine thread; encoding and
+        writing it happen on a background thread.
+        """
+        self.stop_capture()
+        self.frame_capture = frame_capture
+        frame_capture.start()
+
+    def stop_capture(self):
+        """
+        Stop recording frames, waiting for the frames already copied to be
+        written.
+        """
+        frame_capture, self.frame_capture = self.frame_capture, None
+        if frame_capture is not None:
+            frame_capture.close()
 
     def render_background(self, scene):
         bg = scene.background_color
-        sdl_call(
+        fast_sdl_call(
             SDL_SetRenderDrawColor, self.renderer, bg[0], bg[1], bg[2], 255,
-            _check_error=lambda rv: rv < 0
+            _check_error=is_negative
         )
-        sdl_call(SDL_RenderClear, self.renderer, _check_error=lambda rv: rv < 0)
+        fast_sdl_call(SDL_RenderClear, self.renderer, _check_error=is_negative)
 
     def _object_has_dimension(self, game_object):
         """
@@ -248,68 +580,173 @@ class Renderer(SdlSubSystem):
         """
         Get the SDL Texture for an object.
         """
+        texture = self._get_texture(game_object)
+        if texture is not None:
+            self._apply_texture_state(texture, game_object)
+        return texture
+
+    def _get_image(self, game_object):
         if not self._object_has_dimension(game_object):
             return None
 
         if not hasattr(game_object, '__image__'):
-            return
+            return None
+
+        return game_object.__image__()
 
-        image = game_object.__image__()
+    def _get_texture(self, game_object):
+        image = self._get_image(game_object)
         if image is None:
             return None
+        return self._image_texture(image, image.load())
 
-        surface = image.load()
+    def _image_texture(self, image, surface):
+        if self.atlas is not None and isinstance(image, self._atlas_types):
+            region = self.atlas.region(image, surface)
+            if region is not None:
+                return region
         try:
             texture = self._texture_cache[surface]
         except KeyError:
-            texture = SmartPointer(sdl_call(
-                SDL_CreateTextureFromSurface, self.renderer, surface,
-                _check_error=lambda rv: not rv
-            ), SDL_DestroyTexture)
-            self._texture_cache[surface] = texture
+            texture = self._texture_cache[surface] = self._create_texture(surface)
+        return texture
+
+    def _create_texture(self, surface) -> Texture:
+        texture = sdl_call(
+            SDL_CreateTextureFromSurface, self.renderer, surface,
+            _check_error=is_null
+        )
+        if self.render_thread:
+            # Destroyed by the render thread, whichever thread drops it
+            return Texture(texture, surface.contents.w, surface.contents.h, self._dead_textures.append)
+        return Texture(texture, surface.contents.w, surface.contents.h)
+
+    def _destroy_dead_textures(self):
+        dead = self._dead_textures
+        while dead:
+            SDL_DestroyTexture(dead.pop())
 
+    def bake_atlas(self, images):
+        """
+        Pack images into the atlas ahead of time, instead of as they are
+        first drawn. Waits for the images to load.
+
+        Only works while the renderer is running with ``atlas=True``.
+        """
+        if self.atlas is None:
+            raise RuntimeError("The renderer isn't using an atlas")
+        for image in images:
+            self.atlas.region(image, image.load())
+
+    def _apply_texture_state(self, texture, game_object):
         opacity = getattr(game_object, 'opacity', 255)
         opacity_mode = getattr(game_object, 'opacity_mode', flags.BlendModeBlend)
-        opacity_mode = OPACITY_MODES[opacity_mode]
         tint = getattr(game_object, 'tint', (255, 255, 255))
-
-        sdl_call(
-            SDL_SetTextureAlphaMod, texture.inner, opacity,
-            _check_error=lambda rv: rv < 0
+        self._set_texture_state(
+            texture.base, opacity, OPACITY_MODES[opacity_mode], (tint[0], tint[1], tint[2]),
         )
 
-        sdl_call(
-            SDL_SetTextureBlendMode, texture.inner, opacity_mode,
-            _check_error=lambda rv: rv < 0
-        )
+    def _prepare_batch(self, texture, blend_mode):
+        # Batches carry their color and opacity in their vertices
+        self._set_texture_state(texture, 255, blend_mode, (255, 255, 255))
 
-        sdl_call(
-            SDL_SetTextureColorMod, texture.inner, tint[0], tint[1], tint[2],
-            _check_error=lambda rv: rv < 0
-        )
+    def _set_texture_state(self, texture, opacity, opacity_mode, color_mod):
+        stats = self.stats
 
-        return texture
+        # Only tell SDL about changes
+        if opacity != texture.alpha_mod:
+            fast_sdl_call(
+                SDL_SetTextureAlphaMod, texture.inner, opacity,
+                _check_error=is_negative
+            )
+            texture.alpha_mod = opacity
+            stats.state_changes += 1
+        else:
+            stats.state_changes_skipped += 1
 
-    def compute_rectangles(self, texture, game_object, camera):
-        flags = sdl2.stdinc.Uint32()
-        access = ctypes.c_int()
-        img_w = ctypes.c_int()
-        img_h = ctypes.c_int()
-        sdl_call(
-            SDL_QueryTexture, texture, ctypes.byref(flags), ctypes.byref(access),
-            ctypes.byref(img_w), ctypes.byref(img_h),
-            _check_error=lambda rv: rv < 0
-        )
+        if opacity_mode != texture.blend_mode:
+            fast_sdl_call(
+                SDL_SetTextureBlendMode, texture.inner, opacity_mode,
+                _check_error=is_negative
+            )
+            texture.blend_mode = opacity_mode
+            stats.state_changes += 1
+        else:
+            stats.state_changes_skipped += 1
+
+        if color_mod != texture.color_mod:
+            fast_sdl_call(
+                SDL_SetTextureColorMod, texture.inner, *color_mod,
+                _check_error=is_negative
+            )
+            texture.color_mod = color_mod
+            stats.state_changes += 1
+        else:
+            stats.state_changes_skipped += 1
 
-        src_rect = SDL_Rect(x=0, y=0, w=img_w, h=img_h)
+    @staticmethod
+    def _in_view(texture, game_object, bounds) -> bool:
+        """
+        Could any of the object's image be inside the bounds?
+
+        The image is drawn covering the object's width and height, keeping its
+        aspect ratio, so it may stick out in one direction. Rotated objects
+        are treated as circles around their image.
+        """
+        return Renderer._in_view_size(texture.width, texture.height, game_object, bounds)
 
+    @staticmethod
+    def _in_view_size(img_w, img_h, game_object, bounds) -> bool:
+        left, right, bottom, top = bounds
         if hasattr(game_object, 'width'):
             obj_w = game_object.width
             obj_h = game_object.height
         else:
             obj_w, obj_h = game_object.size
+        scale = max(obj_w / img_w, obj_h / img_h)
+        half_w = img_w * scale / 2
+        half_h = img_h * scale / 2
+        if getattr(game_object, 'rotation', 0) % 180:
+            half_w = half_h = hypot(half_w, half_h)
+        x, y = game_object.position
+        return (
+            left - half_w <= x <= right + half_w
+            and bottom - half_h <= y <= top + half_h
+        )
 
-        win_w, win_h = self.target_resolution(img_w.value, img_h.value, obj_w, obj_h, camera.pixel_ratio)
+    def compute_rectangles(self, texture, game_object, camera):
+        """
+        The source and destination rectangles, and the angle, to draw an
+        object with.
+
+        Pass a :class:`Texture` to use its known size; a bare SDL texture is
+        asked for its size. The structures returned are reused by the next
+        call.
+        """
+        if isinstance(texture, (Texture, AtlasRegion)):
+            img_w = texture.width
+            img_h = texture.height
+            src_x = texture.x
+            src_y = texture.y
+        else:
+            flags = sdl2.stdinc.Uint32()
+            access = ctypes.c_int()
+            w = ctypes.c_int()
+            h = ctypes.c_int()
+            sdl_call(
+                SDL_QueryTexture, texture, ctypes.byref(flags), ctypes.byref(access),
+                ctypes.byref(w), ctypes.byref(h),
+                _check_error=is_negative
+            )
+            img_w = w.value
+            img_h = h.value
+            src_x = src_y = 0
+
+        if hasattr(game_object, 'width'):
+            obj_w = game_object.width
+            obj_h = game_object.height
+        else:
+            obj_w, obj_h = game_object.size
 
         try:
             center = camera.translate_point_to_screen(game_object.position)
@@ -323,14 +760,34 @@ class Renderer(SdlSubSystem):
             Vector(number, number)
             """) from error
 
-        dest_rect = SDL_Rect(
-            x=int(center.x - win_w / 2),
-            y=int(center.y - win_h / 2),
-            w=win_w,
-            h=win_h,
-        )
+        self._place_rect(src_x, src_y, img_w, img_h, center.x, center.y, obj_w, obj_h, camera.pixel_ratio)
+
+        angle = self._angle
+        angle.value = -game_object.rotation
+
+        return self._src_rect, self._dest_rect, angle
 
-        return src_rect, dest_rect, ctypes.c_double(-game_object.rotation)
+    def _place(self, texture, x, y, obj_w, obj_h, pixel_ratio):
+        self._place_rect(texture.x, texture.y, texture.width, texture.height, x, y, obj_w, obj_h, pixel_ratio)
+
+    def _place_rect(self, src_x, src_y, img_w, img_h, x, y, obj_w, obj_h, pixel_ratio):
+        """
+        Fill in the source and destination rectangles, to draw part of a
+        texture centered on a point on screen.
+        """
+        src_rect = self._src_rect
+        src_rect.x = src_x
+        src_rect.y = src_y
+        src_rect.w = img_w
+        src_rect.h = img_h
+
+        win_w, win_h = self.target_resolution(img_w, img_h, obj_w, obj_h, pixel_ratio)
+
+        dest_rect = self._dest_rect
+        dest_rect.x = int(x - win_w / 2)
+        dest_rect.y = int(y - win_h / 2)
+        dest_rect.w = win_w
+        dest_rect.h = win_h
 
     def set_cursor(self, scene):
         show_cursor = int(bool(getattr(scene, "show_cursor", True)))
@@ -37,6 +37,29 @@ class SdlError(Exception):
     """
 
 
+# Predefined checks for _check_error, to avoid making a lambda for every call.
+
+def is_negative(rv) -> bool:
+    """
+    The call failed if it returned a negative number.
+    """
+    return rv < 0
+
+
+def is_null(rv) -> bool:
+    """
+    The call failed if it returned NULL (or 0).
+    """
+    return not rv
+
+
+def is_minus_one(rv) -> bool:
+    """
+    The call failed if it returned -1.
+    """
+    return rv == -1
+
+
 def sdl_call(func, *pargs, _check_error=None, **kwargs):
     """
     Wrapper for calling SDL functions for handling errors.
@@ -56,6 +79,21 @@ def sdl_call(func, *pargs, _check_error=None, **kwargs):
         return rv
 
 
+def fast_sdl_call(func, *pargs, _check_error=None):
+    """
+    Faster version of :func:`sdl_call`, for hot loops.
+
+    The error is only fetched (with SDL_GetError) if _check_error says the call
+    failed, and isn't cleared beforehand. Use one of the predefined checks
+    (like :func:`is_negative`) for _check_error. Keyword arguments aren't
+    passed on.
+    """
+    rv = func(*pargs)
+    if _check_error is not None and _check_error(rv):
+        raise SdlError(f"Error calling {func.__name__}: {SDL_GetError().decode('utf-8')}")
+    return rv
+
+
 class SdlSubSystem(System):
     """
     Handles SDL_InitSubSystem/SDL_QuitSubSystem
@@ -96,6 +134,21 @@ def mix_call(func, *pargs, _check_error=None, **kwargs):
         return rv
 
 
+def fast_mix_call(func, *pargs, _check_error=None):
+    """
+    Faster version of :func:`mix_call`, for hot loops.
+
+    The error is only fetched (with Mix_GetError) if _check_error says the call
+    failed, and isn't cleared beforehand. Use one of the predefined checks
+    (like :func:`is_negative`) for _check_error. Keyword arguments aren't
+    passed on.
+    """
+    rv = func(*pargs)
+    if _check_error is not None and _check_error(rv):
+        raise SdlMixerError(f"Error calling {func.__name__}: {Mix_GetError().decode('utf-8')}")
+    return rv
+
+
 class ImgError(SdlError):
     pass
 
@@ -119,6 +172,21 @@ def img_call(func, *pargs, _check_error=None, **kwargs):
         return rv
 
 
+def fast_img_call(func, *pargs, _check_error=None):
+    """
+    Faster version of :func:`img_call`, for hot loops.
+
+    The error is only fetched (with IMG_GetError) if _check_error says the call
+    failed, and isn't cleared beforehand. Use one of the predefined checks
+    (like :func:`is_negative`) for _check_error. Keyword arguments aren't
+    passed on.
+    """
+    rv = func(*pargs)
+    if _check_error is not None and _check_error(rv):
+        raise SdlError(f"Error calling {func.__name__}: {IMG_GetError().decode('utf-8')}")
+    return rv
+
+
 class TtfError(SdlError):
     pass
 
@@ -140,3 +208,18 @@ def ttf_call(func, *pargs, _check_error=None, **kwargs):
         raise SdlError(f"Error calling {func.__name__}: {err.decode('utf-8')}")
     else:
         return rv
+
+
+def fast_ttf_call(func, *pargs, _check_error=None):
+    """
+    Faster version of :func:`ttf_call`, for hot loops.
+
+    The error is only fetched (with TTF_GetError) if _check_error says the call
+    failed, and isn't cleared beforehand. Use one of the predefined checks
+    (like :func:`is_negative`) for _check_error. Keyword arguments aren't
+    passed on.
+    """
+    rv = func(*pargs)
+    if _check_error is not None and _check_error(rv):
+        raise SdlError(f"Error calling {func.__name__}: {TTF_GetError().decode('utf-8')}")
+    return rv
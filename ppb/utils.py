@@ -4,7 +4,7 @@ import sys
 from time import perf_counter
 import typing
 
-__all__ = 'LoggingMixin', 'camel_to_snake', 'get_time', 'Color'
+__all__ = 'LoggingMixin', 'camel_to_snake', 'get_time', 'set_clock', 'Color'
 
 
 Color = typing.Tuple[int, int, int]
@@ -12,6 +12,9 @@ Color = typing.Tuple[int, int, int]
 # Dictionary mapping file names -> module names
 _module_file_index = {}
 
+# The function get_time() reads
+_clock = perf_counter
+
 
 def _build_index():
     """
@@ -42,8 +45,25 @@ def get_time():
     
     .. warning:: This is not a globally synchronized timer, it's just simply a system time. It is intended
        to make sure all timers in ppb code use the same function.
+
+    The timer can be replaced with :func:`set_clock`.
+    """
+    return _clock()
+
+
+def set_clock(clock=None):
+    """
+    Replace the timer used by :func:`get_time`, eg with a
+    :class:`~ppb.headless.VirtualClock`.
+
+    :param clock: A callable returning the current time in seconds. Pass
+       ``None`` to go back to the default timer.
+    :return: The previous timer.
     """
-    return perf_counter()
+    global _clock
+    previous = _clock
+    _clock = perf_counter if clock is None else clock
+    return previous
 
 
 def _get_module(file_name):
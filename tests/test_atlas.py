@@ -0,0 +1,110 @@
+import gc
+
+import pytest
+
+import ppb
+from ppb import GameEngine, Scene, Vector
+from ppb.assetlib import AssetLoadingSystem
+from ppb.events import Render
+from ppb.systems import Renderer
+from ppb.systems.atlas import AtlasRegion, ShelfPacker
+from ppb.systems.renderer import RenderStats
+
+
+def test_shelf_packer():
+    packer = ShelfPacker(10, 10, padding=1)
+    assert packer.insert(4, 3) == (0, 0)
+    assert packer.insert(4, 2) == (5, 0)
+    # Too wide for the first shelf
+    assert packer.insert(4, 3) == (0, 4)
+    # Too tall for any shelf that has room
+    assert packer.insert(2, 4) is None
+    assert packer.insert(11, 1) is None
+
+
+def run_frame(setup, inspect, **kwargs):
+    """
+    Render one frame, and call inspect with the renderer while it's running.
+    """
+    engine = GameEngine(
+        Scene, basic_systems=[Renderer, AssetLoadingSystem], scene_kwargs={"set_up": setup},
+        resolution=(100, 100), target_camera_width=25, **kwargs
+    )
+    with engine:
+        engine.start()
+        engine.signal(Render())
+        while engine.events:
+            engine.publish()
+        renderer, = engine.get(kind=Renderer)
+        inspect(renderer)
+    return renderer
+
+
+def test_renderer_atlas(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    red = ppb.Square(255, 0, 0)
+    blue = ppb.Circle(0, 0, 255)
+
+    def setup(scene):
+        scene.add(ppb.Sprite(position=Vector(-5, 0), image=red))
+        scene.add(ppb.Sprite(position=Vector(5, 0), image=blue))
+
+    def inspect(renderer):
+        atlas = renderer.atlas
+        assert len(atlas) == 2
+        assert atlas.pages == 1
+        # The second image is copied into the texture made for the first.
+        assert atlas.uploads == 1
+        red_region = atlas.region(red, red.load())
+        blue_region = atlas.region(blue, blue.load())
+        assert isinstance(red_region, AtlasRegion)
+        assert red_region.base is blue_region.base
+        assert (red_region.x, red_region.y) != (blue_region.x, blue_region.y)
+
+    renderer = run_frame(setup, inspect, atlas=True)
+    # Both images are drawn from the same texture, so its modulation is only
+    # set once.
+    assert renderer.stats == RenderStats(drawn=2, culled=0, state_changes=3, state_changes_skipped=3)
+    assert renderer.atlas is None
+
+
+def test_renderer_atlas_groups(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+
+    def setup(scene):
+        scene.add(ppb.Sprite(position=Vector(-5, 0), image=ppb.Square(255, 0, 0)))
+        scene.add(ppb.Sprite(position=Vector(5, 0), image=ppb.Circle(0, 0, 255)))
+
+    def inspect(renderer):
+        assert renderer.atlas.pages == 2
+
+    run_frame(setup, inspect, atlas=True, atlas_group=type)
+
+
+def test_atlas_textures_freed_with_renderer(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    image = ppb.Square(255, 0, 0)
+    pages = []
+
+    def setup(scene):
+        scene.add(ppb.Sprite(image=image))
+
+    def inspect(renderer):
+        pages.append(renderer.atlas.region(image, image.load()).page)
+
+    run_frame(setup, inspect, atlas=True)
+    # The page textures are gone before the SDL renderer, not left for the
+    # garbage collector to destroy later.
+    page, = pages
+    assert page._texture is None
+    with pytest.raises(RuntimeError):
+        page.texture
+
+    # A renderer made afterwards isn't affected
+    gc.collect()
+    run_frame(setup, lambda renderer: None, batch_geometry=True)
+
+
+def test_bake_atlas_needs_atlas():
+    with pytest.raises(RuntimeError):
+        Renderer().bake_atlas([ppb.Square(255, 0, 0)])
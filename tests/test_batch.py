@@ -0,0 +1,117 @@
+import random
+import time
+
+import pytest
+
+from ppb import Scene
+from ppb.batch import run_batch
+
+
+class CountingScene(Scene):
+
+    def __init__(self, target, **props):
+        super().__init__(**props)
+        self.target = target
+        self.count = 0
+
+    def on_update(self, event, signal):
+        self.count += 1
+
+
+class BrokenScene(Scene):
+
+    def on_update(self, event, signal):
+        raise RuntimeError("Broken")
+
+
+def counting_scene(seed):
+    return CountingScene(target=random.randint(1, 10))
+
+
+def broken_scene(seed):
+    return BrokenScene()
+
+
+def reached_target(engine):
+    scene = engine.current_scene
+    return scene.count >= scene.target
+
+
+def count(engine):
+    return engine.current_scene.count
+
+
+def failing_factory(seed):
+    raise ValueError("No scene")
+
+
+def slow_count(engine):
+    time.sleep(0.2)
+    return count(engine)
+
+
+@pytest.mark.parametrize("processes", [0, 2])
+def test_run_batch(processes):
+    results = list(run_batch(
+        counting_scene, range(8), stop=reached_target, result=count,
+        max_time=60, processes=processes,
+    ))
+
+    assert sorted(r.seed for r in results) == list(range(8))
+    for r in results:
+        random.seed(r.seed)
+        target = random.randint(1, 10)
+        # The Update in the same loop as the stop may still be delivered.
+        assert target <= r.value <= target + 1
+        assert r.error is None
+        assert r.elapsed < 60
+        assert r.factory == "counting_scene"
+
+
+def test_run_batch_reports_errors():
+    results = list(run_batch(
+        [counting_scene, broken_scene], [1], max_time=1, processes=0,
+    ))
+
+    errors = {r.factory: r.error for r in results}
+    assert errors["counting_scene"] is None
+    assert "Broken" in errors["broken_scene"]
+
+
+@pytest.mark.parametrize("processes", [0, 1])
+def test_run_batch_reports_factory_errors(processes):
+    result, = run_batch(failing_factory, [1], max_time=1, processes=processes)
+
+    assert "No scene" in result.error
+    assert result.steps == 0
+    assert result.elapsed == 0
+
+
+def test_run_batch_cancels_when_closed():
+    start = time.perf_counter()
+    results = run_batch(
+        counting_scene, range(30), stop=reached_target, result=slow_count,
+        max_time=60, processes=1,
+    )
+    first = next(results)
+    results.close()
+
+    assert first.error is None
+    # Running everything takes six seconds
+    assert time.perf_counter() - start < 3
+
+
+def test_run_batch_needs_an_end():
+    # Raised by the call, not when iterating
+    with pytest.raises(TypeError):
+        run_batch(counting_scene, [1])
+
+
+def test_run_batch_keeps_random_state():
+    random.seed("caller")
+    expected = random.random()
+    random.seed("caller")
+    results = list(run_batch(counting_scene, range(3), max_time=0.1, processes=0))
+
+    assert len(results) == 3
+    assert random.random() == expected
@@ -0,0 +1,89 @@
+import ctypes
+
+import pytest
+import sdl2
+
+import ppb
+from ppb import GameEngine, Scene, Vector
+from ppb.assetlib import AssetLoadingSystem
+from ppb.events import Render
+from ppb.systems import Renderer
+from ppb.systems.batching import GeometryBatch, geometry_supported
+
+needs_geometry = pytest.mark.skipif(not geometry_supported(), reason="SDL is too old for SDL_RenderGeometry")
+
+
+class FakeTexture:
+    width = 10
+    height = 10
+
+    @property
+    def base(self):
+        return self
+
+
+class RecordingBatch(GeometryBatch):
+    def __init__(self):
+        super().__init__(None, None)
+        self.runs = []
+
+    def flush(self):
+        if len(self):
+            self.runs.append((self._texture, self._blend_mode, len(self)))
+            self._count = 0
+
+
+def test_batch_runs():
+    batch = RecordingBatch()
+    first = FakeTexture()
+    second = FakeTexture()
+    rect = sdl2.SDL_Rect(0, 0, 10, 10)
+    white = 255, 255, 255, 255
+
+    batch.add(first, 1, white, rect, rect, 0)
+    batch.add(first, 1, white, rect, rect, 90)
+    batch.add(second, 1, white, rect, rect, 0)
+    batch.add(second, 2, white, rect, rect, 0)
+    batch.add(first, 2, white, rect, rect, 0)
+    batch.flush()
+    assert batch.runs == [(first, 1, 2), (second, 1, 1), (second, 2, 1), (first, 2, 1)]
+
+
+def render(images, **kwargs):
+    def setup(scene):
+        scene.add(ppb.Sprite(position=Vector(-5, 0), image=images[0]))
+        scene.add(ppb.Sprite(position=Vector(5, 3), image=images[1], size=4, tint=(255, 128, 0)))
+        scene.add(ppb.Sprite(position=Vector(0, -5), image=images[0], opacity=128))
+
+    engine = GameEngine(
+        Scene, basic_systems=[Renderer, AssetLoadingSystem], scene_kwargs={"set_up": setup},
+        resolution=(100, 100), target_camera_width=25, **kwargs
+    )
+    with engine:
+        engine.start()
+        engine.signal(Render())
+        while engine.events:
+            engine.publish()
+        renderer, = engine.get(kind=Renderer)
+        pixels = (ctypes.c_uint8 * (100 * 100 * 4))()
+        sdl2.SDL_RenderReadPixels(renderer.renderer, None, sdl2.SDL_PIXELFORMAT_RGBA32, pixels, 100 * 4)
+        return renderer.stats, bytes(pixels)
+
+
+@needs_geometry
+def test_renderer_batches(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    images = ppb.Square(255, 0, 0), ppb.Circle(0, 0, 255)
+
+    stats, expected = render(images)
+    assert stats.batches == 0
+
+    stats, pixels = render(images, batch_geometry=True)
+    assert stats.drawn == 3
+    assert stats.batches == 3
+    assert pixels == expected
+
+    # Atlas regions share a texture, so they're drawn together.
+    stats, pixels = render(images, batch_geometry=True, atlas=True)
+    assert stats.batches == 1
+    assert pixels == expected
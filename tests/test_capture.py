@@ -0,0 +1,122 @@
+import threading
+
+import pytest
+from sdl2 import (
+    SDL_PIXELFORMAT_RGBA32,
+    SDL_CreateRGBSurfaceWithFormat,
+    SDL_CreateSoftwareRenderer,
+    SDL_DestroyRenderer,
+    SDL_FreeSurface,
+    SDL_RenderClear,
+    SDL_SetRenderDrawColor,
+)
+
+import ppb
+from ppb.assetlib import AssetLoadingSystem
+from ppb.headless import HeadlessEngine
+from ppb.systems import OffscreenRenderer
+from ppb.systems import Updater
+from ppb.systems.capture import FrameCapture, ImageSequenceWriter, RawVideoWriter
+
+
+class SlowWriter:
+    """
+    Holds up the first frame until released.
+    """
+    def __init__(self):
+        self.writing = threading.Event()
+        self.release = threading.Event()
+        self.frames = []
+        self.closed = False
+
+    def write(self, number, frame):
+        self.writing.set()
+        self.release.wait(5)
+        self.frames.append((number, frame.pixel(0, 0)))
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def sdl_renderer():
+    surface = SDL_CreateRGBSurfaceWithFormat(0, 4, 4, 32, SDL_PIXELFORMAT_RGBA32)
+    renderer = SDL_CreateSoftwareRenderer(surface)
+    yield renderer
+    SDL_DestroyRenderer(renderer)
+    SDL_FreeSurface(surface)
+
+
+def draw(renderer, shade):
+    SDL_SetRenderDrawColor(renderer, shade, 0, 0, 255)
+    SDL_RenderClear(renderer)
+
+
+@pytest.mark.parametrize("drop, written", [
+    ("newest", [0, 1]),
+    ("oldest", [0, 4]),
+])
+def test_frame_capture_drops(sdl_renderer, drop, written):
+    writer = SlowWriter()
+    capture = FrameCapture(writer, queue_size=1, drop=drop)
+    capture.start()
+    for number in range(5):
+        draw(sdl_renderer, number)
+        capture.frame_rendered(sdl_renderer)
+        if number == 0:
+            assert writer.writing.wait(5)
+    writer.release.set()
+    capture.close()
+
+    assert capture.frames == 5
+    assert capture.dropped == 3
+    assert capture.written == 2
+    # Each frame is written with its own pixels, even with buffers reused
+    assert writer.frames == [(number, (number, 0, 0, 255)) for number in written]
+    assert writer.closed
+
+
+def test_frame_capture_every(sdl_renderer, tmp_path):
+    capture = FrameCapture(ImageSequenceWriter(tmp_path), every=3)
+    capture.start()
+    for number in range(7):
+        draw(sdl_renderer, number)
+        capture.frame_rendered(sdl_renderer)
+    capture.close()
+
+    assert capture.captured == 3
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "frame-000000.png", "frame-000003.png", "frame-000006.png",
+    ]
+
+
+def test_frame_capture_validation():
+    with pytest.raises(ValueError):
+        FrameCapture(RawVideoWriter("unused"), every=0)
+    with pytest.raises(ValueError):
+        FrameCapture(RawVideoWriter("unused"), drop="sometimes")
+
+
+def test_renderer_capture(tmp_path):
+    def setup(scene):
+        scene.background_color = (0, 0, 255)
+
+    video = tmp_path / "video.rgba"
+    capture = FrameCapture(RawVideoWriter(video), every=2)
+    engine = HeadlessEngine(
+        ppb.Scene, basic_systems=(Updater, AssetLoadingSystem, OffscreenRenderer),
+        scene_kwargs={"set_up": setup}, max_time=0.5,
+        resolution=(20, 10), frame_capture=capture,
+    )
+    with engine:
+        engine.run()
+        renderer, = engine.get(kind=OffscreenRenderer)
+
+    # Exiting the renderer stops the capture, after writing every frame.
+    assert renderer.frame_capture is None
+    assert capture.frames > 2
+    assert capture.captured == (capture.frames + 1) // 2
+    assert capture.written == capture.captured
+    data = video.read_bytes()
+    assert len(data) == capture.written * 20 * 10 * 4
+    assert data[:4] == bytes([0, 0, 255, 255])
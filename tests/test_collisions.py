@@ -0,0 +1,89 @@
+import pytest
+
+from ppb import GameEngine, Scene, Sprite, RectangleSprite, Vector
+from ppb.events import Update
+from ppb.features.collisions import CheckCollisions, ColliderMixin, CollisionSystem, find_collisions
+from ppb.testutils import Quitter
+
+
+class Box(ColliderMixin, RectangleSprite):
+    pass
+
+
+class Ball(ColliderMixin, Sprite):
+    collision_shape = "circle"
+
+
+def test_find_collisions_shapes():
+    box = Box(position=Vector(0, 0), width=2, height=2)
+    touching = Box(position=Vector(2, 0))
+    overlapping = Box(position=Vector(1.4, 0.5))
+    far = Box(position=Vector(10, 10))
+    corner_ball = Ball(position=Vector(1.6, 1.6))
+    ball = Ball(position=Vector(10.5, 10.5), size=2)
+
+    pairs = find_collisions([box, touching, overlapping, far, corner_ball, ball])
+    assert {frozenset(p) for p in pairs} == {
+        frozenset((box, overlapping)),
+        frozenset((touching, overlapping)),
+        frozenset((far, ball)),
+    }
+
+
+def test_layers_and_masks():
+    player = Box(collision_layer=0b01, collision_mask=0b10)
+    other_player = Box(collision_layer=0b01, collision_mask=0b10)
+    enemy = Box(collision_layer=0b10)
+    ghost = Box(collision_mask=0)
+
+    pairs = find_collisions([player, other_player, enemy, ghost])
+    assert {frozenset(p) for p in pairs} == {
+        frozenset((player, enemy)),
+        frozenset((other_player, enemy)),
+    }
+
+
+def test_bad_shape():
+    with pytest.raises(ValueError):
+        find_collisions([Box(collision_shape="blob"), Box()])
+
+
+def test_collision_events():
+    hits = []
+
+    class Recorder(Box):
+        def on_collision(self, event, signal):
+            hits.append((self, event.other))
+
+    class Bystander(Sprite):
+        def on_collision(self, event, signal):
+            hits.append((self, event.other))
+
+    def setup(scene):
+        scene.add(Recorder(name="a"))
+        scene.add(Recorder(name="b", position=Vector(0.5, 0)))
+        scene.add(Recorder(name="c", position=Vector(5, 0)))
+        scene.add(Bystander(position=Vector(0.2, 0)))
+
+    with GameEngine(Scene, basic_systems=[CollisionSystem, Quitter], scene_kwargs={"set_up": setup}) as engine:
+        engine.signal(Update(time_delta=0.1))
+        engine.run()
+
+    assert sorted((a.name, b.name) for a, b in hits) == [("a", "b"), ("b", "a")]
+
+
+def test_collision_system_keeps_query():
+    scene = Scene()
+    system = CollisionSystem()
+    check = CheckCollisions()
+    check.scene = scene
+    scene.add(Box(name="a"))
+    system.on_check_collisions(check, lambda event, targets: None)
+    query = system._colliders[scene]
+    assert system.collisions == []
+
+    # Colliders added later are found by the same query
+    scene.add(Box(name="b", position=Vector(0.5, 0)))
+    system.on_check_collisions(check, lambda event, targets: None)
+    assert system._colliders[scene] is query
+    assert len(system.collisions) == 1
@@ -0,0 +1,50 @@
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+from ppb import GameEngine, Scene, Vector
+from ppb.events import Update
+from ppb.features.columnar import ColumnarIntegrator, ColumnarSprite, SpriteStore
+from ppb.testutils import Quitter
+
+
+def test_sprite_views():
+    store = SpriteStore(capacity=1)
+    first = store.create(position=Vector(1, 2), size=2)
+    second = store.create(position=(3, 4), width=1, height=3, layer=2)
+
+    assert store.count == 2
+    assert first.position == Vector(1, 2)
+    assert (first.width, first.height, first.size) == (2, 2, 2)
+    assert second.position == Vector(3, 4)
+    assert second.top == 5.5
+    assert second.layer == 2
+
+    second.left = 0
+    assert second.position == Vector(0.5, 4)
+    assert tuple(store.positions[1]) == (0.5, 4)
+
+    store.release(first)
+    assert store.count == 1
+    assert list(store.sprites()) == [second]
+    assert second.position == Vector(0.5, 4)
+    with pytest.raises(ValueError):
+        store.release(first)
+
+
+def test_integrator():
+    store = None
+
+    def setup(scene):
+        nonlocal store
+        store = scene.add(SpriteStore())
+        for i in range(3):
+            scene.add(store.create(velocity=Vector(i, 1), angular_velocity=90))
+
+    with GameEngine(Scene, basic_systems=[ColumnarIntegrator, Quitter], scene_kwargs={"set_up": setup}) as engine:
+        engine.signal(Update(time_delta=0.5))
+        engine.run()
+
+    sprites = list(engine.current_scene.get(kind=ColumnarSprite))
+    assert sorted(tuple(s.position) for s in sprites) == [(0, 0.5), (0.5, 0.5), (1, 0.5)]
+    assert all(s.rotation == 45 for s in sprites)
@@ -1,4 +1,6 @@
+import abc
 import dataclasses
+import typing
 from unittest import mock
 
 import pytest
@@ -9,7 +11,10 @@ from ppb.systemslib import System
 from ppb.systems import Updater
 from ppb.testutils import Failer
 from ppb.testutils import Quitter
+from ppb.errors import BadEventHandlerException
 from ppb.gomlib import GameObject
+from ppb.gomlib import refresh_handlers
+from ppb.utils import get_time
 
 CONTINUE = True
 STOP = False
@@ -383,3 +388,349 @@ def test_target_events():
         ge.run()
 
     assert call_count == 1
+
+
+@pytest.mark.parametrize("indexed_dispatch", [False, True])
+def test_broadcast_order(indexed_dispatch):
+    class Test: pass
+
+    calls = []
+
+    class Listener(GameObject):
+        def __init__(self, name, depth, **props):
+            super().__init__(**props)
+            self.name = name
+            self.depth = depth
+
+        def on_test(self, event, signal):
+            calls.append(self)
+
+    class Quiet(GameObject):
+        pass
+
+    def setup(scene):
+        top = scene.add(Listener("top", 1))
+        middle = top.add(Quiet())
+        middle.add(Listener("bottom", 3))
+        scene.add(Quiet())
+        for _ in range(3):
+            scene.add(Listener("sibling", 1))
+
+    engine = GameEngine(Scene, basic_systems=[], scene_kwargs={"set_up": setup},
+                        indexed_dispatch=indexed_dispatch)
+    engine.start()
+    # Added after the scene is in the tree.
+    late = engine.current_scene.add(Quiet()).add(Listener("late", 2))
+    engine.signal(Test())
+    while engine.events:
+        engine.publish()
+
+    assert [o.depth for o in calls] == [1, 1, 1, 1, 2, 3]
+    assert late in calls
+
+
+def test_idle_to_systems_only():
+    idled = []
+
+    class TestSystem(System):
+        def on_idle(self, event: events.Idle, signal):
+            idled.append(self)
+            signal(events.Quit())
+
+    class Agent(GameObject):
+        def on_idle(self, event: events.Idle, signal):
+            idled.append(self)
+
+    subscribed = Agent()
+    ignored = Agent()
+
+    def setup(scene):
+        scene.add(subscribed)
+        scene.add(ignored)
+
+    with GameEngine(Scene, basic_systems=[TestSystem], scene_kwargs={"set_up": setup},
+                    broadcast_idle=False) as ge:
+        ge.subscribe_idle(subscribed)
+        ge.run()
+
+    assert len(idled) == 2
+    assert subscribed in idled
+    assert ignored not in idled
+
+
+def test_frame_pacing():
+    class Ticker(System):
+        idles = 0
+        ticks = 0
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.deadline = get_time() + 0.01
+
+        def next_deadline(self):
+            return self.deadline
+
+        def on_idle(self, event: events.Idle, signal):
+            self.idles += 1
+            if get_time() >= self.deadline:
+                self.ticks += 1
+                self.deadline += 0.01
+            if self.ticks >= 5:
+                signal(events.Quit())
+
+    with GameEngine(Scene, basic_systems=[Ticker], frame_pacing=True) as ge:
+        ge.run()
+        ticker, = ge.children._systems
+
+    assert ticker.idles <= 6
+    assert len(ge.pacer.jitter) >= 4
+
+
+def test_bad_event_handler():
+    class Test: pass
+
+    class BadHandler(GameObject):
+        def on_test(self, event):
+            pass
+
+    class RaisesTypeError(GameObject):
+        def on_test(self, event, signal):
+            raise TypeError("Not a signature problem")
+
+    for obj, error in [(BadHandler(), BadEventHandlerException), (RaisesTypeError(), TypeError)]:
+        engine = GameEngine(Scene, basic_systems=[])
+        engine.start()
+        engine.current_scene.add(obj)
+        engine.signal(Test(), targets=[obj])
+        with pytest.raises(error) as info:
+            while engine.events:
+                engine.publish()
+        assert (type(info.value) is BadEventHandlerException) == (error is BadEventHandlerException)
+
+
+def test_handler_lookup_variants():
+    class Test: pass
+
+    calls = []
+
+    def patched(self, event, signal):
+        calls.append("patched")
+
+    class Patched(GameObject):
+        pass
+
+    class PatchedChild(Patched):
+        pass
+
+    class Static(GameObject):
+        @staticmethod
+        def on_test(event, signal):
+            calls.append("static")
+
+    instance = GameObject()
+    instance.on_test = lambda event, signal: calls.append("instance")
+
+    engine = GameEngine(Scene, basic_systems=[])
+    engine.start()
+    targets = [PatchedChild(), Static(), instance]
+    Patched.on_test = patched
+    engine.signal(Test(), targets=targets)
+    while engine.events:
+        engine.publish()
+
+    assert sorted(calls) == ["instance", "patched", "static"]
+
+    del Patched.on_test
+    calls.clear()
+    engine.signal(Test(), targets=targets)
+    while engine.events:
+        engine.publish()
+
+    assert sorted(calls) == ["instance", "static"]
+
+
+def test_handlers_patched_on_class():
+    class Test: pass
+
+    calls = []
+
+    class Obj(GameObject):
+        def on_test(self, event, signal):
+            calls.append("original")
+
+    class Plain(GameObject):
+        pass
+
+    def deliver(engine, targets):
+        engine.signal(Test(), targets=targets)
+        while engine.events:
+            engine.publish()
+
+    engine = GameEngine(Scene, basic_systems=[])
+    engine.start()
+    targets = [Obj(), Plain()]
+    deliver(engine, targets)
+    with mock.patch.object(Obj, "on_test", lambda self, event, signal: calls.append("patched")):
+        deliver(engine, targets)
+    Plain.on_test = lambda self, event, signal: calls.append("plain")
+    deliver(engine, targets)
+
+    # Targets aren't delivered to in any particular order
+    assert calls[:2] == ["original", "patched"]
+    assert sorted(calls[2:]) == ["original", "plain"]
+
+
+def test_indexed_dispatch_refresh_handlers():
+    class Test: pass
+
+    calls = []
+
+    class Plain(GameObject):
+        pass
+
+    engine = GameEngine(Scene, basic_systems=[], indexed_dispatch=True)
+    engine.start()
+    targets = [Plain()]
+    Plain.on_test = lambda self, event, signal: calls.append("plain")
+    refresh_handlers()
+    engine.signal(Test(), targets=targets)
+    while engine.events:
+        engine.publish()
+
+    assert calls == ["plain"]
+
+
+def test_handlers_with_metaclass_mixins():
+    class Test: pass
+
+    calls = []
+
+    class Handler(abc.ABC):
+        @abc.abstractmethod
+        def on_test(self, event, signal):
+            pass
+
+    class Named(typing.Protocol):
+        name: str
+
+    class Abstract(GameObject, Handler):
+        def on_test(self, event, signal):
+            calls.append("abc")
+
+    class Protocol(GameObject, Named):
+        name = "protocol"
+
+        def on_test(self, event, signal):
+            calls.append(self.name)
+
+    engine = GameEngine(Scene, basic_systems=[])
+    engine.start()
+    targets = [Abstract(), Protocol()]
+    engine.signal(Test(), targets=targets)
+    while engine.events:
+        engine.publish()
+
+    assert sorted(calls) == ["abc", "protocol"]
+
+
+@pytest.mark.parametrize("defer_mutations", [False, True])
+def test_defer_mutations(defer_mutations):
+    class Test: pass
+
+    class Spawner(GameObject):
+        def on_test(self, event, signal):
+            event.scene.add(Spawned())
+            event.scene.remove(self)
+
+    class Spawned(GameObject):
+        def on_test(self, event, signal):
+            event.seen.append(self)
+
+    engine = GameEngine(Scene, basic_systems=[], defer_mutations=defer_mutations)
+    engine.start()
+    scene = engine.current_scene
+    scene.add_many(Spawner() for _ in range(3))
+    while engine.events:
+        engine.publish()
+
+    event = Test()
+    event.seen = []
+    engine.signal(event)
+    engine.publish()
+
+    assert len(list(scene.get(kind=Spawned))) == 3
+    assert not list(scene.get(kind=Spawner))
+    if defer_mutations:
+        assert not event.seen
+        assert engine.deferred_operations == 6
+    else:
+        assert engine.deferred_operations == 0
+
+
+@pytest.mark.parametrize("defer_mutations", [False, True])
+@pytest.mark.parametrize("event_type", [events.StartScene, events.ReplaceScene])
+def test_defer_mutations_new_scene(defer_mutations, event_type):
+    class Mover(GameObject):
+        pass
+
+    class Second(Scene):
+        def __init__(self, **props):
+            super().__init__(**props)
+            self.add(Mover())
+            self.found = len(list(self.get(kind=Mover)))
+
+    class First(Scene):
+        def on_update(self, event, signal):
+            signal(event_type(Second))
+
+    engine = GameEngine(First, basic_systems=[], defer_mutations=defer_mutations)
+    engine.start()
+    engine.signal(events.Update(0.1))
+    while engine.events:
+        engine.publish()
+
+    scene = engine.current_scene
+    assert isinstance(scene, Second)
+    assert scene.found == 1
+
+
+@pytest.mark.parametrize("indexed_dispatch", [False, True])
+def test_cached_walk(indexed_dispatch):
+    class Test: pass
+
+    class Listener(GameObject):
+        def on_test(self, event, signal):
+            event.seen.append(self)
+
+    class Spawner(Listener):
+        def on_test(self, event, signal):
+            super().on_test(event, signal)
+            if not self.children:
+                self.add(Listener())
+
+    engine = GameEngine(Scene, basic_systems=[], cached_walk=True, indexed_dispatch=indexed_dispatch)
+    engine.start()
+    scene = engine.current_scene
+    first = scene.add(Listener())
+    while engine.events:
+        engine.publish()
+
+    def broadcast():
+        event = Test()
+        event.seen = []
+        engine.signal(event)
+        engine.publish()
+        return event.seen
+
+    assert broadcast() == [first]
+    order = engine._walk_cache["on_test" if indexed_dispatch else None]
+    assert broadcast() == [first]
+    assert engine._walk_cache["on_test" if indexed_dispatch else None] is order
+
+    spawner = scene.add(Spawner())
+    assert set(broadcast()) == {first, spawner}
+    spawned, = spawner.children
+    assert set(broadcast()) == {first, spawner, spawned}
+
+    scene.remove(first)
+    assert set(broadcast()) == {spawner, spawned}
@@ -1,8 +1,12 @@
+import copy
+import threading
+
 import pytest
 
 from ppb.errors import BadChildException
+from ppb.errors import NotMyChildError
 from ppb.gomlib import GameObject, Children
-
+from ppb.gomlib import MutationBuffer
 
 
 class TestEnemy:
@@ -123,3 +127,254 @@ def test_collection_methods(player, enemies):
     # Test __iter__
     for game_object in container:
         assert game_object is player or game_object is enemies[0]
+
+
+def test_subscribers_index():
+    class Listener(GameObject):
+        def on_update(self, event, signal):
+            pass
+
+    container = Children()
+    listener = container.add(Listener())
+    quiet = container.add(GameObject())
+
+    assert set(container.subscribers("on_update")) == {listener}
+    assert set(container.subscribers("on_mouse_motion")) == set()
+
+    container.remove(listener)
+    assert set(container.subscribers("on_update")) == set()
+    assert quiet in container
+
+
+def test_branches_follow_grandchildren():
+    container = Children()
+    parent = container.add(GameObject())
+    assert set(container.branches()) == set()
+
+    grandchild = parent.add(GameObject())
+    assert set(container.branches()) == {parent}
+
+    parent.remove(grandchild)
+    assert set(container.branches()) == set()
+
+    parent.add(grandchild)
+    container.remove(parent)
+    assert set(container.branches()) == set()
+    assert parent.children._parent is None
+
+
+def test_remove_cleans_up_indexes():
+    container = Children()
+    player = TestPlayer()
+    enemy = TestEnemy()
+    container.add(player, tags=("player", "id-1"))
+    container.add(enemy, tags=(f"id-{n}" for n in range(2, 1000)))
+
+    container.remove(enemy)
+
+    assert set(container.tags()) == {"player", "id-1"}
+    assert TestEnemy not in set(container.kinds())
+    assert set(container.get(kind=TestEnemy)) == set()
+    assert set(container.get(tag="id-2")) == set()
+    # Lookups don't create empty entries
+    assert TestEnemy not in set(container.kinds())
+    assert "id-2" not in set(container.tags())
+
+    container.remove(player)
+
+    assert set(container.tags()) == set()
+    assert set(container.kinds()) == set()
+
+
+def test_get_both_kind_and_tag():
+    container = Children()
+    red_players = [container.add(TestPlayer(), tags=["red"]) for _ in range(3)]
+    container.add(TestPlayer(), tags=["blue"])
+    container.add(TestEnemy(), tags=["red"])
+
+    assert set(container.get(kind=TestPlayer, tag="red")) == set(red_players)
+    assert set(container.get(kind=TestSprite, tag="red")) == set()
+
+    # Safe to modify while iterating
+    for player in container.get(kind=TestPlayer):
+        container.remove(player)
+    assert set(container.get(kind=TestPlayer)) == set()
+
+
+def test_query():
+    container = GameObject()
+    player = container.add(TestPlayer(), tags=["alive"])
+    subclass_player = container.add(TestSubclassPlayer())
+    container.add(TestEnemy(), tags=["alive"])
+
+    living_players = container.query(kind=TestPlayer, tag="alive")
+    assert container.query(kind=TestPlayer, tag="alive") is living_players
+    assert set(living_players) == {player}
+
+    container.children.add_tags(subclass_player, ["alive"])
+    assert set(living_players) == {player, subclass_player}
+
+    container.children.remove_tags(player, ["alive", "not a tag"])
+    assert set(living_players) == {subclass_player}
+    assert set(container.get(tag="alive", kind=TestPlayer)) == {subclass_player}
+
+    late = container.add(TestPlayer(), tags=["alive"])
+    assert set(living_players) == {subclass_player, late}
+
+    container.remove(subclass_player)
+    assert set(living_players) == {late}
+    assert len(living_players) == 1
+    assert late in living_players
+
+
+def test_retag_not_my_child():
+    container = Children()
+    with pytest.raises(NotMyChildError):
+        container.add_tags(TestPlayer(), ["red"])
+    with pytest.raises(TypeError):
+        container.add_tags(container.add(TestPlayer()), "red")
+
+
+@pytest.mark.parametrize("container", [Children(), GameObject()])
+def test_add_many_remove_many(container):
+    class Listener(GameObject):
+        def on_update(self, event, signal):
+            pass
+
+    children = container.children if isinstance(container, GameObject) else container
+    living = children.query(kind=TestEnemy, tag="alive")
+    player = container.add(TestPlayer(), tags=["alive"])
+    enemies = container.add_many((TestEnemy() for _ in range(5)), tags=["alive", "wave-1"])
+    listeners = container.add_many([Listener(), Listener()])
+
+    assert len(children) == 8
+    assert set(container.get(kind=TestEnemy)) == set(enemies)
+    assert set(container.get(tag="wave-1")) == set(enemies)
+    assert set(container.get(tag="alive")) == set(enemies) | {player}
+    assert set(living) == set(enemies)
+    assert set(children.subscribers("on_update")) == set(listeners)
+
+    removed = container.remove_many(enemies[:3] + listeners)
+    assert len(removed) == 5
+    assert set(container.get(kind=TestEnemy)) == set(enemies[3:])
+    assert set(container.get(tag="wave-1")) == set(enemies[3:])
+    assert set(living) == set(enemies[3:])
+    assert set(children.subscribers("on_update")) == set()
+    assert Listener not in set(children.kinds())
+
+    with pytest.raises(NotMyChildError):
+        container.remove_many([player, enemies[0]])
+    assert player in container
+
+    with pytest.raises(BadChildException):
+        container.add_many([TestEnemy, TestEnemy()])
+
+
+@pytest.mark.parametrize("container", containers())
+def test_mutation_buffer(container):
+    player = container.add(TestPlayer(), tags=["alive"])
+    enemy = TestEnemy()
+    buffer = MutationBuffer()
+
+    with buffer:
+        assert container.add(enemy, tags=["alive"]) is enemy
+        container.remove(player)
+        with buffer:
+            container.children.add_tags(enemy, ["boss"])
+        assert enemy not in container
+        assert player in container
+        assert set(container.get(tag="alive")) == {player}
+        with pytest.raises(BadChildException):
+            container.add(TestEnemy)
+
+    assert buffer.count == 3
+    assert not len(buffer)
+    assert enemy in container
+    assert player not in container
+    assert set(container.get(tag="boss")) == {enemy}
+
+
+@pytest.mark.parametrize("container", containers())
+def test_mutation_buffer_other_threads(container):
+    enemy = TestEnemy()
+
+    def add():
+        container.add(enemy)
+
+    with MutationBuffer():
+        # Only changes made on the thread using the buffer are deferred
+        thread = threading.Thread(target=add)
+        thread.start()
+        thread.join()
+        assert enemy in container
+
+
+@pytest.mark.parametrize("container", containers())
+def test_mutation_buffer_failed_flush(container):
+    stranger = TestEnemy()
+    enemy = TestEnemy()
+    buffer = MutationBuffer()
+
+    with pytest.raises(NotMyChildError):
+        with buffer:
+            container.remove(stranger)
+            container.add(enemy)
+    assert not len(buffer)
+    assert enemy not in container
+
+    # Nothing is left over for the next use
+    with buffer:
+        pass
+    assert enemy not in container
+
+
+def test_unused_indexes_not_made():
+    # Every sprite has a container, so those never used should cost nothing
+    children = GameObject().children
+    assert children._kind_plans is None
+    assert children._queries is None
+    assert not {'_handlers', '_child_handlers', '_branches', '_observers'} & vars(children).keys()
+
+    children.query(kind=TestEnemy)
+    assert children._queries is not None
+
+
+def test_lazy_kinds():
+    class LazyContainer(GameObject):
+        lazy_kinds = True
+
+    container = LazyContainer()
+    player = container.add(TestSubclassPlayer())
+    enemies = container.add_many([TestEnemy(), TestEnemy()])
+
+    assert not container.children._kinds
+    assert set(container.children.kinds()) >= {TestSubclassPlayer, TestPlayer, TestEnemy, object}
+
+    assert set(container.get(kind=TestPlayer)) == {player}
+    assert set(container.children._kinds) == {TestPlayer}
+
+    enemy_query = container.query(kind=TestEnemy)
+    later = container.add(TestSubclassPlayer())
+    container.remove(enemies[0])
+    assert set(container.get(kind=TestPlayer)) == {player, later}
+    assert set(container.get(kind=TestEnemy)) == {enemies[1]}
+    assert set(enemy_query) == {enemies[1]}
+
+    container.remove_many([player, later])
+    assert not list(container.get(kind=TestPlayer))
+    assert TestPlayer not in set(container.children.kinds())
+
+
+def test_deepcopy_indexed_container():
+    class Listener(GameObject):
+        def on_update(self, event, signal):
+            pass
+
+    parent = GameObject()
+    child = parent.add(Listener())
+    child.add(GameObject())
+
+    clone = copy.deepcopy(parent)
+    clone_child, = clone.children
+    assert set(clone.children.subscribers("on_update")) == {clone_child}
+    assert set(clone.children.branches()) == {clone_child}
@@ -0,0 +1,75 @@
+import threading
+
+import pytest
+
+import ppb
+from ppb import Scene
+from ppb import events
+from ppb.headless import HeadlessEngine
+from ppb.headless import VirtualClock
+from ppb.testutils import Failer
+from ppb.utils import get_time
+
+
+def test_virtual_clock():
+    clock = VirtualClock(start=5)
+    assert clock() == 5
+    clock.advance(0.5)
+    assert clock() == 5.5
+
+
+def test_one_update_per_loop():
+    updates = []
+
+    class TestScene(Scene):
+        def on_update(self, event: events.Update, signal):
+            updates.append(event.time_delta)
+
+    real_start = get_time()
+    with HeadlessEngine(TestScene, time_step=0.02, max_time=600) as engine:
+        engine.run()
+        assert ppb.get_time() == engine.elapsed
+
+    assert get_time() - real_start < 600
+    # The Updater starts counting at the first loop.
+    assert len(updates) == engine.steps - 1
+    assert set(updates) == {0.02}
+    assert engine.elapsed >= 600
+
+
+def test_clock_restored():
+    with HeadlessEngine(Scene, max_time=1) as engine:
+        engine.run()
+        assert get_time() == engine.clock.now
+    assert get_time() != engine.clock.now
+
+
+def test_frame_pacing_ignored():
+    finished = threading.Event()
+
+    def run():
+        with HeadlessEngine(Scene, max_time=1, frame_pacing=True) as engine:
+            engine.run()
+        finished.set()
+
+    # Run on another thread, so a hang fails the test instead of blocking it
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    assert finished.wait(10)
+
+
+def test_failer_uses_game_time():
+    class Counter(Scene):
+        count = 0
+
+        def on_update(self, event, signal):
+            self.count += 1
+
+    engine = HeadlessEngine(
+        Counter, systems=[Failer], time_step=0.5,
+        fail=lambda engine: engine.current_scene.count >= 3,
+        message="Reached three updates.", run_time=60,
+    )
+    with pytest.raises(AssertionError, match="Reached three updates."):
+        engine.run()
+    assert engine.elapsed < 60
@@ -1,7 +1,9 @@
+import copy
 from itertools import islice
 
 import ppb.camera as camera
 import ppb.scenes as scenes
+import ppb.sprites as sprites
 
 
 class LayeredSprite:
@@ -57,3 +59,64 @@ def test_layering_without_layer_attribute():
         scene.add(LayeredSprite(x))
 
     assert next(filter(lambda s: not isinstance(s, camera.Camera), scene.sprite_layers())) is test_sprite
+
+
+def test_render_order_tracks_sprites():
+
+    class Background(sprites.BaseSprite):
+        layer = -1
+
+    scene = scenes.Scene()
+    first = scene.add(sprites.BaseSprite())
+    background = scene.add(Background())
+    plain = scene.add(LayeredSprite(0.5))
+    second = scene.add(sprites.BaseSprite(layer=0))
+    top = scene.add(sprites.BaseSprite(layer=3))
+
+    def order():
+        return [s for s in scene.sprite_layers() if not isinstance(s, camera.Camera)]
+
+    assert order() == [background, first, second, plain, top]
+
+    second.layer = 5
+    plain.layer = -2
+    assert order() == [plain, background, first, top, second]
+
+    del second.layer
+    scene.remove(first)
+    scene.remove(plain)
+    assert order() == [background, second, top]
+
+    first.layer = 10
+    assert order() == [background, second, top]
+
+
+def test_render_order_copied_sprites():
+    scene = scenes.Scene()
+    sprite = scene.add(sprites.BaseSprite(layer=1))
+    other = scene.add(sprites.BaseSprite(layer=1))
+
+    def order():
+        return [s for s in scene.sprite_layers() if not isinstance(s, camera.Camera)]
+
+    # Copies aren't in the scene, so changing their layer doesn't touch it
+    clone = copy.copy(sprite)
+    clone.layer = 2
+    deep = copy.deepcopy(sprite)
+    deep.layer = -1
+    assert order() == [sprite, other]
+
+    sprite.layer = 2
+    assert order() == [other, sprite]
+    scene.add(clone)
+    assert order() == [other, sprite, clone]
+
+
+def test_render_order_same_layer():
+    scene = scenes.Scene()
+    first = scene.add(sprites.BaseSprite())
+    second = scene.add(sprites.BaseSprite())
+
+    # Setting the layer it already has doesn't move a sprite
+    first.layer = 0
+    assert [s for s in scene.sprite_layers() if not isinstance(s, camera.Camera)] == [first, second]
@@ -0,0 +1,49 @@
+import pytest
+from sdl2.sdlimage import IMG_Load
+from sdl2 import SDL_FreeSurface
+
+import ppb
+from ppb import Vector
+from ppb.assetlib import AssetLoadingSystem
+from ppb.headless import HeadlessEngine
+from ppb.systems import OffscreenRenderer
+from ppb.systems import Updater
+from ppb.systems.capture import Frame
+
+
+def test_frame_pixel():
+    frame = Frame(2, 1, bytes([1, 2, 3, 4, 5, 6, 7, 8]))
+    assert frame.pixel(1, 0) == (5, 6, 7, 8)
+    with pytest.raises(IndexError):
+        frame.pixel(2, 0)
+
+
+def test_offscreen_renderer(monkeypatch, tmp_path):
+    # Doesn't need a display
+    monkeypatch.delenv("SDL_VIDEODRIVER", raising=False)
+    monkeypatch.delenv("DISPLAY", raising=False)
+
+    def setup(scene):
+        scene.background_color = (0, 0, 0)
+        scene.add(ppb.Sprite(position=Vector(0, 0), image=ppb.Square(255, 0, 0), size=4))
+
+    engine = HeadlessEngine(
+        ppb.Scene, basic_systems=(Updater, AssetLoadingSystem, OffscreenRenderer),
+        scene_kwargs={"set_up": setup}, max_time=0.5,
+        resolution=(200, 100), target_camera_width=25,
+    )
+    with engine:
+        engine.run()
+        renderer, = engine.get(kind=OffscreenRenderer)
+        frame = renderer.capture()
+        written = renderer.save_frame(tmp_path / "frame.png")
+        written.result()
+
+    assert (frame.width, frame.height) == (200, 100)
+    assert frame.pixel(100, 50) == (255, 0, 0, 255)
+    assert frame.pixel(0, 0) == (0, 0, 0, 255)
+
+    surface = IMG_Load(str(tmp_path / "frame.png").encode())
+    assert surface
+    assert (surface.contents.w, surface.contents.h) == (200, 100)
+    SDL_FreeSurface(surface)
@@ -0,0 +1,152 @@
+import threading
+
+import pytest
+
+import ppb
+from ppb import GameEngine, Scene, Vector
+from ppb.assetlib import AssetLoadingSystem
+from ppb.events import Render
+from ppb.headless import HeadlessEngine
+from ppb.systems import OffscreenRenderer
+from ppb.systems import Renderer
+from ppb.systems import Updater
+from ppb.systems.capture import FrameCapture
+from ppb.systems.render_thread import RenderThread
+
+
+def test_render_thread_drops_oldest():
+    drawing = threading.Event()
+    release = threading.Event()
+    drawn = []
+    events = []
+
+    def draw(draw_list):
+        drawing.set()
+        release.wait(5)
+        drawn.append((draw_list, threading.get_ident()))
+
+    thread = RenderThread(lambda: events.append("open"), draw, lambda: events.append("close"), depth=2)
+    thread.start()
+    thread.submit(0)
+    assert drawing.wait(5)
+    for draw_list in range(1, 5):
+        thread.submit(draw_list)
+    release.set()
+    thread.stop()
+
+    assert [draw_list for draw_list, _ in drawn] == [0, 3, 4]
+    assert thread.dropped == 2
+    assert thread.drawn == 3
+    assert {ident for _, ident in drawn} != {threading.get_ident()}
+    assert events == ["open", "close"]
+
+
+def test_render_thread_errors():
+    def draw(draw_list):
+        raise ValueError(draw_list)
+
+    thread = RenderThread(lambda: None, draw, lambda: None)
+    thread.start()
+    thread.submit(1)
+    with pytest.raises(ValueError):
+        thread.wait()
+    thread.stop()
+
+    def fail():
+        raise RuntimeError("no renderer")
+
+    with pytest.raises(RuntimeError):
+        RenderThread(fail, draw, lambda: None).start()
+
+
+def setup(scene):
+    scene.background_color = (0, 0, 0)
+    scene.add(ppb.Sprite(position=Vector(-3, 0), image=ppb.Square(255, 0, 0), size=4, rotation=30))
+    scene.add(ppb.Sprite(position=Vector(3, 0), image=ppb.Circle(0, 0, 255), size=4, tint=(255, 0, 255)))
+    scene.add(ppb.Sprite(position=Vector(50, 0), image=ppb.Square(0, 255, 0)))
+
+
+@pytest.mark.parametrize("options", [{}, {"batch_geometry": True, "atlas": True}])
+def test_threaded_renderer_matches(options):
+    frames = []
+    for render_thread in (False, True):
+        capture = FrameCapture(FrameList(frames), every=1000)
+        engine = HeadlessEngine(
+            Scene, basic_systems=(Updater, AssetLoadingSystem, OffscreenRenderer),
+            scene_kwargs={"set_up": setup}, max_time=0.1,
+            resolution=(100, 50), frame_capture=capture,
+            render_thread=render_thread, **options,
+        )
+        with engine:
+            engine.run()
+            renderer, = engine.get(kind=OffscreenRenderer)
+            assert (renderer.thread is not None) == render_thread
+        assert renderer.stats.drawn == 2
+        assert renderer.stats.culled == 1
+
+    sync, threaded = frames
+    assert sync == threaded
+
+
+class FrameList:
+    def __init__(self, frames):
+        self.frames = frames
+
+    def write(self, number, frame):
+        self.frames.append(bytes(frame.pixels))
+
+    def close(self):
+        pass
+
+
+def test_threaded_window_renderer(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    engine = GameEngine(
+        Scene, basic_systems=[Renderer, AssetLoadingSystem], scene_kwargs={"set_up": setup},
+        resolution=(100, 50), render_thread=True,
+    )
+    with engine:
+        engine.start()
+        engine.signal(Render())
+        while engine.events:
+            engine.publish()
+        renderer, = engine.get(kind=Renderer)
+        renderer.thread.wait()
+        assert renderer.thread.drawn == 1
+    assert renderer.stats.drawn == 2
+
+
+def test_threaded_textures_destroyed_on_render_thread(monkeypatch):
+    import ppb.systems.renderer as renderer_module
+    destroyed = []
+    destroy = renderer_module.SDL_DestroyTexture
+
+    def record(texture):
+        destroyed.append(threading.current_thread().name)
+        destroy(texture)
+
+    monkeypatch.setattr(renderer_module, "SDL_DestroyTexture", record)
+
+    def render(engine):
+        engine.signal(Render())
+        while engine.events:
+            engine.publish()
+
+    engine = GameEngine(
+        Scene, basic_systems=[OffscreenRenderer, AssetLoadingSystem], scene_kwargs={"set_up": setup},
+        resolution=(100, 50), render_thread=True,
+    )
+    with engine:
+        engine.start()
+        render(engine)
+        renderer, = engine.get(kind=OffscreenRenderer)
+        renderer.thread.wait()
+        # Like a surface being freed by the engine: the textures are dropped
+        # here, but destroyed by the render thread before it next draws.
+        renderer._texture_cache.clear()
+        assert destroyed == []
+        render(engine)
+        renderer.thread.wait()
+        assert destroyed == ["ppb-render"] * 2
+    assert set(destroyed) == {"ppb-render"}
+    assert len(destroyed) == 4
@@ -0,0 +1,78 @@
+import pytest
+
+from ppb import Scene, Sprite, RectangleSprite, Vector
+from ppb.features.spatial import SpatialHash, SpatialMixin, SpatialScene
+
+
+class Mover(SpatialMixin, Sprite):
+    pass
+
+
+class WideMover(SpatialMixin, RectangleSprite):
+    width = 4
+
+
+def test_queries():
+    scene = Scene()
+    index = SpatialHash(cell_size=2).attach(scene)
+    origin = scene.add(Sprite())
+    far = scene.add(Sprite(position=Vector(10, 10)))
+    wide = scene.add(WideMover(position=Vector(5, 0)))
+
+    assert scene.spatial_index is index
+    assert len(index) == 3
+    assert index.query_rect(-1, -1, 1, 1) == {origin}
+    assert index.query_rect(-100, -100, 100, 100) == {origin, far, wide}
+    assert index.query_rect(2.5, 0, 3, 0) == {wide}
+    assert index.query_point(Vector(0.4, -0.4)) == {origin}
+    assert index.query_point((3.1, 0)) == {wide}
+    assert index.query_point((1, 1)) == set()
+    assert index.query_radius(Vector(2, 0), 1.5) == {origin, wide}
+    assert index.query_radius(Vector(2, 0), 1) == {wide}
+    assert index.query_radius(Vector(10, 8), 1) == set()
+
+    scene.remove(far)
+    assert far not in index
+    assert index.query_rect(9, 9, 11, 11) == set()
+
+    index.detach()
+    assert scene.spatial_index is None
+    assert not len(index)
+
+
+def test_spatial_mixin_updates():
+    scene = Scene()
+    index = SpatialHash(cell_size=1).attach(scene)
+    mover = scene.add(Mover())
+
+    mover.position = Vector(20, 20)
+    assert index.query_point((20, 20)) == {mover}
+    assert index.query_point((0, 0)) == set()
+
+    mover.left = 0
+    assert index.query_point((0.9, 20)) == {mover}
+
+    mover.size = 10
+    assert index.query_point((5.4, 20)) == {mover}
+
+    scene.remove(mover)
+    mover.position = Vector(0, 0)
+    assert mover not in index
+
+
+def test_spatial_scene():
+    class Level(SpatialScene, Scene):
+        cell_size = 3
+
+    def set_up(scene):
+        scene.add(Sprite(position=Vector(7, 7)))
+
+    scene = Level(set_up=set_up)
+    assert scene.spatial_index.cell_size == 3
+    sprite, = scene.spatial_index.query_point((7, 7))
+    assert sprite.position == Vector(7, 7)
+
+
+def test_bad_cell_size():
+    with pytest.raises(ValueError):
+        SpatialHash(cell_size=0)
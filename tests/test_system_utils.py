@@ -1,6 +1,10 @@
 import gc
 
+import pytest
+from sdl2 import SDL_SetError
+
 from ppb.systems._utils import ObjectSideData
+from ppb.systems.sdl_utils import SdlError, fast_sdl_call, is_negative
 
 
 def test_osd_basic():
@@ -19,3 +23,17 @@ def test_osd_basic():
     gc.collect()
 
     assert len(osd) == 0
+
+
+def test_fast_sdl_call():
+    def succeeds():
+        return 0
+
+    def fails():
+        SDL_SetError(b"it broke")
+        return -1
+
+    assert fast_sdl_call(succeeds, _check_error=is_negative) == 0
+    assert fast_sdl_call(fails) == -1
+    with pytest.raises(SdlError, match="Error calling fails: it broke"):
+        fast_sdl_call(fails, _check_error=is_negative)
@@ -1,4 +1,16 @@
+import pytest
+
+import ppb
+from ppb import GameEngine, Scene, Vector
+from ppb.assetlib import AssetLoadingSystem
+from ppb.events import Idle
+from ppb.events import Render
+from ppb.features.spatial import SpatialHash, SpatialMixin
 from ppb.systems import Renderer
+from ppb.systems.renderer import RenderStats
+from ppb.systems import Updater
+from ppb.systems.clocks import FramePacer
+from ppb.utils import get_time
 
 
 def test_calculate_new_size():
@@ -16,3 +28,115 @@ def test_calculate_new_size():
 
     test_resolution = renderer.target_resolution(test_width, test_height, 2, 2, pixel_ratio)
     assert test_resolution == (160, 320)
+
+
+def test_frame_pacer_waits_for_deadline():
+    pacer = FramePacer(spin_time=0.002)
+    deadline = get_time() + 0.02
+    pacer.wait(deadline)
+
+    assert get_time() >= deadline
+    assert len(pacer.jitter) == 1
+    assert 0 <= pacer.max_jitter < 0.01
+
+
+def test_frame_pacer_missed_deadline():
+    pacer = FramePacer()
+    pacer.wait(get_time() - 1)
+    pacer.wait(None)
+
+    assert len(pacer.jitter) == 0
+    assert pacer.mean_jitter == 0
+
+
+def test_updater_deadline():
+    updater = Updater(time_step=0.5)
+    assert updater.next_deadline() is None
+
+    updater.on_idle(Idle(0), lambda event: None)
+    assert updater.last_tick < updater.next_deadline() <= updater.last_tick + 0.5
+
+
+def test_renderer_in_view():
+    class Texture:
+        width = 64
+        height = 32
+
+    class Thing:
+        position = Vector(0, 0)
+        width = 1
+        height = 1
+        rotation = 0
+
+    bounds = -5, 5, -5, 5
+    thing = Thing()
+    assert Renderer._in_view(Texture, thing, bounds)
+
+    # The image is 2 units wide, so sticks out half a unit more than its size
+    thing.position = Vector(5.9, 0)
+    assert Renderer._in_view(Texture, thing, bounds)
+    thing.position = Vector(6.1, 0)
+    assert not Renderer._in_view(Texture, thing, bounds)
+    thing.position = Vector(0, 5.6)
+    assert not Renderer._in_view(Texture, thing, bounds)
+
+    # Rotated images may reach further
+    thing.rotation = 90
+    assert Renderer._in_view(Texture, thing, bounds)
+
+
+@pytest.mark.parametrize("spatial_index", [False, True])
+def test_renderer_culls(monkeypatch, spatial_index):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+
+    def setup(scene):
+        if spatial_index:
+            SpatialHash(cell_size=5).attach(scene)
+        image = ppb.Square(255, 0, 0)
+        for x in range(-100, 101, 10):
+            scene.add(ppb.Sprite(position=Vector(x, 0), image=image))
+
+    engine = GameEngine(
+        Scene, basic_systems=[Renderer, AssetLoadingSystem], scene_kwargs={"set_up": setup},
+        resolution=(100, 100), target_camera_width=25,
+    )
+    with engine:
+        engine.start()
+        engine.signal(Render())
+        while engine.events:
+            engine.publish()
+        renderer, = engine.get(kind=Renderer)
+
+    # Sprites at -10, 0, and 10 are in view of a camera 25 units wide. They
+    # share a texture, so its modulation is only set for the first.
+    assert renderer.stats == RenderStats(drawn=3, culled=18, state_changes=3, state_changes_skipped=6)
+
+
+class SpatialSprite(SpatialMixin, ppb.Sprite):
+    pass
+
+
+def test_renderer_culls_moved_sprites(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+
+    def setup(scene):
+        SpatialHash(cell_size=5).attach(scene)
+        image = ppb.Square(255, 0, 0)
+        for kind in (ppb.Sprite, SpatialSprite):
+            sprite = scene.add(kind(position=Vector(100, 0), image=image))
+            # Only the SpatialSprite updates the index
+            sprite.position = Vector(0, 0)
+
+    engine = GameEngine(
+        Scene, basic_systems=[Renderer, AssetLoadingSystem], scene_kwargs={"set_up": setup},
+        resolution=(100, 100), target_camera_width=25,
+    )
+    with engine:
+        engine.start()
+        engine.signal(Render())
+        while engine.events:
+            engine.publish()
+        renderer, = engine.get(kind=Renderer)
+
+    assert renderer.stats.drawn == 2
+    assert renderer.stats.culled == 0